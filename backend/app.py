@@ -4,7 +4,7 @@ Cognitive Career & Job Recommendation System with Explainable and Adaptive AI
 Main Flask Application Entry Point
 """
 
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
+from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash, Response, stream_with_context
 from flask_wtf.csrf import CSRFProtect, generate_csrf, CSRFError
 from werkzeug.utils import secure_filename
 import os
@@ -27,10 +27,18 @@ from datetime import datetime, timezone, timedelta
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from ai_engine.cognitive_engine import CognitiveRecommendationEngine
-from services.career_matcher import match_roles
+from services.career_matcher import (
+    match_roles, match_roles_batch, stream_match_roles, get_match_cache_stats, get_match_deadline_stats
+)
+from services.role_catalog import get_role_catalog
+from services.query_canonicalizer import query_key_stats
+from services.skill_planner import plan_next_skills
+from services.job_store import ensure_job_store_schema, get_job_store_stats
+from services.job_ingestion import start_job_ingestion, get_ingestion_stats
 from nlp_processor.resume_analyzer import ResumeAnalyzer
 from nlp_processor.resume_analyzer_simple import SimpleResumeAnalyzer
-from utils.data_processor import DataProcessor
+from utils.data_processor import get_data_processor
+from utils.job_sources import bind_job_source_app
 from config import Config
 from models import db, User, UserProfile, UserSkill
 from services.auth_service import AuthService
@@ -49,6 +57,7 @@ db.init_app(app)
 
 with app.app_context():
     db.create_all()
+    ensure_job_store_schema()
 
 # Resend verification email route (moved here so 'app' is defined)
 @app.route('/resend-verification', methods=['POST'])
@@ -592,12 +601,23 @@ except Exception as e:
     logger.warning(f"Could not initialize SimpleResumeAnalyzer: {e}")
 
 try:
-    data_processor = DataProcessor()
+    data_processor = get_data_processor()
     logger.info("DataProcessor initialized successfully")
 except Exception as e:
     logger.warning(f"Could not initialize DataProcessor: {e}")
     data_processor = None
 
+# Compile the local role catalog up front so the first fallback request stays cheap.
+if get_role_catalog() is not None:
+    logger.info("Role catalog index compiled successfully")
+
+# The SQL job source reads the jobs table from fetch threads outside any request.
+bind_job_source_app(app)
+
+# Periodically pull seed queries into the local job store (JOB_INGEST_ENABLED).
+if start_job_ingestion(app):
+    logger.info("Background job ingestion started")
+
 _init_feedback_db()
 
 
@@ -1364,9 +1384,92 @@ def analyze_profile():
         'market_skills': match_results.get('market_skills', {}),
         'live_jobs': match_results.get('live_jobs', []),
         'data_source': match_results.get('data_source', ''),
-        'data_message': match_results.get('data_message', '')
+        'data_message': match_results.get('data_message', ''),
+        'degraded': match_results.get('degraded', False),
+        'degraded_stages': match_results.get('degraded_stages', []),
+        'stage_timings': match_results.get('stage_timings', {})
     })
 
+@app.route('/analyze_profile/stream', methods=['POST'])
+@db_login_required
+def analyze_profile_stream():
+    """Stream recommendations as Server-Sent Events, catalog matches first"""
+    user_data = request.get_json(silent=True)
+    if not user_data:
+        return jsonify({'error': 'Missing profile data'}), 400
+
+    user_email = session.get('user_id')
+    user = User.query.filter_by(email=user_email).first()
+    if user:
+        try:
+            _save_user_profile_snapshot(user, user_data)
+        except Exception as e:
+            logger.warning(f"Could not persist user profile snapshot: {e}")
+
+    def generate():
+        try:
+            for event, payload in stream_match_roles(user_data):
+                yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+        except Exception as e:
+            logger.error(f"Streaming analysis failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'error': f'Error analyzing profile: {str(e)}'})}\n\n"
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/match/batch', methods=['POST'])
+@db_login_required
+def match_profiles_batch():
+    """Match many profiles at once, streaming one NDJSON line per profile"""
+    payload = request.get_json(silent=True)
+    profiles = payload.get('profiles') if isinstance(payload, dict) else payload
+    if not isinstance(profiles, list) or not profiles:
+        return jsonify({'error': 'Provide a non-empty "profiles" list'}), 400
+
+    max_profiles = int(os.environ.get('BATCH_MATCH_MAX_PROFILES', '500'))
+    if len(profiles) > max_profiles:
+        return jsonify({'error': f'At most {max_profiles} profiles per batch'}), 413
+
+    def generate():
+        try:
+            for result in match_roles_batch(profiles):
+                yield json.dumps(result) + '\n'
+        except Exception as e:
+            logger.error(f"Batch matching failed: {e}")
+            yield json.dumps({'error': f'Error matching profiles: {str(e)}'}) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/api/skills/next', methods=['POST'])
+@db_login_required
+def learn_next_skills():
+    """Suggest the skills that most improve the user's top role matches"""
+    try:
+        user_data = request.get_json()
+    except Exception:
+        return jsonify({'error': 'Invalid JSON data'}), 400
+
+    if not user_data:
+        return jsonify({'error': 'Missing profile data'}), 400
+
+    if not isinstance(user_data, dict):
+        return jsonify({'error': 'Profile data must be a JSON object'}), 400
+
+    try:
+        picks = min(10, max(1, int(user_data.get('picks', 3))))
+        top_k = min(50, max(1, int(user_data.get('top_k', 10))))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'picks and top_k must be integers'}), 400
+
+    try:
+        plan = plan_next_skills(user_data, picks=picks, top_k=top_k)
+    except Exception as e:
+        return jsonify({'error': f'Error planning next skills: {str(e)}'}), 500
+
+    return jsonify(plan)
+
 @app.route('/feedback', methods=['POST'])
 @db_login_required
 def collect_feedback():
@@ -1431,7 +1534,7 @@ def get_skills_data():
     """API endpoint for skills analysis"""
     if not data_processor:
         return jsonify({'error': 'Skills service temporarily unavailable'}), 503
-    skills_data = data_processor.get_skills_taxonomy()
+    skills_data = get_data_processor().get_skills_taxonomy()
     return jsonify(skills_data if skills_data else {})
 
 @app.route('/api/jobs', methods=['GET'])
@@ -1444,9 +1547,29 @@ def get_jobs_data():
         'location': request.args.get('location', '').strip(),
         'results': request.args.get('results', type=int)
     }
-    jobs_data = data_processor.get_job_market_data(filters)
+    jobs_data = get_data_processor().get_job_market_data(filters)
     return jsonify(jobs_data if jobs_data else {})
 
+@app.route('/api/market/metrics', methods=['GET'])
+def get_market_metrics():
+    """Operational counters for the live job market pipeline"""
+    if not data_processor:
+        return jsonify({'error': 'Jobs service temporarily unavailable'}), 503
+    processor = get_data_processor()
+    return jsonify({
+        'cache': processor.get_market_cache_stats(),
+        'disk_cache': processor.get_market_disk_cache_stats(),
+        'coalescing': processor.get_market_coalescing_stats(),
+        'dedup': processor.get_market_dedup_stats(),
+        'adzuna': processor.get_adzuna_health_stats(),
+        'job_sources': processor.get_job_source_stats(),
+        'match_results': get_match_cache_stats(),
+        'query_keys': query_key_stats.get_stats(),
+        'deadlines': get_match_deadline_stats(),
+        'job_store': get_job_store_stats(),
+        'ingestion': get_ingestion_stats()
+    })
+
 
 @app.route('/api/speech/profile-extract', methods=['POST'])
 @db_login_required
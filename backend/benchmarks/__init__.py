@@ -0,0 +1,7 @@
+"""
+Benchmarks for the career matching pipeline.
+
+Run from the backend directory:
+
+    python -m benchmarks.run_benchmarks --sizes 1000,10000 --output bench.json
+"""
@@ -0,0 +1,88 @@
+"""Deterministic synthetic job corpora, role catalogs and profile mixes."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+from services.skill_vocabulary import KNOWN_SKILLS
+
+SKILL_POOL = sorted(KNOWN_SKILLS)
+
+_SENIORITY = ["", "Junior ", "Senior ", "Lead ", "Principal "]
+_ROLES = [
+    "Python Developer", "Data Scientist", "Data Analyst", "Machine Learning Engineer",
+    "Backend Engineer", "Frontend Developer", "Full Stack Developer", "DevOps Engineer",
+    "Cloud Engineer", "QA Automation Engineer", "Data Engineer", "Java Developer",
+]
+_COMPANIES = [f"Company {i}" for i in range(400)]
+_CITIES = ["Bangalore", "Hyderabad", "Pune", "Chennai", "Mumbai", "Delhi", "Remote"]
+_FILLER = (
+    "team product customers build scale design deliver ownership platform growth "
+    "collaborate stakeholders fast-paced agile startup mission impact quality"
+).split()
+
+PROFILE_MIXES = {
+    "sparse": (1, 1),
+    "typical": (4, 6),
+    "skill_heavy": (15, 20),
+}
+
+
+def make_jobs(size: int, seed: int = 7, duplicate_rate: float = 0.05) -> List[Dict[str, Any]]:
+    """Adzuna-shaped parsed jobs; about ``duplicate_rate`` of them repost an earlier one."""
+    rng = random.Random(seed)
+    jobs: List[Dict[str, Any]] = []
+    for i in range(size):
+        if jobs and rng.random() < duplicate_rate:
+            original = rng.choice(jobs)
+            jobs.append({**original, "external_id": f"job-{i}", "redirect_url": f"https://jobs.example/{i}"})
+            continue
+
+        skills = rng.sample(SKILL_POOL, rng.randint(3, 12))
+        words = skills + rng.choices(_FILLER, k=rng.randint(20, 60))
+        rng.shuffle(words)
+        salary = rng.choice([None, rng.randrange(300_000, 4_000_000, 50_000)])
+        jobs.append(
+            {
+                "external_id": f"job-{i}",
+                "job_title": f"{rng.choice(_SENIORITY)}{rng.choice(_ROLES)}",
+                "company": rng.choice(_COMPANIES),
+                "location": rng.choice(_CITIES),
+                "salary_min": salary,
+                "salary_max": salary * 1.5 if salary else None,
+                "employment_type": rng.choice(["full_time", "contract", "part_time", None]),
+                "description": " ".join(words),
+                "created": "2024-01-01T00:00:00Z",
+                "redirect_url": f"https://jobs.example/{i}",
+            }
+        )
+    return jobs
+
+
+def make_catalog(size: int, seed: int = 11) -> List[Dict[str, Any]]:
+    """Role catalog entries shaped like data/career_roles.json."""
+    rng = random.Random(seed)
+    return [
+        {
+            "role": f"{rng.choice(_SENIORITY)}{rng.choice(_ROLES)} {i}",
+            "required_skills": rng.sample(SKILL_POOL, rng.randint(3, 10)),
+            "experience_level": rng.choice(["entry", "mid", "senior"]),
+            "related_skills_to_learn": rng.sample(SKILL_POOL, 3),
+        }
+        for i in range(size)
+    ]
+
+
+def make_profiles(mix: str, count: int, seed: int = 3) -> List[Dict[str, Any]]:
+    """``count`` user payloads for one of PROFILE_MIXES, as posted to /analyze_profile."""
+    low, high = PROFILE_MIXES[mix]
+    rng = random.Random(f"{mix}-{seed}")
+    return [
+        {
+            "skills": rng.sample(SKILL_POOL, rng.randint(low, high)),
+            "interests": rng.sample(["ai", "data analysis", "backend", "frontend"], rng.randint(0, 2)),
+            "experience": [{"years": rng.randint(0, 8)}],
+        }
+        for _ in range(count)
+    ]
@@ -0,0 +1,271 @@
+"""Latency, throughput and memory benchmarks for the matching pipeline.
+
+Each stage runs once per profile in a mix; latencies are wall-clock per call
+and peak memory comes from a separate tracemalloc pass so tracing overhead
+does not skew the timings. Results are written as JSON for run-to-run diffs.
+
+The match_roles stages fetch their market from the stub the way production
+queries Adzuna (a fixed number of postings per query), so corpus size does
+not change how much they score; ``market_postings`` on those stages records
+how many postings one cold call actually received.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.corpus import PROFILE_MIXES, make_catalog, make_jobs, make_profiles  # noqa: E402
+from benchmarks.stub_adzuna import StubAdzunaServer  # noqa: E402
+from services import career_matcher  # noqa: E402
+from services import skill_vocabulary  # noqa: E402
+from services.role_catalog import CATALOG_PATH, RoleCatalogIndex  # noqa: E402
+from services.skill_embeddings import embeddings_path  # noqa: E402
+from utils import data_processor  # noqa: E402
+from utils.dataset_registry import dataset_registry  # noqa: E402
+from utils.near_duplicates import dedupe_jobs  # noqa: E402
+
+
+def _percentiles(samples_ms: Sequence[float]) -> Dict[str, float]:
+    values = np.asarray(samples_ms, dtype=np.float64)
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50": round(float(p50), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "mean": round(float(values.mean()), 3),
+        "max": round(float(values.max()), 3),
+    }
+
+
+def _peak_memory_kb(fn: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return round(peak / 1024.0, 1)
+
+
+def measure(stage: str, corpus_size: int, mix: str, calls: List[Callable[[], Any]],
+            setup: Callable[[], Any] | None = None) -> Dict[str, Any]:
+    """Time every call, then replay the first under tracemalloc for peak memory.
+
+    ``setup`` runs untimed before each call (and before the replay).
+    """
+    latencies = []
+    for call in calls:
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        call()
+        latencies.append((time.perf_counter() - t0) * 1000.0)
+    elapsed = sum(latencies) / 1000.0
+    if setup is not None:
+        setup()
+
+    return {
+        "stage": stage,
+        "corpus_size": corpus_size,
+        "profile_mix": mix,
+        "iterations": len(calls),
+        "latency_ms": _percentiles(latencies),
+        "throughput_per_s": round(len(calls) / elapsed, 2) if elapsed > 0 else None,
+        "peak_memory_kb": _peak_memory_kb(calls[0]),
+    }
+
+
+@contextmanager
+def _stub_market(jobs: List[Dict[str, Any]], latency: float) -> Iterator[StubAdzunaServer]:
+    with StubAdzunaServer(jobs, latency=latency) as server:
+        overrides = {
+            "ADZUNA_APP_ID": "benchmark",
+            "ADZUNA_APP_KEY": "benchmark",
+            "ADZUNA_BASE_URL": server.base_url,
+            "JOB_STORE_MATCHING": "false",
+            "MARKET_DISK_CACHE_PATH": "",
+            "ADZUNA_RATE_LIMIT_PATH": "",
+        }
+        with mock.patch.dict(os.environ, overrides):
+            yield server
+
+
+def _fresh_vocabulary():
+    """Rebind every module's SKILLS to a newly seeded vocabulary.
+
+    Modules import SKILLS by name, so each reference is swapped; the role
+    catalog and embeddings are dropped so they re-intern into the new one.
+    """
+    current = skill_vocabulary.SKILLS
+    fresh = skill_vocabulary.build_vocabulary()
+    for module in list(sys.modules.values()):
+        if getattr(module, "SKILLS", None) is current:
+            module.SKILLS = fresh
+    dataset_registry.invalidate(str(CATALOG_PATH))
+    dataset_registry.invalidate(str(embeddings_path()))
+
+
+def _reset_match_caches():
+    """Drop everything match_roles memoizes, so the next call pays the full cold cost."""
+    data_processor._market_cache.clear()
+    career_matcher._result_cache.clear()
+    career_matcher._compiled_markets.clear()
+    career_matcher._job_classifications.clear()
+    career_matcher._title_matcher.cache_clear()
+    career_matcher._keywords_for_interest.cache_clear()
+    _fresh_vocabulary()
+
+
+def _scored_jobs(profile: Dict[str, Any], jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Jobs in the shape _aggregate_careers receives: skills split into matched/missing."""
+    scored = []
+    for job in jobs:
+        required = job["required_skills"]
+        matched = [s for s in required if s in profile["skills_set"]]
+        if matched:
+            scored.append({
+                **job,
+                "matched_skills": matched,
+                "missing_skills": [s for s in required if s not in profile["skills_set"]],
+            })
+    return scored
+
+
+def bench_corpus(size: int, iterations: int, seed: int, latency: float) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    _reset_match_caches()
+    jobs = make_jobs(size, seed=seed)
+
+    t0 = time.perf_counter()
+    prepared = [{**job, "required_skills": career_matcher.extract_job_skills(job)} for job in jobs]
+    extract_ms = (time.perf_counter() - t0) * 1000.0
+    results.append({
+        "stage": "extract_skills",
+        "corpus_size": size,
+        "profile_mix": None,
+        "iterations": 1,
+        "latency_ms": {"total": round(extract_ms, 3), "per_job": round(extract_ms / max(1, size), 4)},
+        "throughput_per_s": round(size / (extract_ms / 1000.0), 2) if extract_ms > 0 else None,
+        "peak_memory_kb": None,
+    })
+    results.append(measure("dedupe", size, None, [lambda: dedupe_jobs(jobs)]))
+
+    with _stub_market(jobs, latency) as stub:
+        for mix in PROFILE_MIXES:
+            # Built per mix: cold runs below install a fresh vocabulary, and the index holds its IDs.
+            catalog = RoleCatalogIndex(make_catalog(size, seed=seed))
+            payloads = make_profiles(mix, iterations, seed=seed)
+            profiles = [career_matcher.normalize_profile(p) for p in payloads]
+
+            results.append(measure(
+                "match_live_jobs", size, mix,
+                [lambda p=p: career_matcher._match_live_jobs(p, prepared) for p in profiles],
+            ))
+
+            scored = [_scored_jobs(p, prepared) for p in profiles]
+            results.append(measure(
+                "aggregate_careers", size, mix,
+                [lambda p=p, s=s: career_matcher._aggregate_careers(s, p["interests"], p["skills_set"])
+                 for p, s in zip(profiles, scored)],
+            ))
+
+            with mock.patch.object(career_matcher, "get_role_catalog", lambda: catalog):
+                results.append(measure(
+                    "fallback_catalog_match", size, mix,
+                    [lambda p=p: career_matcher._fallback_catalog_match(p) for p in profiles],
+                ))
+
+            _reset_match_caches()
+            served = stub.served
+            career_matcher.match_roles(payloads[0])
+            postings = stub.served - served
+
+            results.append({
+                **measure(
+                    "match_roles_cold", size, mix,
+                    [lambda p=p: career_matcher.match_roles(p) for p in payloads],
+                    setup=_reset_match_caches,
+                ),
+                "market_postings": postings,
+            })
+
+            for payload in payloads:
+                career_matcher.match_roles(payload)
+            results.append({
+                **measure(
+                    "match_roles_warm", size, mix,
+                    [lambda p=p: career_matcher.match_roles(p) for p in payloads],
+                ),
+                "market_postings": postings,
+            })
+            _reset_match_caches()
+
+    return results
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated corpus sizes")
+    parser.add_argument("--iterations", type=int, default=10, help="profiles per mix and stage")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="simulated Adzuna latency per request")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    report = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "adzuna_latency_ms": args.latency_ms,
+        },
+        "results": [],
+    }
+    for size in sizes:
+        report["results"].extend(bench_corpus(size, args.iterations, args.seed, args.latency_ms / 1000.0))
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + "\n", encoding="utf-8")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Local stand-in for the Adzuna search API, serving pages of a synthetic corpus."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qs, urlparse
+
+
+def _to_adzuna_item(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": job["external_id"],
+        "title": job["job_title"],
+        "company": {"display_name": job["company"]},
+        "location": {"display_name": job["location"]},
+        "salary_min": job["salary_min"],
+        "salary_max": job["salary_max"],
+        "contract_time": job["employment_type"],
+        "description": job["description"],
+        "created": job["created"],
+        "redirect_url": job["redirect_url"],
+    }
+
+
+class StubAdzunaServer:
+    """Threaded HTTP/1.1 server answering ``/{country}/search/{page}`` from ``jobs``.
+
+    Each query string maps to a fixed offset in the corpus, so different
+    queries see different (but repeatable) slices. ``latency`` adds a fixed
+    per-request delay to mimic the real API, and setting ``fail_status``
+    makes every request fail with that HTTP status. ``requests``,
+    ``connections`` and ``max_in_flight`` let tests observe coalescing,
+    keep-alive reuse and concurrency; ``served`` counts postings returned.
+    """
+
+    def __init__(self, jobs: List[Dict[str, Any]], latency: float = 0.0):
+        self.items = [_to_adzuna_item(job) for job in jobs]
+        self.latency = latency
+        self.fail_status: int | None = None
+        self.requests = 0
+        self.served = 0
+        self.connections = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = parse_qs(url.query)
+                page = int(url.path.rsplit("/", 1)[-1] or 1)
+                per_page = int(params.get("results_per_page", ["10"])[0])
+                results = server.page(params.get("what", [""])[0], page, per_page)
+                body = json.dumps({"results": results}).encode()
+
+                with server._lock:
+                    server.requests += 1
+                    server._in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server._in_flight)
+                try:
+                    if server.latency:
+                        time.sleep(server.latency)
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+                status = server.fail_status or 200
+                if status != 200:
+                    body = json.dumps({"error": "stub failure"}).encode()
+                else:
+                    with server._lock:
+                        server.served += len(results)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-adzuna", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def page(self, query: str, page: int, per_page: int) -> List[Dict[str, Any]]:
+        if not self.items:
+            return []
+        start = zlib.crc32(query.encode("utf-8")) + (page - 1) * per_page
+        return [self.items[(start + i) % len(self.items)] for i in range(min(per_page, len(self.items)))]
+
+    def __enter__(self) -> "StubAdzunaServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -11,6 +11,20 @@ class Job(db.Model):
     experience_level = db.Column(db.String(50), default='intermediate')
     average_salary = db.Column(db.String(100))
     job_market_demand = db.Column(db.Float, default=1.0)
+
+    # Ingested postings (see services.job_ingestion); NULL for seeded career roles.
+    external_id = db.Column(db.String(128), unique=True, index=True)
+    source = db.Column(db.String(50), index=True)
+    company = db.Column(db.String(255))
+    location = db.Column(db.String(255))
+    employment_type = db.Column(db.String(100))
+    salary_min = db.Column(db.Float)
+    salary_max = db.Column(db.Float)
+    redirect_url = db.Column(db.String(1000))
+    posted_at = db.Column(db.String(40))
+    content_hash = db.Column(db.String(40))
+    simhash = db.Column(db.BigInteger)  # signed 64-bit SimHash of title, company and description
+    last_seen_at = db.Column(db.DateTime, index=True)
     
     # Relationships
     # backref='job' is good, but back_populates is more explicit for modern SQLAlchemy
@@ -28,6 +42,14 @@ class Job(db.Model):
             'experience_level': self.experience_level,
             'average_salary': self.average_salary,
             'job_market_demand': self.job_market_demand,
+            'external_id': self.external_id,
+            'source': self.source,
+            'company': self.company,
+            'location': self.location,
+            'employment_type': self.employment_type,
+            'salary_min': self.salary_min,
+            'salary_max': self.salary_max,
+            'redirect_url': self.redirect_url,
             'required_skills': [s.to_dict() for s in self.skills],
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
@@ -6,6 +6,8 @@ import re
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
+from services.skill_vocabulary import SKILLS
+
 class SimpleResumeAnalyzer:
     """
     Simplified Resume Analyzer that extracts basic information from resume text
@@ -209,11 +211,12 @@ class SimpleResumeAnalyzer:
         return summary
 
     def analyze_skills_gap(self, user_skills: List[str], job_requirements: List[str]) -> Dict[str, Any]:
-        u_skills = set(s.lower() for s in user_skills)
-        j_reqs = set(s.lower() for s in job_requirements)
+        # Compare canonical names so aliases ("ML", "machine learning") line up.
+        u_skills = set(SKILLS.canonical_names(user_skills))
+        j_reqs = SKILLS.canonical_names(job_requirements)
         
-        matched = list(u_skills.intersection(j_reqs))
-        missing = list(j_reqs.difference(u_skills))
+        matched = [s for s in j_reqs if s in u_skills]
+        missing = [s for s in j_reqs if s not in u_skills]
         
         percentage = (len(matched) / len(j_reqs) * 100) if j_reqs else 0
         
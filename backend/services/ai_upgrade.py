@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from typing import Any, Dict, List, Tuple
 
+from services.skill_vocabulary import SKILLS
+
 
 KNOWN_SKILLS = {
     "python", "sql", "machine learning", "deep learning", "nlp", "computer vision",
@@ -176,16 +178,16 @@ def generate_interview_question(role: str) -> Dict[str, Any]:
 
 
 def _build_personalized_learning_plan(target_keywords: List[str], missing_skills: List[str], matched_keywords: List[str]) -> List[str]:
-    missing_norm = [_canonical(skill) for skill in (missing_skills or []) if str(skill).strip()]
-    matched_norm = {_canonical(skill) for skill in (matched_keywords or [])}
+    missing_norm = SKILLS.canonical_names(skill for skill in (missing_skills or []) if str(skill).strip())
+    matched_norm = set(SKILLS.canonical_names(matched_keywords or []))
+    missing_set = set(missing_norm)
 
     priority = []
-    for keyword in target_keywords:
-        key = _canonical(keyword)
-        if key in matched_norm:
+    for keyword in SKILLS.canonical_names(target_keywords):
+        if keyword in matched_norm:
             continue
-        if key in missing_norm:
-            priority.append(key)
+        if keyword in missing_set:
+            priority.append(keyword)
 
     for skill in missing_norm:
         if skill not in priority:
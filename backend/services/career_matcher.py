@@ -2,103 +2,57 @@
 
 from __future__ import annotations
 
-import re
+import hashlib
+import heapq
 import json
+import os
+import re
+import threading
+import time
 from collections import Counter, defaultdict
-from pathlib import Path
-from typing import Any, Dict, List, Set
-
-from utils.data_processor import DataProcessor
-
-
-SKILL_ALIASES = {
-    "rest api": "api",
-    "rest apis": "api",
-    "apis": "api",
-    "ml": "machine learning",
-    "artificial intelligence": "ai",
-    "data analytics": "data analysis",
-    "power bi": "powerbi",
-    "node.js": "node",
-    "js": "javascript",
-    "py": "python",
-    "structured query language": "sql",
-    "ci cd": "ci/cd",
-    "cloud": "cloud platforms",
-    "sklearn": "scikit-learn",
-    "dl": "deep learning",
-    "cv": "computer vision",
-    "pgsql": "postgresql",
-    "postgres": "postgresql",
-}
-
-# Vocabulary for extracting market-demand skills from job text.
-KNOWN_SKILLS = {
-    # Core languages
-    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-    "scala", "kotlin", "r", "matlab",
-    # Data / ML / AI
-    "sql", "data analysis", "machine learning", "deep learning", "nlp",
-    "computer vision", "tensorflow", "pytorch", "scikit-learn",
-    "pandas", "numpy", "statistics", "excel", "tableau", "powerbi",
-    "transformers", "huggingface",
-    # Big data
-    "spark", "pyspark", "hadoop", "hive", "kafka", "airflow", "hbase",
-    # Cloud
-    "aws", "azure", "gcp", "cloud platforms",
-    # DevOps / infra
-    "docker", "kubernetes", "terraform", "ansible", "jenkins", "linux",
-    "ci/cd", "git", "devops",
-    # Web / backend
-    "django", "flask", "fastapi", "spring", "spring boot", "node",
-    "react", "angular", "vue", "html", "css",
-    "api", "graphql", "grpc", "microservices", "websocket", "rest",
-    # Databases
-    "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "sqlite",
-    # Testing / QA
-    "pytest", "selenium", "unittest", "automation", "testing",
-    # Other tools
-    "celery", "scrapy", "beautifulsoup",
-    "agile", "scrum", "jira",
-}
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Pattern, Set, Tuple
+
+import numpy as np
+
+from services.job_store import get_job_store_snapshot
+from services.match_engine import SkillMatchEngine
+from services.query_canonicalizer import canonical_query, legacy_query, primary_skills, query_key_stats
+from services.role_catalog import get_role_catalog, get_role_catalog_version
+from services.skill_embeddings import get_skill_embeddings, get_skill_embeddings_version
+from services.skill_vocabulary import KNOWN_SKILLS, SKILLS
+from utils.data_processor import get_data_processor
+from utils.deadline import Deadline
+from utils.job_sources import LIVE_SOURCES, posting_source, source_label
+from utils.market_cache import TTLCache
+from utils.near_duplicates import dedupe_jobs
 
 
 def _canonical_skill(skill: str) -> str:
-    text = re.sub(r"\s+", " ", str(skill or "").strip().lower())
-    text = text.replace("-", " ")
-    return SKILL_ALIASES.get(text, text)
+    return SKILLS.canonical(skill)
 
 
-def _tokenize_skills(raw_skills: Any) -> List[str]:
+def _skill_candidates(raw_skills: Any) -> List[Any]:
     if not raw_skills:
         return []
 
     if isinstance(raw_skills, str):
-        candidates = raw_skills.split(",")
-    elif isinstance(raw_skills, list):
-        candidates = raw_skills
-    else:
-        return []
-
-    normalized = []
-    for item in candidates:
-        text = _canonical_skill(item)
-        if text:
-            normalized.append(text)
-
-    return list(dict.fromkeys(normalized))
-
-
-def _normalize_profile(user_data: Dict[str, Any]) -> Dict[str, Any]:
-    skills = _tokenize_skills(user_data.get("skills", []))
-
-    interests_raw = user_data.get("interests", [])
-    if isinstance(interests_raw, str):
-        interests = _tokenize_skills(interests_raw)
-    elif isinstance(interests_raw, list):
-        interests = _tokenize_skills(interests_raw)
-    else:
-        interests = []
+        return raw_skills.split(",")
+    if isinstance(raw_skills, list):
+        return raw_skills
+    return []
+
+
+def normalize_profile(user_data: Dict[str, Any]) -> Dict[str, Any]:
+    # Skills are kept by name: user input never grows the shared vocabulary,
+    # and a skill it has not interned must still stay in the profile. IDs
+    # come from the raw spellings, since an alias target can re-normalize
+    # to a different skill.
+    candidates = _skill_candidates(user_data.get("skills", []))
+    skills = SKILLS.canonical_names(candidates)
+    unresolved = SKILLS.canonical_names(c for c in candidates if SKILLS.id_of(c) is None)
+    interests = SKILLS.canonical_names(_skill_candidates(user_data.get("interests", [])))
 
     experience = user_data.get("experience", []) or []
     years = 0.0
@@ -112,86 +66,217 @@ def _normalize_profile(user_data: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "skills": skills,
         "skills_set": set(skills),
+        # Interned skills only; ``unresolved_skills`` cannot appear in any job or role yet.
+        "skill_ids": set(SKILLS.ids(candidates)),
+        "unresolved_skills": unresolved,
         "interests": interests,
         "experience_years": years,
         "education": user_data.get("education", {}) or {},
     }
 
 
-def _extract_job_skills(job: Dict[str, Any]) -> List[str]:
+# Longest skills first so "spring boot" is tried before "spring" at a given offset.
+_SKILL_SCAN_ORDER = sorted(KNOWN_SKILLS, key=lambda s: (-len(s), s))
+_SKILL_SCAN_RANK = {skill: idx for idx, skill in enumerate(_SKILL_SCAN_ORDER)}
+_SKILL_CANONICAL = {skill: _canonical_skill(skill) for skill in KNOWN_SKILLS}
+
+
+def _compile_skill_scanner(skills: List[str]) -> Tuple[Pattern[str], Dict[str, Tuple[str, ...]]]:
+    """Compile ``skills`` (longest first) into one whole-word scanner.
+
+    The zero-width lookahead lets a single finditer pass report a match at
+    every word boundary, so overlapping skills are still found independently.
+    It only reports the longest hit per offset, so the returned map lists the
+    shorter skills that always match inside a longer one (e.g. "spring" in
+    "spring boot").
+    """
+    pattern = re.compile(r"\b(?=(" + "|".join(re.escape(s) + r"\b" for s in skills) + r"))")
+    implies = {
+        skill: tuple(
+            other for other in skills
+            if other != skill and other in skill and re.search(r"\b" + re.escape(other) + r"\b", skill)
+        )
+        for skill in skills
+    }
+    return pattern, implies
+
+
+def _run_skill_scanner(scanner: Tuple[Pattern[str], Dict[str, Tuple[str, ...]]], text: str) -> Set[str]:
+    pattern, implies = scanner
+    found: Set[str] = set()
+    for match in pattern.finditer(text):
+        skill = match.group(1)
+        if skill not in found:
+            found.add(skill)
+            found.update(implies[skill])
+    return found
+
+
+_SKILL_SCANNER = _compile_skill_scanner(_SKILL_SCAN_ORDER)
+
+
+def _scan_skills(text: str) -> List[str]:
+    found = _run_skill_scanner(_SKILL_SCANNER, text)
+    ordered = sorted(found, key=_SKILL_SCAN_RANK.__getitem__)
+    return list(dict.fromkeys(_SKILL_CANONICAL[s] for s in ordered))
+
+
+@lru_cache(maxsize=256)
+def _title_matcher(user_skills: FrozenSet[str]):
+    """Scanner over the user's skills for title bonuses, compiled once per skill set."""
+    skills = sorted((s for s in user_skills if len(s) > 2), key=lambda s: (-len(s), s))
+    return _compile_skill_scanner(skills) if skills else None
+
+
+def _count_title_hits(matcher, title_lower: str) -> int:
+    if matcher is None:
+        return 0
+    return len(_run_skill_scanner(matcher, title_lower))
+
+
+def extract_job_skills(job: Dict[str, Any]) -> List[str]:
     blob = " ".join([
         str(job.get("job_title", "")),
         str(job.get("description", "")),
     ]).lower()
+    return _scan_skills(blob)
 
-    found = []
-    for skill in sorted(KNOWN_SKILLS, key=len, reverse=True):
-        pattern = r"\b" + re.escape(skill) + r"\b"
-        if re.search(pattern, blob):
-            found.append(_canonical_skill(skill))
 
-    return list(dict.fromkeys(found))
+def partial_credit(skill_ids: Set[int], n_skills: int) -> np.ndarray | None:
+    """Similarity credit for skills the user lacks, or None when embeddings are not built or disabled."""
+    weight = float(os.environ.get("SKILL_PARTIAL_CREDIT_WEIGHT", "0.5"))
+    if weight <= 0 or not skill_ids:
+        return None
+    embeddings = get_skill_embeddings()
+    if embeddings is None:
+        return None
+    threshold = float(os.environ.get("SKILL_SIMILARITY_THRESHOLD", "0.6"))
+    return embeddings.partial_credit(skill_ids, n_skills, threshold, weight)
 
 
-def _score_job(user_skills: Set[str], required_skills: List[str]) -> Dict[str, Any]:
-    required = _tokenize_skills(required_skills)
-    if not required:
-        return {"match_score": 0.0, "matched_skills": [], "missing_skills": []}
+def _job_skills(job: Dict[str, Any]) -> List[str]:
+    """Skills of a job; postings from the job store, CSV and feeds may carry them pre-extracted."""
+    required = job.get("required_skills")
+    return SKILLS.names(SKILLS.intern_all(required)) if isinstance(required, list) else extract_job_skills(job)
 
-    matched = [s for s in required if s in user_skills]
-    missing = [s for s in required if s not in user_skills]
-    score = round((len(matched) / len(required)) * 100, 2)
 
-    return {
-        "match_score": score,
-        "matched_skills": matched,
-        "missing_skills": missing,
-    }
+def _resolve_skill_ids(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Look up profile skills that had no ID again; compiling a market may have interned them since."""
+    if profile["unresolved_skills"]:
+        found = SKILLS.ids(profile["unresolved_skills"])
+        if found:
+            profile["skill_ids"] = profile["skill_ids"] | set(found)
+            profile["unresolved_skills"] = [s for s in profile["unresolved_skills"] if SKILLS.id_of(s) is None]
+    return profile
 
 
 def _build_query(skills: List[str], interests: List[str]) -> str:
-    primary = skills[:3]
-    if primary:
-        return " ".join(primary)
-    if interests:
-        return " ".join(interests[:2])
-    return "software"
-
-
-def _infer_work_type(employment_type: str, location: str, description: str) -> str:
-    text = " ".join([str(employment_type or ""), str(location or ""), str(description or "")]).lower()
-    if "hybrid" in text:
-        return "hybrid"
-    if "remote" in text or "work from home" in text or "wfh" in text:
-        return "remote"
-    if text:
-        return "onsite"
-    return ""
-
-
-def _infer_industry(job_title: str, description: str) -> str:
-    text = " ".join([str(job_title or ""), str(description or "")]).lower()
-    if any(k in text for k in ["fintech", "bank", "payments"]):
-        return "fintech"
-    if any(k in text for k in ["health", "healthcare", "medical", "hospital"]):
-        return "healthcare"
-    if any(k in text for k in ["ecommerce", "e-commerce", "retail"]):
-        return "ecommerce"
-    if any(k in text for k in ["consulting", "consultant", "advisory"]):
-        return "consulting"
-    return "technology"
-
-
-def _build_skill_gap(top_jobs: List[Dict[str, Any]], user_skills: Set[str], max_items: int = 8) -> List[str]:
-    missing_counter: Counter[str] = Counter()
+    return canonical_query(skills, interests)
+
+
+def _cluster_skills(skills: List[str], size: int = 3) -> List[List[str]]:
+    """Split ``skills`` into groups of up to ``size``, putting similar skills together.
+
+    Each group starts from the first unassigned skill and takes the
+    unassigned skills closest to it in embedding space. Without embeddings
+    (or for skills that have none) the input order is kept.
+    """
+    embeddings = get_skill_embeddings()
+    vectors = {}
+    if embeddings is not None:
+        for skill in skills:
+            row = embeddings.rows.get(SKILLS.id_of(skill))
+            if row is not None:
+                vectors[skill] = np.asarray(embeddings.vectors[row], dtype=np.float64)
+
+    remaining = list(skills)
+    clusters = []
+    while remaining:
+        seed = remaining.pop(0)
+        if seed in vectors:
+            nearest = sorted(
+                (s for s in remaining if s in vectors), key=lambda s: -float(vectors[seed] @ vectors[s])
+            )[: size - 1]
+        else:
+            nearest = [s for s in remaining if s not in vectors][: size - 1]
+        for skill in nearest:
+            remaining.remove(skill)
+        clusters.append([seed] + nearest)
+    return clusters
+
+
+def _fanout_width() -> int:
+    return max(1, int(os.environ.get("MATCH_QUERY_FANOUT", "1")))
+
+
+def _build_queries(skills: List[str], interests: List[str], max_queries: int) -> List[str]:
+    """``_build_query`` plus, in fan-out mode, one query per cluster of the remaining skills."""
+    queries = [_build_query(skills, interests)]
+    primary = set(primary_skills(skills))
+    for cluster in _cluster_skills([s for s in skills if s not in primary]):
+        if len(queries) >= max_queries:
+            break
+        query = " ".join(cluster)
+        if query not in queries:
+            queries.append(query)
+    return queries
+
+
+_WORK_TYPE_KEYWORDS = (
+    ("hybrid", ("hybrid",)),
+    ("remote", ("remote", "work from home", "wfh")),
+)
+
+_INDUSTRY_KEYWORDS = (
+    ("fintech", ("fintech", "bank", "payments")),
+    ("healthcare", ("health", "healthcare", "medical", "hospital")),
+    ("ecommerce", ("ecommerce", "e-commerce", "retail")),
+    ("consulting", ("consulting", "consultant", "advisory")),
+)
+
+# Keyed by the job fields the classifier reads; live snapshots repeat the same
+# postings across requests, so most lookups skip the keyword scan entirely.
+_job_classifications = TTLCache(
+    max_entries=int(os.environ.get("JOB_CLASSIFICATION_CACHE_MAX_ENTRIES", "4096")),
+    ttl_seconds=int(os.environ.get("JOB_CLASSIFICATION_CACHE_TTL_SECONDS", "3600")),
+)
+
+
+def _first_keyword_match(text: str, groups, default: str) -> str:
+    for label, keywords in groups:
+        if any(k in text for k in keywords):
+            return label
+    return default
+
+
+def classify_job(job: Dict[str, Any]) -> Tuple[str, str]:
+    """Return (work_type, industry) for a job, cached per job fingerprint."""
+    fingerprint = tuple(
+        str(job.get(field) or "") for field in ("employment_type", "location", "job_title", "description")
+    )
+    cached = _job_classifications.get(fingerprint)
+    if cached is not None:
+        return cached
+
+    employment_type, location, job_title, description = (part.lower() for part in fingerprint)
+    work_text = " ".join([employment_type, location, description])
+    work_type = _first_keyword_match(work_text, _WORK_TYPE_KEYWORDS, "onsite")
+    industry = _first_keyword_match(" ".join([job_title, description]), _INDUSTRY_KEYWORDS, "technology")
+
+    result = (work_type, industry)
+    _job_classifications.set(fingerprint, result)
+    return result
+
+
+def _build_skill_gap(top_jobs: List[Dict[str, Any]], user_skill_ids: Set[int], max_items: int = 8) -> List[str]:
+    missing_counter: Counter[int] = Counter()
 
     for job in top_jobs:
-        for skill in job.get("missing_skills", []):
-            canonical = _canonical_skill(skill)
-            if canonical and canonical not in user_skills:
-                missing_counter[canonical] += 1
+        for skill_id in SKILLS.ids(job.get("missing_skills", [])):
+            if skill_id not in user_skill_ids:
+                missing_counter[skill_id] += 1
 
-    return [skill for skill, _ in missing_counter.most_common(max_items)]
+    return [SKILLS.name(skill_id) for skill_id, _ in missing_counter.most_common(max_items)]
 
 
 def _skill_specific_steps(skill: str) -> List[str]:
@@ -254,11 +339,11 @@ def build_roadmap(missing_skills: List[str], max_items: int = 6) -> List[Dict[st
     return roadmap
 
 
-def _estimate_confidence(required: List[str], matched: List[str], demand_count: int, source: str = "adzuna") -> Dict[str, Any]:
+def _estimate_confidence(required: List[str], matched: List[str], demand_count: int, live: bool = True) -> Dict[str, Any]:
     required_count = max(1, len(required))
     overlap_ratio = len(matched) / required_count
     demand_score = min(1.0, float(max(0, demand_count)) / 8.0)
-    source_bonus = 0.1 if source == "adzuna" else 0.0
+    source_bonus = 0.1 if live else 0.0
 
     confidence = round((overlap_ratio * 0.65 + demand_score * 0.25 + source_bonus) * 100, 1)
     confidence = max(20.0, min(95.0, confidence))
@@ -304,7 +389,7 @@ def _build_counterfactual(required: List[str], matched: List[str], base_score: f
     }
 
 
-def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str], user_skills: Set[str] = None) -> List[Dict[str, Any]]:
+def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str], user_skills: Set[str] = None, top_k: int = 10) -> List[Dict[str, Any]]:
     by_title: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
         "required_counter": Counter(),
         "matched_counter": Counter(),
@@ -314,27 +399,34 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
         "salary_min_values": [],
         "salary_max_values": [],
         "samples": 0,
+        "live_samples": 0,
     })
 
+    title_matcher = _title_matcher(frozenset(user_skills)) if user_skills else None
+
     for job in matched_jobs:
         title = str(job.get("job_title", "")).strip() or "Career Role"
         bucket = by_title[title]
         bucket["samples"] += 1
+        if posting_source(job) in LIVE_SOURCES:
+            bucket["live_samples"] += 1
 
         for s in job.get("required_skills", []):
-            bucket["required_counter"][_canonical_skill(s)] += 1
+            skill_id = SKILLS.id_of(s)
+            if skill_id is not None:
+                bucket["required_counter"][skill_id] += 1
         for s in job.get("matched_skills", []):
-            bucket["matched_counter"][_canonical_skill(s)] += 1
+            skill_id = SKILLS.id_of(s)
+            if skill_id is not None:
+                bucket["matched_counter"][skill_id] += 1
 
         location = str(job.get("location", "")).strip()
         if location:
             bucket["location_counter"][location] += 1
 
-        work_type = _infer_work_type(job.get("employment_type", ""), job.get("location", ""), job.get("description", ""))
+        work_type, industry = classify_job(job)
         if work_type:
             bucket["work_type_counter"][work_type] += 1
-
-        industry = _infer_industry(job.get("job_title", ""), job.get("description", ""))
         if industry:
             bucket["industry_counter"][industry] += 1
 
@@ -345,11 +437,12 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
         if isinstance(salary_max, (int, float)) and salary_max > 0:
             bucket["salary_max_values"].append(float(salary_max))
 
-    careers = []
+    # Rank on the cheap score fields first; explanations, counterfactuals and
+    # confidence are only built for the top_k winners.
+    ranked = []
     for title, bucket in by_title.items():
-        required = [s for s, _ in bucket["required_counter"].most_common(8)]
-        matched = [s for s, _ in bucket["matched_counter"].most_common(8)]
-        missing = [s for s in required if s not in matched]
+        required = SKILLS.names(s for s, _ in bucket["required_counter"].most_common(8))
+        matched = SKILLS.names(s for s, _ in bucket["matched_counter"].most_common(8))
 
         if not required:
             continue
@@ -359,23 +452,43 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
         # Title-match bonus: reward roles where the user's skills appear
         # directly in the job title (signals a role centred on that skill).
         title_lower = title.lower()
-        if user_skills:
-            title_hits = sum(
-                1 for s in user_skills
-                if len(s) > 2 and re.search(r"\b" + re.escape(s) + r"\b", title_lower)
-            )
-        else:
-            title_hits = 0
+        title_hits = _count_title_hits(title_matcher, title_lower)
         title_bonus = min(15.0, float(title_hits) * 7.0)
 
         # Description-depth bonus: more matched skills from the user = higher confidence.
         depth_bonus = min(10.0, float(len(matched)) * 3.0) if len(matched) > 1 else 0.0
 
-        final_score = min(100.0, round(score + title_bonus + depth_bonus, 2))
-        confidence = _estimate_confidence(required, matched, bucket["samples"], source="adzuna")
+        ranked.append(
+            {
+                "title": title,
+                "bucket": bucket,
+                "required": required,
+                "matched": matched,
+                "title_bonus": title_bonus,
+                "match_score": min(100.0, round(score + title_bonus + depth_bonus, 2)),
+                "interest_hits": sum(1 for i in interests if _canonical_skill(i) in title_lower),
+                "demand_count": bucket["samples"],
+            }
+        )
+
+    winners = heapq.nlargest(
+        top_k,
+        ranked,
+        key=lambda c: (c["match_score"], c["interest_hits"], c["demand_count"]),
+    )
+
+    careers = []
+    for entry in winners:
+        title, bucket = entry["title"], entry["bucket"]
+        required, matched = entry["required"], entry["matched"]
+        missing = [s for s in required if s not in matched]
+        final_score = entry["match_score"]
+        title_bonus = entry["title_bonus"]
+
+        live = bucket["live_samples"] > 0
+        confidence = _estimate_confidence(required, matched, bucket["samples"], live=live)
         counterfactual = _build_counterfactual(required, matched, final_score)
 
-        interest_hits = sum(1 for i in interests if _canonical_skill(i) in title_lower)
         dominant_location = bucket["location_counter"].most_common(1)[0][0] if bucket["location_counter"] else ""
         dominant_work_type = bucket["work_type_counter"].most_common(1)[0][0] if bucket["work_type_counter"] else ""
         dominant_industry = bucket["industry_counter"].most_common(1)[0][0] if bucket["industry_counter"] else "technology"
@@ -383,8 +496,8 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
         salary_max = int(sum(bucket["salary_max_values"]) / len(bucket["salary_max_values"])) if bucket["salary_max_values"] else None
 
         explanation = [
-            f"Matched {len(matched)} of {len(required)} core skills from live jobs.",
-            f"Based on {bucket['samples']} current job postings.",
+            f"Matched {len(matched)} of {len(required)} core skills from {'live' if live else 'local'} jobs.",
+            f"Based on {bucket['samples']} {'current' if live else 'local'} job postings.",
             f"Confidence: {confidence['band'].title()} ({confidence['range'][0]}% - {confidence['range'][1]}%).",
         ]
         if title_bonus > 0:
@@ -405,7 +518,7 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
                 "salary_min": salary_min,
                 "salary_max": salary_max,
                 "demand_count": bucket["samples"],
-                "interest_hits": interest_hits,
+                "interest_hits": entry["interest_hits"],
                 "confidence": confidence["score"],
                 "confidence_band": confidence["band"],
                 "confidence_range": confidence["range"],
@@ -414,29 +527,31 @@ def _aggregate_careers(matched_jobs: List[Dict[str, Any]], interests: List[str],
             }
         )
 
-    careers.sort(
-        key=lambda c: (c["match_score"], c["interest_hits"], c["demand_count"]),
-        reverse=True,
-    )
-    return careers[:10]
+    return careers
 
 
-def _extract_market_skills(live_jobs: List[Dict[str, Any]]) -> Dict[str, int]:
+def _top_market_skills(skill_lists) -> Dict[str, int]:
     counter: Counter[str] = Counter()
-    for job in live_jobs:
-        for skill in _extract_job_skills(job):
-            counter[skill] += 1
+    for skills in skill_lists:
+        counter.update(skills)
     return dict(counter.most_common(12))
 
 
-def _load_role_catalog() -> List[Dict[str, Any]]:
-    catalog_path = Path(__file__).resolve().parents[1] / "data" / "career_roles.json"
-    try:
-        with catalog_path.open("r", encoding="utf-8") as f:
-            payload = json.load(f)
-        return payload if isinstance(payload, list) else []
-    except Exception:
-        return []
+_INTEREST_KEYWORD_GROUPS = (
+    ({"ai", "machine learning"}, {"ai", "artificial intelligence", "machine learning", "ml", "data scientist"}),
+    ({"data analysis", "data science"}, {"data", "analyst", "scientist", "analytics"}),
+    ({"backend", "backend development"}, {"backend", "api", "server"}),
+    ({"frontend", "frontend development"}, {"frontend", "ui", "react", "web"}),
+)
+
+# Title keywords per canonical interest, expanded once per distinct interest.
+@lru_cache(maxsize=4096)
+def _keywords_for_interest(canonical: str) -> tuple:
+    expanded = {canonical}
+    for triggers, extra in _INTEREST_KEYWORD_GROUPS:
+        if canonical in triggers:
+            expanded.update(extra)
+    return tuple(expanded)
 
 
 def _role_interest_hits(role_title: str, interests: List[str]) -> int:
@@ -446,29 +561,15 @@ def _role_interest_hits(role_title: str, interests: List[str]) -> int:
 
     hits = 0
     for interest in interests:
-        canonical = _canonical_skill(interest)
-        if not canonical:
-            continue
-
-        keywords = {canonical}
-        if canonical in {"ai", "machine learning"}:
-            keywords.update({"ai", "artificial intelligence", "machine learning", "ml", "data scientist"})
-        if canonical in {"data analysis", "data science"}:
-            keywords.update({"data", "analyst", "scientist", "analytics"})
-        if canonical in {"backend", "backend development"}:
-            keywords.update({"backend", "api", "server"})
-        if canonical in {"frontend", "frontend development"}:
-            keywords.update({"frontend", "ui", "react", "web"})
-
-        if any(keyword in title for keyword in keywords):
+        if any(keyword in title for keyword in _keywords_for_interest(interest)):
             hits += 1
 
     return hits
 
 
 def _fallback_catalog_match(profile: Dict[str, Any]) -> Dict[str, Any]:
-    catalog = _load_role_catalog()
-    if not catalog:
+    catalog = get_role_catalog()
+    if catalog is None or not catalog.catalog_size:
         return {
             "recommendations": [],
             "skill_gap": [],
@@ -479,28 +580,48 @@ def _fallback_catalog_match(profile: Dict[str, Any]) -> Dict[str, Any]:
             "data_message": "Live job data and local catalog are unavailable right now.",
         }
 
-    recommendations: List[Dict[str, Any]] = []
-    skill_counter: Counter[str] = Counter()
+    skill_counter: Counter[int] = Counter()
 
-    for role in catalog:
-        role_title = role.get("role", "Career Role")
-        required = _tokenize_skills(role.get("required_skills", []))
-        if not required:
-            continue
+    # Only roles sharing at least one skill with the user are scored.
+    rows, matched_counts, match_scores = catalog.score(
+        profile["skill_ids"], partial_credit(profile["skill_ids"], catalog.engine.n_skills)
+    )
 
-        scored = _score_job(profile["skills_set"], required)
-        if not scored["matched_skills"]:
+    ranked = []
+    for row, matched_count, match_score in zip(rows, matched_counts, match_scores):
+        if matched_count <= 0:
             continue
 
-        interest_hits = _role_interest_hits(role_title, profile["interests"])
+        for skill_id in catalog.engine.rows[row]:
+            skill_counter[skill_id] += 1
+
+        interest_hits = _role_interest_hits(catalog.roles[row].get("role", "Career Role"), profile["interests"])
+        ranked.append((row, round(float(match_score), 2), interest_hits, int(matched_count)))
+
+    # Full recommendation dicts are only built for the top 10 roles.
+    winners = heapq.nlargest(
+        10,
+        ranked,
+        key=lambda r: (min(100.0, r[1] + min(15.0, float(r[2] * 8))), r[2], r[3]),
+    )
+
+    recommendations: List[Dict[str, Any]] = []
+    for row, base_score, interest_hits, _ in winners:
+        role = catalog.roles[row]
+        required = catalog.required[row]
+        role_title = role.get("role", "Career Role")
+        matched, missing = catalog.engine.breakdown(row, profile["skill_ids"])
+        scored = {
+            "match_score": base_score,
+            "matched_skills": SKILLS.names(matched),
+            "missing_skills": SKILLS.names(missing),
+        }
+
         interest_bonus = min(15.0, float(interest_hits * 8))
         calibrated_score = min(100.0, float(scored["match_score"]) + interest_bonus)
-        confidence = _estimate_confidence(required, scored["matched_skills"], demand_count=1, source="local_catalog")
+        confidence = _estimate_confidence(required, scored["matched_skills"], demand_count=1, live=False)
         counterfactual = _build_counterfactual(required, scored["matched_skills"], calibrated_score)
 
-        for skill in required:
-            skill_counter[_canonical_skill(skill)] += 1
-
         explanation = [
             f"Matched {len(scored['matched_skills'])} of {len(required)} required skills from local role catalog.",
             f"Confidence: {confidence['band'].title()} ({confidence['range'][0]}% - {confidence['range'][1]}%).",
@@ -532,15 +653,9 @@ def _fallback_catalog_match(profile: Dict[str, Any]) -> Dict[str, Any]:
             }
         )
 
-    recommendations.sort(
-        key=lambda r: (r["match_score"], r.get("interest_hits", 0), len(r.get("matched_skills", []))),
-        reverse=True,
-    )
-    recommendations = recommendations[:10]
-
     gap_limit = 5 if len(profile["skills"]) <= 1 else 8
     roadmap_limit = 4 if len(profile["skills"]) <= 1 else 6
-    skill_gap = _build_skill_gap(recommendations, profile["skills_set"], max_items=gap_limit)
+    skill_gap = _build_skill_gap(recommendations, profile["skill_ids"], max_items=gap_limit)
     roadmap = build_roadmap(skill_gap, max_items=roadmap_limit)
 
     message = "Live job data unavailable. Showing recommendations from local role catalog."
@@ -551,77 +666,511 @@ def _fallback_catalog_match(profile: Dict[str, Any]) -> Dict[str, Any]:
         "recommendations": recommendations,
         "skill_gap": skill_gap,
         "roadmap": roadmap,
-        "market_skills": dict(skill_counter.most_common(12)),
+        "market_skills": {SKILLS.name(skill_id): count for skill_id, count in skill_counter.most_common(12)},
         "live_jobs": [],
         "data_source": "local_catalog",
         "data_message": message,
     }
 
 
-def match_roles(user_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Real-time matching pipeline based on live jobs and skill overlap."""
-    profile = _normalize_profile(user_data or {})
+def public_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "skills": profile["skills"],
+        "interests": profile["interests"],
+        "experience_years": profile["experience_years"],
+        "experience_level": "entry",
+        "education": profile["education"],
+    }
 
-    if not profile["skills"]:
+
+def _profile_fingerprint(profile: Dict[str, Any]) -> str:
+    """Stable digest of the profile fields that drive scoring, independent of input order."""
+    payload = json.dumps(
+        [sorted(profile["skills"]), sorted(profile["interests"]), profile["experience_years"]],
+        separators=(",", ":"),
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+# Compiled candidates/engine per market snapshot, shared by every profile scored against it.
+_compiled_markets = TTLCache(
+    max_entries=int(os.environ.get("COMPILED_MARKET_CACHE_MAX_ENTRIES", "32")),
+    ttl_seconds=float(os.environ.get("COMPILED_MARKET_CACHE_TTL_SECONDS", "300")),
+)
+
+# Computed results keyed by (profile fingerprint, market snapshot version).
+# A new snapshot changes the key, so stale results are never served; old
+# entries age out through the TTL and LRU bound.
+_result_cache = TTLCache(
+    max_entries=int(os.environ.get("MATCH_RESULT_CACHE_MAX_ENTRIES", "512")),
+    ttl_seconds=float(os.environ.get("MATCH_RESULT_CACHE_TTL_SECONDS", "300")),
+)
+
+
+def get_match_cache_stats() -> Dict[str, Any]:
+    return _result_cache.get_stats()
+
+
+def _use_job_store() -> bool:
+    return os.environ.get("JOB_STORE_MATCHING", "False").lower() in ("1", "true", "t", "yes")
+
+
+def _store_market() -> Dict[str, Any] | None:
+    """Market payload built from the local job store, or None when it is empty."""
+    snapshot = get_job_store_snapshot()
+    if not snapshot:
+        return None
+    return {
+        "source": source_label(snapshot["live_jobs"]),
+        "live_jobs": snapshot["live_jobs"],
+        "snapshot_version": f"store-{snapshot['version']}",
+    }
+
+
+def _empty_result(profile: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recommendations": [],
+        "normalized_profile": public_profile(profile),
+        "skill_gap": [],
+        "roadmap": [],
+        "market_skills": {},
+        "live_jobs": [],
+        "data_source": "none",
+        "data_message": "Add skills to start matching.",
+    }
+
+
+# Market fetches run here when a request has a deadline, so the caller can
+# give up waiting while the fetch finishes and warms the market cache.
+_market_fetches = ThreadPoolExecutor(
+    max_workers=max(1, int(os.environ.get("MATCH_MARKET_FETCH_WORKERS", "8"))),
+    thread_name_prefix="market-fetch",
+)
+
+
+_deadline_stats: Dict[str, Any] = {"requests": 0, "degraded": 0, "stages": Counter()}
+_deadline_lock = threading.Lock()
+
+
+def _match_budget_seconds() -> float:
+    return float(os.environ.get("MATCH_DEADLINE_SECONDS", "12"))
+
+
+def _record_deadline(deadline: Deadline):
+    with _deadline_lock:
+        _deadline_stats["requests"] += 1
+        if deadline.degraded:
+            _deadline_stats["degraded"] += 1
+            _deadline_stats["stages"].update(deadline.degraded_stages)
+
+
+def get_match_deadline_stats() -> Dict[str, Any]:
+    with _deadline_lock:
         return {
-            "recommendations": [],
-            "normalized_profile": {
-                "skills": profile["skills"],
-                "interests": profile["interests"],
-                "experience_years": profile["experience_years"],
-                "experience_level": "entry",
-                "education": profile["education"],
-            },
-            "skill_gap": [],
-            "roadmap": [],
-            "market_skills": {},
-            "live_jobs": [],
-            "data_source": "none",
-            "data_message": "Add skills to start matching.",
+            "budget_seconds": _match_budget_seconds(),
+            "requests": _deadline_stats["requests"],
+            "degraded": _deadline_stats["degraded"],
+            "degraded_stages": dict(_deadline_stats["stages"]),
         }
 
-    processor = DataProcessor()
-    query = _build_query(profile["skills"], profile["interests"])
-    market = processor.get_job_market_data({"query": query, "location": "India", "results": 30})
 
+def _market_queries(profile: Dict[str, Any]) -> List[str]:
+    return _build_queries(profile["skills"], profile["interests"], _fanout_width())
+
+
+def _merge_markets(markets: List[Dict[str, Any]], queries_total: int) -> Dict[str, Any]:
+    """One market payload from several sub-query payloads, in query order, without repeated postings."""
+    live = [m for m in markets if m.get("live_jobs")]
+    if not live:
+        return {**markets[0], "queries_total": queries_total, "queries_completed": len(markets)}
+
+    seen = set()
+    merged = []
+    for market in live:
+        for job in market["live_jobs"]:
+            key = job.get("external_id") or job.get("redirect_url") or id(job)
+            if key not in seen:
+                seen.add(key)
+                merged.append(job)
+    merged, dropped = dedupe_jobs(merged)
+
+    version = hashlib.sha1("|".join(str(m.get("snapshot_version")) for m in live).encode("utf-8")).hexdigest()
+    return {
+        "source": "+".join(dict.fromkeys(name for m in live for name in str(m.get("source")).split("+"))),
+        "total_jobs": len(merged),
+        "live_jobs": merged,
+        "snapshot_version": f"fanout-{version[:16]}",
+        "duplicates_dropped": dropped + sum(m.get("duplicates_dropped", 0) for m in live),
+        "queries_total": queries_total,
+        "queries_completed": len(markets),
+    }
+
+
+def _market_filters(query: str) -> Dict[str, Any]:
+    return {"query": query, "location": "India", "results": 30}
+
+
+def _combine_markets(markets: List[Dict[str, Any]], queries_total: int) -> Dict[str, Any]:
+    return markets[0] if queries_total == 1 else _merge_markets(markets, queries_total)
+
+
+def _fetch_market(profile: Dict[str, Any], timeout: float | None = None) -> Dict[str, Any] | None:
+    """Market payload for the profile's queries; None if Adzuna has not answered within ``timeout`` seconds.
+
+    In fan-out mode every sub-query is fetched concurrently under the same
+    timeout; sub-queries still pending when it expires are left out of the
+    merge (and keep running to warm the market cache).
+    """
+    market = _store_market() if _use_job_store() else None
+    if market is None:
+        processor = get_data_processor()
+        queries = _market_queries(profile)
+        query_key_stats.record(legacy_query(profile["skills"], profile["interests"]), queries[0])
+        if timeout is None and len(queries) == 1:
+            return processor.get_job_market_data(_market_filters(queries[0]))
+
+        futures = [_market_fetches.submit(processor.get_job_market_data, _market_filters(q)) for q in queries]
+        done, _ = wait(futures, timeout=timeout)
+        markets = [future.result() for future in futures if future in done]
+        if not markets:
+            return None
+        market = _combine_markets(markets, len(futures))
+    return market
+
+
+def _market_snapshot(market: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], bool, str | None]:
+    """Return (live jobs, use catalog fallback, snapshot tag for result caching)."""
     live_jobs = market.get("live_jobs", []) if isinstance(market, dict) else []
-    source = market.get("source", "unavailable") if isinstance(market, dict) else "unavailable"
 
-    if source != "adzuna" or not live_jobs:
-        fallback = _fallback_catalog_match(profile)
-        return {
-            "recommendations": fallback["recommendations"],
-            "normalized_profile": {
-                "skills": profile["skills"],
-                "interests": profile["interests"],
-                "experience_years": profile["experience_years"],
-                "experience_level": "entry",
-                "education": profile["education"],
-            },
-            "skill_gap": fallback["skill_gap"],
-            "roadmap": fallback["roadmap"],
-            "market_skills": fallback["market_skills"],
-            "live_jobs": fallback["live_jobs"],
-            "data_source": fallback["data_source"],
-            "data_message": fallback["data_message"],
-        }
+    # Any source that returned postings counts; the market's source label says which.
+    use_fallback = not live_jobs
+    if use_fallback:
+        catalog_version = get_role_catalog_version()
+        snapshot = f"catalog:{catalog_version}" if catalog_version is not None else None
+    else:
+        snapshot = f"market:{market.get('snapshot_version')}" if market.get("snapshot_version") else None
+
+    embeddings_version = get_skill_embeddings_version()
+    if snapshot and embeddings_version is not None:
+        snapshot = f"{snapshot}|embeddings:{embeddings_version}"
+    return live_jobs, use_fallback, snapshot
+
+
+def _response(profile: Dict[str, Any], result: Dict[str, Any], market: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "recommendations": result["recommendations"],
+        "normalized_profile": public_profile(profile),
+        "skill_gap": result["skill_gap"],
+        "roadmap": result["roadmap"],
+        "market_skills": result["market_skills"],
+        "live_jobs": result["live_jobs"],
+        "data_source": result["data_source"],
+        "data_message": result["data_message"],
+        "duplicates_dropped": market.get("duplicates_dropped", 0) if isinstance(market, dict) else 0,
+    }
+
+
+def match_roles(user_data: Dict[str, Any], budget_seconds: float | None = None) -> Dict[str, Any]:
+    """Real-time matching pipeline based on live jobs and skill overlap.
+
+    The request runs under a latency budget (MATCH_DEADLINE_SECONDS unless
+    ``budget_seconds`` is given; 0 disables it). When it runs out, the
+    pipeline falls back to the catalog or skips optional stages, and the
+    response carries ``degraded`` plus per-stage ``stage_timings``.
+    """
+    deadline = Deadline(_match_budget_seconds() if budget_seconds is None else budget_seconds)
+    profile = normalize_profile(user_data or {})
+
+    if not profile["skills"]:
+        return {**_empty_result(profile), **deadline.report()}
+
+    with deadline.stage("market_fetch"):
+        market = _fetch_market(profile, timeout=deadline.remaining())
+    if market is None or market.get("queries_completed", 1) < market.get("queries_total", 1):
+        deadline.degrade("market_fetch")
+    live_jobs, use_fallback, snapshot = _market_snapshot(market)
+
+    cache_key = (_profile_fingerprint(profile), snapshot)
+    result = _result_cache.get(cache_key) if snapshot else None
+    if result is None:
+        compiled = None
+        if not use_fallback and not deadline.expired():
+            with deadline.stage("extraction"):
+                compiled = _compiled_market(live_jobs, snapshot)
+
+        if compiled is not None and not deadline.expired():
+            result = _match_live_jobs(profile, live_jobs, compiled, deadline)
+        else:
+            if not use_fallback:
+                deadline.degrade("scoring")
+            with deadline.stage("catalog_fallback"):
+                result = _fallback_catalog_match(profile)
+
+        # Partial results are never cached; the next request gets a full attempt.
+        if snapshot and not deadline.degraded:
+            _result_cache.set(cache_key, result)
+
+    response = _response(profile, result, market)
+    if deadline.degraded and result["data_source"] == "local_catalog":
+        response["data_message"] = "Live job data took too long. Showing recommendations from local role catalog."
+    response.update(deadline.report())
+    _record_deadline(deadline)
+    return response
+
+
+def stream_match_roles(user_data: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """``match_roles`` as a sequence of (event, payload) pairs, cheapest results first.
+
+    Catalog matches are yielded before the market fetch starts, so clients
+    render something while Adzuna is still answering. Live recommendations,
+    skill gap and market skills follow once the snapshot is scored, and a
+    ``summary`` event always closes the stream.
+    """
+    started = time.perf_counter()
+    profile = normalize_profile(user_data or {})
+    normalized = public_profile(profile)
+
+    if not profile["skills"]:
+        empty = _empty_result(profile)
+        yield "summary", {**empty, "final": True, "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1)}
+        return
+
+    fallback = _fallback_catalog_match(profile)
+    yield "fallback", {
+        "recommendations": fallback["recommendations"],
+        "skill_gap": fallback["skill_gap"],
+        "roadmap": fallback["roadmap"],
+        "normalized_profile": normalized,
+        "data_source": fallback["data_source"],
+        "data_message": "Preliminary matches from the local role catalog; live job data is loading.",
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }
+
+    market = _fetch_market(profile)
+    live_jobs, use_fallback, snapshot = _market_snapshot(market)
+
+    cache_key = (_profile_fingerprint(profile), snapshot)
+    result = _result_cache.get(cache_key) if snapshot else None
+    if result is None:
+        # The catalog result already computed above is reused when the market is unavailable.
+        result = fallback if use_fallback else _match_live_jobs(profile, live_jobs, _compiled_market(live_jobs, snapshot))
+        if snapshot:
+            _result_cache.set(cache_key, result)
+
+    if result["data_source"] != "local_catalog":
+        yield "recommendations", {"recommendations": result["recommendations"], "live_jobs": result["live_jobs"]}
+    yield "skill_gap", {"skill_gap": result["skill_gap"], "roadmap": result["roadmap"]}
+    yield "market_skills", {"market_skills": result["market_skills"]}
+
+    response = _response(profile, result, market)
+    yield "summary", {
+        "data_source": response["data_source"],
+        "data_message": response["data_message"],
+        "normalized_profile": response["normalized_profile"],
+        "duplicates_dropped": response["duplicates_dropped"],
+        "recommendation_count": len(response["recommendations"]),
+        "live_job_count": len(response["live_jobs"]),
+        "final": True,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000.0, 1),
+    }
 
-    scored_jobs: List[Dict[str, Any]] = []
+
+def _batch_markets(groups: Dict[Tuple[str, ...], Any]) -> Iterator[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+    """(queries, market) for every batch group, in the order their markets become available.
+
+    Each distinct query is fetched once, and all of them run concurrently on
+    the market fetch pool, so a cold batch costs about one round trip rather
+    than one per group.
+    """
+    if _use_job_store():
+        store = _store_market()
+        if store is not None:
+            for queries in groups:
+                yield queries, store
+            return
+
+    processor = get_data_processor()
+    futures: Dict[str, Future] = {}
+    for queries, members in groups.items():
+        profile = members[0][2]
+        query_key_stats.record(legacy_query(profile["skills"], profile["interests"]), queries[0])
+        for query in queries:
+            if query not in futures:
+                futures[query] = _market_fetches.submit(processor.get_job_market_data, _market_filters(query))
+
+    waiting = list(groups)
+    while waiting:
+        ready = [queries for queries in waiting if all(futures[q].done() for q in queries)]
+        if not ready:
+            wait({futures[q] for queries in waiting for q in queries}, return_when=FIRST_COMPLETED)
+            continue
+        for queries in ready:
+            waiting.remove(queries)
+            yield queries, _combine_markets([_market_result(futures[q]) for q in queries], len(queries))
+
+
+def _market_result(future: Future) -> Dict[str, Any]:
+    try:
+        return future.result()
+    except Exception as e:
+        return {"source": "unavailable", "total_jobs": 0, "live_jobs": [], "error": str(e)}
+
+
+def match_roles_batch(profiles: List[Any]) -> Iterator[Dict[str, Any]]:
+    """Match many profiles, yielding each response (tagged with its input ``index``) as its group finishes.
+
+    Profiles generating the same Adzuna queries share one market snapshot, and
+    cache misses within a group are scored together by one sparse
+    matrix-matrix product. An element that is not a profile object yields an
+    ``{"index", "error"}`` record instead of ending the stream.
+    """
+    groups: Dict[Tuple[str, ...], List[Tuple[int, Dict[str, Any], Dict[str, Any]]]] = defaultdict(list)
+    for index, user_data in enumerate(profiles):
+        if not isinstance(user_data, dict):
+            yield {"index": index, "error": "Each profile must be a JSON object"}
+            continue
+        try:
+            profile = normalize_profile(user_data)
+        except Exception as e:
+            yield {"index": index, "error": f"Invalid profile: {e}"}
+            continue
+        if not profile["skills"]:
+            yield _tagged(index, user_data, _empty_result(profile))
+            continue
+        groups[tuple(_market_queries(profile))].append((index, user_data, profile))
+
+    for queries, market in _batch_markets(groups):
+        members = groups[queries]
+        live_jobs, use_fallback, snapshot = _market_snapshot(market)
+
+        pending = []
+        for index, user_data, profile in members:
+            cached = _result_cache.get((_profile_fingerprint(profile), snapshot)) if snapshot else None
+            if cached is not None:
+                yield _tagged(index, user_data, _response(profile, cached, market))
+            else:
+                pending.append((index, user_data, profile))
+        if not pending:
+            continue
+
+        if use_fallback:
+            results = [_fallback_catalog_match(profile) for _, _, profile in pending]
+        else:
+            compiled = _compiled_market(live_jobs, snapshot)
+            engine = compiled["engine"]
+            for _, _, profile in pending:
+                _resolve_skill_ids(profile)
+            matched_counts, match_scores = engine.score_many(
+                [profile["skill_ids"] for _, _, profile in pending],
+                [partial_credit(profile["skill_ids"], engine.n_skills) for _, _, profile in pending],
+            )
+            results = [
+                _rank_live_jobs(profile, compiled, matched_counts[:, col], match_scores[:, col])
+                for col, (_, _, profile) in enumerate(pending)
+            ]
+
+        for (index, user_data, profile), result in zip(pending, results):
+            if snapshot:
+                _result_cache.set((_profile_fingerprint(profile), snapshot), result)
+            yield _tagged(index, user_data, _response(profile, result, market))
+
+
+def _tagged(index: int, user_data: Any, response: Dict[str, Any]) -> Dict[str, Any]:
+    tagged = {"index": index}
+    if isinstance(user_data, dict) and user_data.get("id") is not None:
+        tagged["id"] = user_data["id"]
+    tagged.update(response)
+    return tagged
+
+
+def _compile_live_jobs(live_jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Profile-independent work for one market snapshot: candidates, scoring engine and market skills."""
+    candidates = []
+    job_skills = []
     for job in live_jobs:
-        required = _extract_job_skills(job)
+        required = _job_skills(job)
+        job_skills.append(required)
         # Skip low-signal jobs with too few detectable skills.
         if len(required) < 2:
             continue
+        candidates.append((job, required))
 
-        scored = _score_job(profile["skills_set"], required)
-        overlap_count = len(scored["matched_skills"])
-        score = float(scored["match_score"])
+    return {
+        "candidates": candidates,
+        "engine": SkillMatchEngine([SKILLS.ids(required) for _, required in candidates], n_skills=len(SKILLS)),
+        "job_skills": job_skills,
+        "source": source_label(live_jobs),
+    }
 
-        # Keep only jobs with at least one concrete overlap for initial candidate pool.
-        if overlap_count < 1 or score <= 0:
-            continue
 
-        scored_jobs.append(
+def _compiled_market(live_jobs: List[Dict[str, Any]], snapshot: str | None) -> Dict[str, Any]:
+    """``_compile_live_jobs`` for a snapshot, reused across profiles until the snapshot changes."""
+    if not snapshot:
+        return _compile_live_jobs(live_jobs)
+    compiled = _compiled_markets.get(snapshot)
+    if compiled is None:
+        compiled = _compile_live_jobs(live_jobs)
+        _compiled_markets.set(snapshot, compiled)
+    return compiled
+
+
+def _match_live_jobs(
+    profile: Dict[str, Any],
+    live_jobs: List[Dict[str, Any]],
+    compiled: Dict[str, Any] | None = None,
+    deadline: Deadline | None = None,
+) -> Dict[str, Any]:
+    compiled = compiled or _compile_live_jobs(live_jobs)
+    deadline = deadline or Deadline()
+    engine = compiled["engine"]
+    profile = _resolve_skill_ids(profile)
+
+    # Score every candidate job in one sparse matrix-vector product.
+    with deadline.stage("scoring"):
+        matched_counts, match_scores = engine.score(
+            profile["skill_ids"], partial_credit(profile["skill_ids"], engine.n_skills)
+        )
+    return _rank_live_jobs(profile, compiled, matched_counts, match_scores, deadline)
+
+
+def _compiled_market_skills(compiled: Dict[str, Any]) -> Dict[str, int]:
+    market_skills = compiled.get("market_skills")
+    if market_skills is None:
+        market_skills = compiled["market_skills"] = _top_market_skills(compiled["job_skills"])
+    return market_skills
+
+
+def _rank_live_jobs(
+    profile: Dict[str, Any],
+    compiled: Dict[str, Any],
+    matched_counts: np.ndarray,
+    match_scores: np.ndarray,
+    deadline: Deadline | None = None,
+) -> Dict[str, Any]:
+    """Turn one profile's scores into recommendations; optional stages are skipped once ``deadline`` expires."""
+    candidates, engine = compiled["candidates"], compiled["engine"]
+    deadline = deadline or Deadline()
+
+    user_skill_count = len(profile["skills"])
+    min_overlap = 2 if user_skill_count >= 2 else 1
+    min_score = 25 if user_skill_count >= 2 else 15
+
+    # Keep only jobs with at least one concrete overlap for initial candidate pool.
+    pool = [
+        (idx, round(float(match_scores[idx]), 2), int(matched_counts[idx]))
+        for idx in np.flatnonzero(matched_counts > 0)
+    ]
+    strong_pool = [c for c in pool if c[2] >= min_overlap and c[1] >= min_score]
+
+    # If strict filtering yields nothing, surface low-confidence real overlaps instead of blank results.
+    top_k = 4 if user_skill_count <= 1 else 10
+    winners = heapq.nlargest(top_k, strong_pool if strong_pool else pool, key=lambda c: (c[1], c[2]))
+
+    top_jobs: List[Dict[str, Any]] = []
+    for idx, score, _ in winners:
+        job, required = candidates[idx]
+        matched, missing = engine.breakdown(idx, profile["skill_ids"])
+        top_jobs.append(
             {
                 "job_title": job.get("job_title", "Job Role"),
                 "company": job.get("company", ""),
@@ -631,60 +1180,52 @@ def match_roles(user_data: Dict[str, Any]) -> Dict[str, Any]:
                 "employment_type": job.get("employment_type", ""),
                 "redirect_url": job.get("redirect_url", ""),
                 "description": job.get("description", ""),
+                "source": job.get("source", "adzuna"),
                 "required_skills": required,
-                "matched_skills": scored["matched_skills"],
-                "missing_skills": scored["missing_skills"],
+                "matched_skills": SKILLS.names(matched),
+                "missing_skills": SKILLS.names(missing),
                 "match_score": score,
             }
         )
 
-    scored_jobs.sort(key=lambda j: (j["match_score"], len(j.get("matched_skills", []))), reverse=True)
-
-    user_skill_count = len(profile["skills"])
-    min_overlap = 2 if user_skill_count >= 2 else 1
-    min_score = 25 if user_skill_count >= 2 else 15
-
-    strong_jobs = [
-        j for j in scored_jobs
-        if len(j.get("matched_skills", [])) >= min_overlap and float(j.get("match_score", 0)) >= min_score
-    ]
-
-    # If strict filtering yields nothing, surface low-confidence real overlaps instead of blank results.
-    top_jobs = (strong_jobs if strong_jobs else scored_jobs)[:10]
-
     sparse_profile = user_skill_count <= 1
-    if sparse_profile:
-        top_jobs = top_jobs[:4]
-
-    careers = _aggregate_careers(top_jobs, profile["interests"], profile["skills_set"])
-    if sparse_profile:
-        careers = careers[:3]
+    with deadline.stage("aggregation"):
+        careers = _aggregate_careers(
+            top_jobs, profile["interests"], profile["skills_set"], top_k=3 if sparse_profile else 10
+        )
 
     gap_limit = 5 if sparse_profile else 8
     roadmap_limit = 4 if sparse_profile else 6
-    skill_gap = _build_skill_gap(top_jobs, profile["skills_set"], max_items=gap_limit)
-    roadmap = build_roadmap(skill_gap, max_items=roadmap_limit)
-    market_skills = _extract_market_skills(live_jobs)
+    skill_gap = _build_skill_gap(top_jobs, profile["skill_ids"], max_items=gap_limit)
+
+    # Market skills count every posting in the snapshot; once computed they are
+    # kept on the compiled market, so only the first request per snapshot pays.
+    if "market_skills" in compiled or not deadline.expired():
+        with deadline.stage("market_skills"):
+            market_skills = dict(_compiled_market_skills(compiled))
+    else:
+        deadline.degrade("market_skills")
+        market_skills = {}
+
+    if deadline.expired():
+        deadline.degrade("roadmap")
+        roadmap = []
+    else:
+        with deadline.stage("roadmap"):
+            roadmap = build_roadmap(skill_gap, max_items=roadmap_limit)
 
     data_message = ""
     if sparse_profile and top_jobs:
         data_message = "Limited profile detected (1 extracted skill). Showing a small set of low-confidence matches. Add 2-3 more skills for better accuracy."
-    elif not strong_jobs and top_jobs:
+    elif not strong_pool and top_jobs:
         data_message = "Limited overlap found. Showing low-confidence matches based on currently extracted skills."
 
     return {
         "recommendations": careers,
-        "normalized_profile": {
-            "skills": profile["skills"],
-            "interests": profile["interests"],
-            "experience_years": profile["experience_years"],
-            "experience_level": "entry",
-            "education": profile["education"],
-        },
         "skill_gap": skill_gap,
         "roadmap": roadmap,
         "market_skills": market_skills,
         "live_jobs": top_jobs,
-        "data_source": "adzuna",
+        "data_source": compiled["source"],
         "data_message": data_message,
     }
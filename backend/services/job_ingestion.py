@@ -0,0 +1,174 @@
+"""Background ingestion of Adzuna postings into the local job store."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from services.career_matcher import classify_job, extract_job_skills
+from services.job_store import content_hash, posting_key, stored_fingerprints, stored_hashes, upsert_postings
+from utils.data_processor import get_data_processor
+from utils.near_duplicates import SimHashIndex, default_max_distance, job_fingerprints
+from utils.shared_lease import SharedLease
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEED_QUERIES = (
+    "python developer",
+    "data scientist",
+    "data analyst",
+    "machine learning engineer",
+    "java developer",
+    "frontend developer",
+    "devops engineer",
+    "full stack developer",
+)
+
+DEFAULT_LEASE_PATH = Path(__file__).resolve().parents[1] / "instance" / "job_ingestion.db"
+
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_lease: Optional[SharedLease] = None
+_stats: Dict[str, Any] = {
+    "cycles": 0,
+    "failures": 0,
+    "standby_cycles": 0,
+    "last_run_at": None,
+    "last_duration_ms": None,
+    "last_result": None,
+}
+
+
+def _seed_queries() -> List[str]:
+    raw = os.environ.get("JOB_INGEST_QUERIES", "")
+    queries = [q.strip() for q in raw.split(",") if q.strip()]
+    return queries or list(DEFAULT_SEED_QUERIES)
+
+
+def _store_index() -> Optional[SimHashIndex]:
+    """SimHash index over recently stored postings, or None when dedup is disabled."""
+    max_distance = default_max_distance()
+    if max_distance < 0:
+        return None
+    index = SimHashIndex(max_distance)
+    for key, fingerprint in stored_fingerprints(int(os.environ.get("JOB_STORE_MAX_AGE_DAYS", "30"))):
+        index.add(key, fingerprint)
+    return index
+
+
+def run_ingestion_cycle(queries: Optional[List[str]] = None) -> Dict[str, int]:
+    """Fetch every seed query once and upsert the postings. Needs an app context."""
+    processor = get_data_processor()
+    location = os.environ.get("JOB_INGEST_LOCATION", "India")
+    results = int(os.environ.get("JOB_INGEST_RESULTS", "50"))
+
+    postings: Dict[str, Dict[str, Any]] = {}
+    for query in queries or _seed_queries():
+        jobs = processor._fetch_adzuna_jobs({"query": query, "location": location, "results": results}) or []
+        for job in jobs:
+            key = posting_key(job)
+            if key:
+                postings.setdefault(key, job)
+
+    # Skills are only extracted for new or edited postings.
+    known = stored_hashes(list(postings))
+    fetched = list(postings.items())
+    fingerprints = job_fingerprints([job for _, job in fetched])
+    index = _store_index()
+
+    records = []
+    dropped = 0
+    for (key, job), fingerprint in zip(fetched, fingerprints):
+        # Postings already stored are always refreshed; new ones are dropped
+        # when they near-duplicate anything kept so far.
+        if key not in known and index is not None:
+            if index.find(fingerprint) is not None:
+                dropped += 1
+                continue
+            index.add(key, fingerprint)
+
+        digest = content_hash(job)
+        _, industry = classify_job(job)
+        records.append(
+            {
+                **job,
+                "external_id": key,
+                "content_hash": digest,
+                "simhash": fingerprint,
+                "domain": industry,
+                "required_skills": None if known.get(key) == digest else extract_job_skills(job),
+            }
+        )
+
+    result = upsert_postings(records)
+    result["fetched"] = len(postings)
+    result["duplicates_dropped"] = dropped
+    return result
+
+
+def _make_lease(interval: float) -> Optional[SharedLease]:
+    """Lease that lets one worker process ingest at a time; None when JOB_INGEST_LEASE_PATH is empty."""
+    path = os.environ.get("JOB_INGEST_LEASE_PATH", str(DEFAULT_LEASE_PATH))
+    if not path:
+        return None
+    # Outlives one sleep plus a slow cycle, so the holder keeps it between renewals.
+    return SharedLease(path, "job_ingestion", ttl_seconds=2 * interval)
+
+
+def _ingest_forever(app, interval: float, lease: Optional[SharedLease]):
+    while True:
+        if lease is not None and not lease.try_acquire():
+            _stats["standby_cycles"] += 1
+            time.sleep(interval)
+            continue
+
+        started = time.perf_counter()
+        try:
+            with app.app_context():
+                result = run_ingestion_cycle()
+            _stats["cycles"] += 1
+            _stats["last_result"] = result
+            logger.info(f"Job ingestion cycle finished: {result}")
+        except Exception as e:
+            _stats["failures"] += 1
+            logger.error(f"Job ingestion cycle failed: {e}")
+        _stats["last_run_at"] = time.time()
+        _stats["last_duration_ms"] = round((time.perf_counter() - started) * 1000.0, 2)
+        time.sleep(interval)
+
+
+def start_job_ingestion(app) -> bool:
+    """Start the ingestion thread once per process when JOB_INGEST_ENABLED is set.
+
+    Every gunicorn worker starts the thread, but only the one holding the
+    shared lease runs cycles; the others stand by to take over if it dies.
+    """
+    global _worker, _lease
+    if os.environ.get("JOB_INGEST_ENABLED", "False").lower() not in ("1", "true", "t", "yes"):
+        return False
+
+    interval = max(60.0, float(os.environ.get("JOB_INGEST_INTERVAL_SECONDS", "3600")))
+    with _worker_lock:
+        if _worker is None:
+            try:
+                _lease = _make_lease(interval)
+            except Exception as e:
+                logger.error(f"Job ingestion lease unavailable, not starting ingestion: {e}")
+                return False
+            _worker = threading.Thread(
+                target=_ingest_forever, args=(app, interval, _lease),
+                name="job-ingestion", daemon=True,
+            )
+            _worker.start()
+    return True
+
+
+def get_ingestion_stats() -> Dict[str, Any]:
+    stats = {"running": _worker is not None and _worker.is_alive(), **_stats}
+    if _lease is not None:
+        stats["lease"] = _lease.get_stats()
+    return stats
@@ -0,0 +1,241 @@
+"""Local store of ingested job postings with their skills extracted once at write time."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, func, inspect, insert, select, text, update
+
+from models import db, Job, JobSkill
+from utils.market_cache import TTLCache
+from utils.near_duplicates import from_signed64, to_signed64
+
+logger = logging.getLogger(__name__)
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit.
+_CHUNK_SIZE = 500
+
+_INGEST_COLUMNS = (
+    "external_id", "source", "company", "location", "employment_type", "salary_min",
+    "salary_max", "redirect_url", "posted_at", "content_hash", "simhash", "last_seen_at",
+)
+
+_snapshot_cache = TTLCache(
+    max_entries=1,
+    ttl_seconds=int(os.environ.get("JOB_STORE_SNAPSHOT_TTL_SECONDS", "60")),
+)
+
+
+def _chunks(items: List[Any], size: int = _CHUNK_SIZE) -> Iterable[List[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def ensure_job_store_schema():
+    """Add the ingestion columns to a ``jobs`` table created before they existed.
+
+    ``db.create_all`` only creates missing tables, so older SQLite databases
+    are patched in place with nullable columns and their indexes.
+    """
+    engine = db.engine
+    existing = {column["name"] for column in inspect(engine).get_columns("jobs")}
+    missing = [name for name in _INGEST_COLUMNS if name not in existing]
+    if not missing:
+        return
+
+    with engine.begin() as conn:
+        for name in missing:
+            column_type = Job.__table__.c[name].type.compile(dialect=engine.dialect)
+            conn.execute(text(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}"))
+    for index in Job.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+    logger.info(f"Added job store columns: {', '.join(missing)}")
+
+
+def posting_key(job: Dict[str, Any], source: str = "adzuna") -> str:
+    """Stable store key for a posting: provider ID, else its redirect URL."""
+    raw = str(job.get("external_id") or job.get("redirect_url") or "").strip()
+    return f"{source}:{raw}"[:128] if raw else ""
+
+
+def content_hash(job: Dict[str, Any]) -> str:
+    blob = "\n".join([str(job.get("job_title") or ""), str(job.get("description") or "")])
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+def stored_hashes(keys: List[str]) -> Dict[str, str]:
+    """Content hash of each already stored posting, by store key."""
+    hashes: Dict[str, str] = {}
+    for chunk in _chunks(keys):
+        rows = db.session.execute(select(Job.external_id, Job.content_hash).where(Job.external_id.in_(chunk)))
+        hashes.update({key: digest for key, digest in rows})
+    return hashes
+
+
+def stored_fingerprints(max_age_days: int) -> Iterator[Tuple[str, int]]:
+    """(store key, unsigned SimHash) of every posting seen within ``max_age_days``."""
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    rows = db.session.execute(
+        select(Job.external_id, Job.simhash)
+        .where(Job.external_id.is_not(None), Job.simhash.is_not(None), Job.last_seen_at >= cutoff)
+        .execution_options(yield_per=10_000)
+    )
+    for key, fingerprint in rows:
+        yield key, from_signed64(fingerprint)
+
+
+def upsert_postings(postings: List[Dict[str, Any]], source: str = "adzuna") -> Dict[str, int]:
+    """Insert new postings and refresh existing ones in bulk.
+
+    Each posting carries ``external_id`` (from ``posting_key``), ``content_hash``,
+    ``domain`` and ``required_skills``. ``required_skills`` of None means the
+    text is unchanged, so only the row metadata and ``last_seen_at`` are
+    touched and the stored skills are kept.
+    """
+    now = datetime.now(timezone.utc)
+    rows: Dict[str, Dict[str, Any]] = {}
+    skills: Dict[str, Optional[List[str]]] = {}
+    for posting in postings:
+        key = posting.get("external_id")
+        if not key:
+            continue
+        rows[key] = {
+            "external_id": key,
+            "source": source,
+            "job_title": str(posting.get("job_title") or "Job Role")[:255],
+            "description": posting.get("description") or "",
+            "domain": str(posting.get("domain") or "technology")[:100],
+            "company": str(posting.get("company") or "")[:255],
+            "location": str(posting.get("location") or "")[:255],
+            "employment_type": str(posting.get("employment_type") or "")[:100],
+            "salary_min": posting.get("salary_min") if isinstance(posting.get("salary_min"), (int, float)) else None,
+            "salary_max": posting.get("salary_max") if isinstance(posting.get("salary_max"), (int, float)) else None,
+            "redirect_url": str(posting.get("redirect_url") or "")[:1000],
+            "posted_at": str(posting.get("created") or "")[:40],
+            "content_hash": posting.get("content_hash"),
+            "simhash": to_signed64(posting["simhash"]) if posting.get("simhash") is not None else None,
+            "last_seen_at": now,
+        }
+        skills[key] = posting.get("required_skills")
+
+    if not rows:
+        return {"inserted": 0, "updated": 0, "skills_written": 0}
+
+    try:
+        keys = list(rows)
+        ids: Dict[str, int] = {}
+        for chunk in _chunks(keys):
+            ids.update(db.session.execute(select(Job.external_id, Job.id).where(Job.external_id.in_(chunk))).all())
+
+        new_rows = [row for key, row in rows.items() if key not in ids]
+        changed_rows = [{"id": ids[key], **row} for key, row in rows.items() if key in ids]
+        if new_rows:
+            db.session.execute(insert(Job), new_rows)
+        if changed_rows:
+            db.session.execute(update(Job), changed_rows)
+
+        new_keys = [row["external_id"] for row in new_rows]
+        for chunk in _chunks(new_keys):
+            ids.update(db.session.execute(select(Job.external_id, Job.id).where(Job.external_id.in_(chunk))).all())
+
+        rewrite = [key for key in keys if skills[key] is not None]
+        rewrite_ids = [ids[key] for key in rewrite]
+        for chunk in _chunks(rewrite_ids):
+            db.session.execute(
+                delete(JobSkill).where(JobSkill.job_id.in_(chunk)),
+                execution_options={"synchronize_session": False},
+            )
+        skill_rows = [
+            {"job_id": ids[key], "skill_name": skill[:255]}
+            for key in rewrite
+            for skill in dict.fromkeys(skills[key])
+        ]
+        if skill_rows:
+            db.session.execute(insert(JobSkill), skill_rows)
+
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+
+    _snapshot_cache.clear()
+    return {"inserted": len(new_rows), "updated": len(changed_rows), "skills_written": len(skill_rows)}
+
+
+def _load_snapshot(limit: int, max_age_days: int) -> Optional[Dict[str, Any]]:
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    rows = db.session.execute(
+        select(
+            Job.id, Job.job_title, Job.company, Job.location, Job.salary_min, Job.salary_max,
+            Job.employment_type, Job.description, Job.posted_at, Job.redirect_url,
+            Job.external_id, Job.content_hash, Job.simhash,
+        )
+        .where(Job.external_id.is_not(None), Job.last_seen_at >= cutoff)
+        .order_by(Job.last_seen_at.desc(), Job.id.desc())
+        .limit(limit)
+    ).all()
+    if not rows:
+        return None
+
+    required: Dict[int, List[str]] = {row.id: [] for row in rows}
+    for chunk in _chunks(list(required)):
+        skill_rows = db.session.execute(
+            select(JobSkill.job_id, JobSkill.skill_name).where(JobSkill.job_id.in_(chunk)).order_by(JobSkill.id)
+        )
+        for job_id, skill_name in skill_rows:
+            required[job_id].append(skill_name)
+
+    live_jobs = [
+        {
+            "external_id": row.external_id,
+            "job_title": row.job_title,
+            "company": row.company or "",
+            "location": row.location or "",
+            "salary_min": row.salary_min,
+            "salary_max": row.salary_max,
+            "employment_type": row.employment_type or "",
+            "description": row.description or "",
+            "created": row.posted_at or "",
+            "redirect_url": row.redirect_url or "",
+            "required_skills": required[row.id],
+            "simhash": from_signed64(row.simhash) if row.simhash is not None else None,
+        }
+        for row in rows
+    ]
+    digest = hashlib.sha1("|".join(f"{row.id}:{row.content_hash}" for row in rows).encode("utf-8"))
+    return {"live_jobs": live_jobs, "version": digest.hexdigest()[:16]}
+
+
+def get_job_store_snapshot() -> Optional[Dict[str, Any]]:
+    """Most recently seen stored postings, reloaded at most every JOB_STORE_SNAPSHOT_TTL_SECONDS.
+
+    Returns ``{"live_jobs", "version"}`` with ``required_skills`` pre-filled,
+    or None when the store is empty or unreadable.
+    """
+    snapshot = _snapshot_cache.get("snapshot")
+    if snapshot is not None:
+        return snapshot or None
+
+    limit = int(os.environ.get("JOB_STORE_MATCH_LIMIT", "5000"))
+    max_age_days = int(os.environ.get("JOB_STORE_MAX_AGE_DAYS", "30"))
+    try:
+        snapshot = _load_snapshot(limit, max_age_days)
+    except Exception as e:
+        logger.warning(f"Job store unavailable: {e}")
+        return None
+
+    # An empty dict marks "store is empty" so misses are cached too.
+    _snapshot_cache.set("snapshot", snapshot or {})
+    return snapshot
+
+
+def get_job_store_stats() -> Dict[str, Any]:
+    try:
+        stored = db.session.execute(select(func.count(Job.id)).where(Job.external_id.is_not(None))).scalar_one()
+    except Exception:
+        stored = None
+    return {"stored_postings": stored, "snapshot_cache": _snapshot_cache.get_stats()}
@@ -0,0 +1,91 @@
+"""Vectorized skill-overlap scoring over a sparse job x skill incidence matrix."""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+class SkillMatchEngine:
+    """Scores one or many skill sets against every row (job or role) at once.
+
+    Rows hold required skills as integer IDs from the shared skill vocabulary
+    (``services.skill_vocabulary.SKILLS``) and are stored as a CSR incidence
+    matrix, so matched counts for all rows come from a single sparse
+    matrix-vector product.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[int]], n_skills: int | None = None):
+        self.rows: List[List[int]] = [list(dict.fromkeys(row)) for row in rows]
+
+        indptr = np.zeros(len(self.rows) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(row) for row in self.rows])
+        indices = np.fromiter((i for row in self.rows for i in row), dtype=np.int64, count=int(indptr[-1]))
+
+        if n_skills is None:
+            n_skills = int(indices.max()) + 1 if len(indices) else 0
+        self.n_skills = n_skills
+
+        self.matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float64), indices, indptr),
+            shape=(len(self.rows), n_skills),
+        )
+        self.totals = np.diff(self.matrix.indptr)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def encode(self, skill_ids: Iterable[int]) -> np.ndarray:
+        """Return a 0/1 indicator vector over the columns; IDs outside the matrix are ignored."""
+        vector = np.zeros(self.n_skills, dtype=np.float64)
+        columns = [i for i in skill_ids if 0 <= i < self.n_skills]
+        if columns:
+            vector[columns] = 1.0
+        return vector
+
+    def score(self, skill_ids: Iterable[int], partial: np.ndarray | None = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (matched counts, match percentages) for every row.
+
+        ``partial`` optionally gives per-column credit in [0, 1) for skills the
+        user lacks (see ``services.skill_embeddings``); it raises percentages
+        but never the exact matched counts.
+        """
+        vector = self.encode(skill_ids)
+        matched = np.rint(self.matrix @ vector).astype(np.int64)
+        credit = matched if partial is None else self.matrix @ (vector + partial[: self.n_skills])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(self.totals > 0, credit / self.totals * 100.0, 0.0)
+        return matched, scores
+
+    def score_many(
+        self, skill_id_sets: Sequence[Iterable[int]], partials: Sequence[np.ndarray | None] | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return rows x profiles (matched counts, match percentages) for several skill sets.
+
+        Equivalent to calling ``score`` per profile, but every profile is
+        scored by one sparse matrix-matrix product.
+        """
+        if not skill_id_sets:
+            empty = np.zeros((len(self.rows), 0), dtype=np.int64)
+            return empty, empty.astype(np.float64)
+        users = np.column_stack([self.encode(ids) for ids in skill_id_sets])
+        matched = np.rint(self.matrix @ users).astype(np.int64)
+
+        credit = matched
+        if partials is not None and any(p is not None for p in partials):
+            for col, partial in enumerate(partials):
+                if partial is not None:
+                    users[:, col] += partial[: self.n_skills]
+            credit = self.matrix @ users
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(self.totals[:, None] > 0, credit / self.totals[:, None] * 100.0, 0.0)
+        return matched, scores
+
+    def breakdown(self, row: int, skill_ids: Set[int]) -> Tuple[List[int], List[int]]:
+        """Return (matched, missing) skill IDs for one row, in required order."""
+        required = self.rows[row]
+        matched = [i for i in required if i in skill_ids]
+        missing = [i for i in required if i not in skill_ids]
+        return matched, missing
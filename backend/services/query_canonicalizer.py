@@ -0,0 +1,129 @@
+"""Order-independent Adzuna queries: alias-resolved, deduplicated skills picked by catalog IDF."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from services.role_catalog import get_role_catalog
+from services.skill_vocabulary import SKILLS
+
+logger = logging.getLogger(__name__)
+
+
+def _enabled() -> bool:
+    return os.environ.get("MARKET_QUERY_CANONICAL", "True").lower() in ("1", "true", "t", "yes")
+
+
+def query_skills(skills: List[str], limit: int = 3) -> List[str]:
+    """The ``limit`` highest-signal skills in ``skills``, sorted by name.
+
+    Signal is inverse document frequency over the role catalog: a skill few
+    roles require says more about what the user is looking for than one
+    every role lists. Skills the catalog has never seen rank last, since
+    Adzuna is unlikely to match them either. Input order never matters.
+    """
+    names = sorted({SKILLS.canonical(s) for s in skills} - {""})
+    if len(names) <= limit:
+        return names
+
+    catalog = get_role_catalog()
+    postings = catalog.postings if catalog is not None else {}
+    n_roles = len(catalog) if catalog is not None else 0
+
+    def rank(name: str):
+        df = len(postings.get(SKILLS.id_of(name), ()))
+        idf = math.log((n_roles + 1) / (df + 1)) + 1.0
+        return (df == 0, -idf, name)
+
+    return sorted(sorted(names, key=rank)[:limit])
+
+
+def primary_skills(skills: List[str]) -> List[str]:
+    """Skills that go into the main query: ``query_skills``, or the first three when canonicalization is off."""
+    return query_skills(skills) if _enabled() else skills[:3]
+
+
+def canonical_query(skills: List[str], interests: List[str]) -> str:
+    """Adzuna ``what`` for a profile; the same skill set always yields the same string.
+
+    With MARKET_QUERY_CANONICAL off this is the legacy first-three-skills query.
+    """
+    if not _enabled():
+        return legacy_query(skills, interests)
+    if skills:
+        return " ".join(primary_skills(skills))
+    if interests:
+        return " ".join(sorted({SKILLS.canonical(i) for i in interests} - {""})[:2])
+    return "software"
+
+
+def legacy_query(skills: List[str], interests: List[str]) -> str:
+    primary = skills[:3]
+    if primary:
+        return " ".join(primary)
+    if interests:
+        return " ".join(interests[:2])
+    return "software"
+
+
+class QueryKeyStats:
+    """Shadow LRU sets replaying market lookups under the raw and canonical keys.
+
+    Each lookup records whether its key was seen among the last ``window``
+    distinct keys of its kind, which approximates the hit rate a market
+    cache of that size would get. The comparison is logged every
+    ``log_every`` lookups.
+    """
+
+    def __init__(self, window: int = 4096, log_every: int = 500):
+        self.window = max(1, int(window))
+        self.log_every = max(1, int(log_every))
+        self._raw: "OrderedDict[str, None]" = OrderedDict()
+        self._canonical: "OrderedDict[str, None]" = OrderedDict()
+        self._stats = {"lookups": 0, "raw_hits": 0, "canonical_hits": 0}
+        self._lock = threading.Lock()
+
+    def _seen(self, keys: "OrderedDict[str, None]", key: str) -> bool:
+        hit = key in keys
+        keys[key] = None
+        keys.move_to_end(key)
+        if len(keys) > self.window:
+            keys.popitem(last=False)
+        return hit
+
+    def record(self, raw_key: str, canonical_key: str):
+        with self._lock:
+            self._stats["lookups"] += 1
+            self._stats["raw_hits"] += self._seen(self._raw, " ".join(raw_key.lower().split()))
+            self._stats["canonical_hits"] += self._seen(self._canonical, " ".join(canonical_key.lower().split()))
+            should_log = self._stats["lookups"] % self.log_every == 0
+        if should_log:
+            stats = self.get_stats()
+            logger.info(
+                f"Market query canonicalization: {stats['canonical_hit_rate']:.1%} repeat-key rate "
+                f"vs {stats['raw_hit_rate']:.1%} for raw queries over {stats['lookups']} lookups "
+                f"({stats['canonical_distinct']} vs {stats['raw_distinct']} distinct keys)"
+            )
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["lookups"]
+            return {
+                **self._stats,
+                "raw_hit_rate": round(self._stats["raw_hits"] / lookups, 4) if lookups else 0.0,
+                "canonical_hit_rate": round(self._stats["canonical_hits"] / lookups, 4) if lookups else 0.0,
+                "raw_distinct": len(self._raw),
+                "canonical_distinct": len(self._canonical),
+                "enabled": _enabled(),
+            }
+
+
+query_key_stats = QueryKeyStats(
+    window=int(os.environ.get("MARKET_CACHE_MAX_ENTRIES", "256")),
+    log_every=int(os.environ.get("QUERY_CANONICAL_LOG_EVERY", "500")),
+)
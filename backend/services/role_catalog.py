@@ -0,0 +1,101 @@
+"""Compiled local role catalog with an inverted skill -> role index."""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from services.match_engine import SkillMatchEngine
+from services.skill_vocabulary import SKILLS
+from utils.dataset_registry import dataset_registry
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = Path(__file__).resolve().parents[1] / "data" / "career_roles.json"
+
+
+class RoleCatalogIndex:
+    """Role catalog encoded once as vocabulary IDs.
+
+    ``postings`` maps each skill ID to the rows of the roles requiring it, so a
+    lookup only scores roles sharing at least one skill with the user.
+    """
+
+    def __init__(self, catalog: List[Dict[str, Any]]):
+        self.catalog_size = len(catalog)
+        self.roles: List[Dict[str, Any]] = []
+        self.required: List[List[str]] = []
+        for role in catalog:
+            required = SKILLS.names(SKILLS.intern_all(_as_list(role.get("required_skills", []))))
+            if required:
+                self.roles.append(role)
+                self.required.append(required)
+
+        self.engine = SkillMatchEngine([SKILLS.ids(required) for required in self.required], n_skills=len(SKILLS))
+
+        postings: Dict[int, List[int]] = defaultdict(list)
+        for row, skill_ids in enumerate(self.engine.rows):
+            for skill_id in skill_ids:
+                postings[skill_id].append(row)
+        self.postings = {skill_id: np.asarray(rows, dtype=np.int64) for skill_id, rows in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def candidates(self, skill_ids: Iterable[int]) -> np.ndarray:
+        """Sorted rows of roles that share at least one skill with ``skill_ids``."""
+        hits = [self.postings[i] for i in skill_ids if i in self.postings]
+        if not hits:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(hits))
+
+    def score(self, skill_ids: Iterable[int], partial: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (rows, matched counts, match percentages) for the candidate roles only.
+
+        ``partial`` adds similarity credit for missing skills, as in ``SkillMatchEngine.score``.
+        """
+        skill_ids = list(skill_ids)
+        rows = self.candidates(skill_ids)
+        if not len(rows):
+            empty = np.zeros(0, dtype=np.int64)
+            return rows, empty, empty.astype(np.float64)
+
+        vector = self.engine.encode(skill_ids)
+        submatrix = self.engine.matrix[rows]
+        matched = np.rint(submatrix @ vector).astype(np.int64)
+        credit = matched if partial is None else submatrix @ (vector + partial[: self.engine.n_skills])
+        scores = credit / self.engine.totals[rows] * 100.0
+        return rows, matched, scores
+
+
+def _as_list(raw: Any) -> List[Any]:
+    if isinstance(raw, str):
+        return raw.split(",")
+    return raw if isinstance(raw, list) else []
+
+
+def _compile_catalog(path: str) -> RoleCatalogIndex:
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    index = RoleCatalogIndex(payload if isinstance(payload, list) else [])
+    logger.info(f"Compiled role catalog: {len(index)} roles, {len(index.postings)} indexed skills")
+    return index
+
+
+def get_role_catalog() -> Optional[RoleCatalogIndex]:
+    """Return the compiled catalog, recompiling only when the file's mtime changes."""
+    try:
+        return dataset_registry.load(str(CATALOG_PATH), _compile_catalog)
+    except Exception as e:
+        logger.warning(f"Role catalog unavailable: {e}")
+        return None
+
+
+def get_role_catalog_version() -> Optional[int]:
+    """mtime of the currently compiled catalog, or None when it has not loaded."""
+    return dataset_registry.version(str(CATALOG_PATH))
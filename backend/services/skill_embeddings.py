@@ -0,0 +1,294 @@
+"""Skill vectors from co-occurrence statistics (PPMI + truncated SVD), shared via a memory-mapped .npy file.
+
+Build offline from the backend directory:
+
+    python -m services.skill_embeddings --dim 32 [--live]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.linalg import svds
+
+from services.skill_vocabulary import DATA_DIR, SKILLS
+from utils.dataset_registry import dataset_registry
+
+logger = logging.getLogger(__name__)
+
+EMBEDDINGS_DIR = Path(os.environ.get("SKILL_EMBEDDINGS_DIR", str(DATA_DIR / "embeddings")))
+VECTORS_FILE = "skill_vectors.npy"
+NAMES_FILE = "skill_names.json"
+CURRENT_LINK = "current"
+
+
+class SkillEmbeddings:
+    """Unit-length skill vectors plus a lookup from vocabulary IDs to rows.
+
+    ``vectors`` is a read-only memory map, so every worker process shares the
+    same page-cache pages instead of holding its own copy.
+    """
+
+    def __init__(self, vectors: np.ndarray, names: List[str]):
+        self.vectors = vectors
+        self.names = names
+        self.rows: Dict[int, int] = {}
+        for row, name in enumerate(names):
+            skill_id = SKILLS.intern(name)
+            if skill_id is not None:
+                self.rows.setdefault(skill_id, row)
+        self._row_index = np.full(0, -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def row_index(self, n_skills: int) -> np.ndarray:
+        """Embedding row for each vocabulary ID below ``n_skills`` (-1 when unknown)."""
+        index = self._row_index
+        if len(index) != n_skills:
+            index = np.full(n_skills, -1, dtype=np.int64)
+            for skill_id, row in self.rows.items():
+                if skill_id < n_skills:
+                    index[skill_id] = row
+            self._row_index = index
+        return index
+
+    def partial_credit(self, skill_ids: Iterable[int], n_skills: int, threshold: float, weight: float) -> Optional[np.ndarray]:
+        """Credit in [0, weight] for every skill the user lacks, from its best similarity to a user skill.
+
+        One (skills x dim) @ (dim x user skills) product covers the whole
+        vocabulary. Returns None when none of the user's skills is embedded.
+        """
+        skill_ids = [i for i in skill_ids if 0 <= i < n_skills]
+        user_rows = [self.rows[i] for i in skill_ids if i in self.rows]
+        if not user_rows:
+            return None
+
+        best = (self.vectors @ self.vectors[user_rows].T).max(axis=1)
+        row_credit = np.where(best >= threshold, np.clip(best, 0.0, 1.0) * weight, 0.0)
+
+        index = self.row_index(n_skills)
+        credit = np.zeros(n_skills, dtype=np.float64)
+        known = index >= 0
+        credit[known] = row_credit[index[known]]
+        credit[skill_ids] = 0.0
+        return credit
+
+
+def _load_embeddings(path: str) -> SkillEmbeddings:
+    # Resolve the link once so names and vectors come from the same published version.
+    version_dir = Path(path).resolve().parent
+    with open(version_dir / NAMES_FILE, "r", encoding="utf-8") as f:
+        names = json.load(f)
+    vectors = np.load(version_dir / VECTORS_FILE, mmap_mode="r")
+    if vectors.shape[0] != len(names):
+        raise ValueError(f"{VECTORS_FILE} has {vectors.shape[0]} rows for {len(names)} skill names")
+    logger.info(f"Loaded skill embeddings: {vectors.shape[0]} skills x {vectors.shape[1]} dims")
+    return SkillEmbeddings(vectors, names)
+
+
+def embeddings_path(embeddings_dir: Path = EMBEDDINGS_DIR) -> Path:
+    """Vectors of the version the ``current`` link publishes."""
+    return embeddings_dir / CURRENT_LINK / VECTORS_FILE
+
+
+def get_skill_embeddings() -> Optional[SkillEmbeddings]:
+    """Embeddings from SKILL_EMBEDDINGS_DIR, remapped when a new version is published; None when not built."""
+    try:
+        return dataset_registry.load(str(embeddings_path()), _load_embeddings)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Skill embeddings unavailable: {e}")
+        return None
+
+
+def get_skill_embeddings_version() -> Optional[int]:
+    return dataset_registry.version(str(embeddings_path()))
+
+
+# ---------------------------------------------------------------------------
+# Offline builder
+# ---------------------------------------------------------------------------
+
+def _canonical_set(skills: Iterable[Any]) -> List[str]:
+    names = [SKILLS.canonical(s) for s in skills]
+    return list(dict.fromkeys(n for n in names if n))
+
+
+def _split(raw: Any) -> List[str]:
+    if isinstance(raw, str):
+        return raw.split(",")
+    return raw if isinstance(raw, list) else []
+
+
+def bundled_documents(data_dir: Path = DATA_DIR) -> List[List[str]]:
+    """Skill sets from job_dataset.csv rows, taxonomy related_skills and the role catalog."""
+    documents: List[List[str]] = []
+
+    jobs = pd.read_csv(data_dir / "job_dataset.csv")
+    for raw in jobs.get("required_skills", pd.Series(dtype=str)).dropna():
+        documents.append(_canonical_set(_split(raw)))
+
+    with (data_dir / "skill_taxonomy.json").open("r", encoding="utf-8") as f:
+        taxonomy = json.load(f)
+    for group in taxonomy.values():
+        for key, entry in (group or {}).items():
+            nested = entry if isinstance(entry, dict) and "category" not in entry else {key: entry}
+            for skill, details in nested.items():
+                if isinstance(details, dict):
+                    documents.append(_canonical_set([skill.replace("_", " ")] + details.get("related_skills", [])))
+
+    with (data_dir / "career_roles.json").open("r", encoding="utf-8") as f:
+        roles = json.load(f)
+    for role in roles if isinstance(roles, list) else []:
+        documents.append(_canonical_set(_split(role.get("required_skills", []))))
+
+    return documents
+
+
+def stored_documents(database_url: str) -> List[List[str]]:
+    """Skill sets of every job in the jobs/job_skills tables (seeded roles and ingested postings)."""
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and not (url.database and os.path.exists(url.database)):
+        return []
+
+    engine = create_engine(url)
+    grouped: Dict[int, List[str]] = {}
+    try:
+        with engine.connect() as conn:
+            for job_id, skill_name in conn.execute(text("SELECT job_id, skill_name FROM job_skills ORDER BY id")):
+                grouped.setdefault(job_id, []).append(skill_name)
+    finally:
+        engine.dispose()
+    return [_canonical_set(skills) for skills in grouped.values()]
+
+
+def live_documents(queries: Iterable[str]) -> List[List[str]]:
+    """Skill sets of postings fetched from Adzuna for ``queries``."""
+    from services.career_matcher import extract_job_skills
+    from utils.data_processor import get_data_processor
+
+    processor = get_data_processor()
+    documents = []
+    for query in queries:
+        for job in processor._fetch_adzuna_jobs({"query": query, "location": "India", "results": 50}) or []:
+            documents.append(_canonical_set(extract_job_skills(job)))
+    return documents
+
+
+def train_embeddings(documents: List[List[str]], dim: int = 32, min_count: int = 1):
+    """Return (names, unit-length float32 vectors) from PPMI-weighted co-occurrence + truncated SVD."""
+    counts: Dict[str, int] = {}
+    for doc in documents:
+        for skill in doc:
+            counts[skill] = counts.get(skill, 0) + 1
+    names = sorted(s for s, c in counts.items() if c >= min_count)
+    column = {name: i for i, name in enumerate(names)}
+
+    indptr = [0]
+    indices: List[int] = []
+    for doc in documents:
+        cols = {column[s] for s in doc if s in column}
+        if len(cols) > 1:
+            indices.extend(sorted(cols))
+            indptr.append(len(indices))
+    incidence = sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.float64), indices, indptr),
+        shape=(len(indptr) - 1, len(names)),
+    )
+
+    cooc = (incidence.T @ incidence).tocoo()
+    off_diagonal = cooc.row != cooc.col
+    rows, cols, values = cooc.row[off_diagonal], cooc.col[off_diagonal], cooc.data[off_diagonal]
+
+    totals = np.bincount(rows, weights=values, minlength=len(names))
+    grand_total = values.sum()
+    with np.errstate(divide="ignore"):
+        pmi = np.log(values * grand_total / (totals[rows] * totals[cols]))
+    keep = pmi > 0
+    ppmi = sparse.csr_matrix((pmi[keep], (rows[keep], cols[keep])), shape=(len(names), len(names)))
+
+    k = max(1, min(dim, len(names) - 1))
+    if ppmi.nnz == 0 or len(names) < 3:
+        vectors = np.zeros((len(names), k), dtype=np.float32)
+    else:
+        u, s, _ = svds(ppmi, k=k, random_state=0)
+        order = np.argsort(-s)
+        vectors = (u[:, order] * np.sqrt(s[order])).astype(np.float32)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return names, vectors
+
+
+def save_embeddings(names: List[str], vectors: np.ndarray, output_dir: Path = EMBEDDINGS_DIR, keep: int = 2) -> Path:
+    """Write names and vectors into a new version directory and publish both with one rename of ``current``.
+
+    Readers resolve the link once per load, so they never pair names from one
+    build with vectors from another. The ``keep`` newest versions stay on disk
+    for readers that resolved the link just before the swap.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    version_dir = output_dir / f"v{time.time_ns()}"
+    version_dir.mkdir()
+    (version_dir / NAMES_FILE).write_text(json.dumps(names), encoding="utf-8")
+    with open(version_dir / VECTORS_FILE, "wb") as f:
+        np.save(f, np.ascontiguousarray(vectors, dtype=np.float32))
+
+    link_tmp = output_dir / f".{CURRENT_LINK}.tmp"
+    if link_tmp.is_symlink():
+        link_tmp.unlink()
+    os.symlink(version_dir.name, link_tmp)
+    os.replace(link_tmp, output_dir / CURRENT_LINK)
+
+    versions = sorted(p for p in output_dir.glob("v*") if p.is_dir() and not p.is_symlink())
+    for old in versions[:-keep]:
+        shutil.rmtree(old, ignore_errors=True)
+    return version_dir
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build skill co-occurrence embeddings")
+    parser.add_argument("--dim", type=int, default=32)
+    parser.add_argument("--min-count", type=int, default=1)
+    parser.add_argument("--output", default=str(EMBEDDINGS_DIR))
+    parser.add_argument("--no-store", action="store_true", help="skip postings in the jobs/job_skills tables")
+    parser.add_argument("--live", action="store_true", help="also fetch postings for the ingestion seed queries")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    documents = bundled_documents()
+    if not args.no_store:
+        from config import Config
+
+        try:
+            documents.extend(stored_documents(Config.SQLALCHEMY_DATABASE_URI))
+        except Exception as e:
+            logger.warning(f"Skipping stored postings: {e}")
+    if args.live:
+        from services.job_ingestion import _seed_queries
+
+        documents.extend(live_documents(_seed_queries()))
+
+    names, vectors = train_embeddings(documents, dim=args.dim, min_count=args.min_count)
+    save_embeddings(names, vectors, Path(args.output))
+    logger.info(f"Wrote {len(names)} skill vectors ({vectors.shape[1]} dims) from {len(documents)} documents to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
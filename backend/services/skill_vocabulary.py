@@ -0,0 +1,220 @@
+"""Central skill vocabulary mapping every alias and canonical form to an interned integer ID."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+SKILL_ALIASES = {
+    "rest api": "api",
+    "rest apis": "api",
+    "apis": "api",
+    "ml": "machine learning",
+    "artificial intelligence": "ai",
+    "data analytics": "data analysis",
+    "power bi": "powerbi",
+    "node.js": "node",
+    "js": "javascript",
+    "py": "python",
+    "structured query language": "sql",
+    "ci cd": "ci/cd",
+    "cloud": "cloud platforms",
+    "sklearn": "scikit-learn",
+    "dl": "deep learning",
+    "cv": "computer vision",
+    "pgsql": "postgresql",
+    "postgres": "postgresql",
+}
+
+# Vocabulary for extracting market-demand skills from job text.
+KNOWN_SKILLS = {
+    # Core languages
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+    "scala", "kotlin", "r", "matlab",
+    # Data / ML / AI
+    "sql", "data analysis", "machine learning", "deep learning", "nlp",
+    "computer vision", "tensorflow", "pytorch", "scikit-learn",
+    "pandas", "numpy", "statistics", "excel", "tableau", "powerbi",
+    "transformers", "huggingface",
+    # Big data
+    "spark", "pyspark", "hadoop", "hive", "kafka", "airflow", "hbase",
+    # Cloud
+    "aws", "azure", "gcp", "cloud platforms",
+    # DevOps / infra
+    "docker", "kubernetes", "terraform", "ansible", "jenkins", "linux",
+    "ci/cd", "git", "devops",
+    # Web / backend
+    "django", "flask", "fastapi", "spring", "spring boot", "node",
+    "react", "angular", "vue", "html", "css",
+    "api", "graphql", "grpc", "microservices", "websocket", "rest",
+    # Databases
+    "postgresql", "mysql", "mongodb", "redis", "elasticsearch", "sqlite",
+    # Testing / QA
+    "pytest", "selenium", "unittest", "automation", "testing",
+    # Other tools
+    "celery", "scrapy", "beautifulsoup",
+    "agile", "scrum", "jira",
+}
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+def normalize_skill(skill: Any) -> str:
+    """Lower-case, collapse whitespace and resolve aliases (the uncached path)."""
+    text = re.sub(r"\s+", " ", str(skill or "").strip().lower())
+    text = text.replace("-", " ")
+    return SKILL_ALIASES.get(text, text)
+
+
+class SkillVocabulary:
+    """Interns canonical skill names as compact integer IDs.
+
+    Only trusted data grows the vocabulary: ``intern``/``seed`` are called for
+    the taxonomy, the role catalog and job postings. Lookups (``id_of``,
+    ``ids``, ``canonical``) never add entries, so user input cannot fill it;
+    a skill it has never interned has no ID, and callers that must keep it
+    (profiles) hold it by canonical name via ``canonical_names``.
+
+    Interned spellings are memoized for the life of the process; looked-up
+    spellings go through a bounded LRU that is invalidated whenever a new
+    skill is interned. Interning stops at ``max_size`` skills.
+    """
+
+    def __init__(self, max_size: int = 100_000, lookup_cache: int = 65_536):
+        self.max_size = max_size
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._raw: Dict[str, int] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._lookup = lru_cache(maxsize=lookup_cache)(self._resolve)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _resolve(self, key: str, generation: int) -> Tuple[Optional[int], str]:
+        # ``generation`` only keys the LRU, so entries cached before an intern are never reused.
+        canonical = normalize_skill(key)
+        return (self._ids.get(canonical) if canonical else None), canonical
+
+    def _intern(self, canonical: str) -> Optional[int]:
+        skill_id = self._ids.get(canonical)
+        if skill_id is not None:
+            return skill_id
+        with self._lock:
+            skill_id = self._ids.get(canonical)
+            if skill_id is None and len(self._names) < self.max_size:
+                skill_id = len(self._names)
+                self._names.append(canonical)
+                self._ids[canonical] = skill_id
+                self._generation += 1
+            return skill_id
+
+    def intern(self, skill: Any) -> Optional[int]:
+        """ID of the canonical form of ``skill``, adding it when new. Only for trusted data, never user input."""
+        key = skill if isinstance(skill, str) else str(skill or "")
+        skill_id = self._raw.get(key)
+        if skill_id is not None:
+            return skill_id
+
+        canonical = normalize_skill(key)
+        skill_id = self._intern(canonical) if canonical else None
+        if skill_id is not None and len(self._raw) < self.max_size:
+            self._raw[key] = skill_id
+        return skill_id
+
+    def id_of(self, skill: Any) -> Optional[int]:
+        """Return the ID of the canonical form of ``skill``, or None when it is blank or was never interned."""
+        key = skill if isinstance(skill, str) else str(skill or "")
+        skill_id = self._raw.get(key)
+        if skill_id is not None:
+            return skill_id
+        return self._lookup(key, self._generation)[0]
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def canonical(self, skill: Any) -> str:
+        key = skill if isinstance(skill, str) else str(skill or "")
+        skill_id = self._raw.get(key)
+        if skill_id is not None:
+            return self._names[skill_id]
+        skill_id, canonical = self._lookup(key, self._generation)
+        return self._names[skill_id] if skill_id is not None else canonical
+
+    def canonical_names(self, skills: Iterable[Any]) -> List[str]:
+        """Canonical forms of ``skills``, interned or not, dropping blanks and duplicates but keeping order."""
+        return list(dict.fromkeys(name for name in (self.canonical(s) for s in skills) if name))
+
+    def ids(self, skills: Iterable[Any]) -> List[int]:
+        """Map raw skills to IDs, dropping blanks, duplicates and never-interned skills but keeping order."""
+        result = []
+        for skill in skills:
+            skill_id = self.id_of(skill)
+            if skill_id is not None:
+                result.append(skill_id)
+        return list(dict.fromkeys(result))
+
+    def intern_all(self, skills: Iterable[Any]) -> List[int]:
+        """``ids`` for trusted skill lists, interning the ones not seen before."""
+        result = []
+        for skill in skills:
+            skill_id = self.intern(skill)
+            if skill_id is not None:
+                result.append(skill_id)
+        return list(dict.fromkeys(result))
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        return [self._names[i] for i in skill_ids]
+
+    def seed(self, skills: Iterable[Any]):
+        for skill in skills:
+            self.intern(skill)
+
+
+
+def _reference_skills() -> List[str]:
+    """Skill names referenced by the bundled taxonomy and role catalog."""
+    skills: List[str] = []
+
+    try:
+        with (DATA_DIR / "skill_taxonomy.json").open("r", encoding="utf-8") as f:
+            taxonomy = json.load(f)
+        for group in taxonomy.values():
+            for key, entry in (group or {}).items():
+                # technical_skills nests one level of categories; soft_skills does not.
+                nested = entry if isinstance(entry, dict) and "category" not in entry else {key: entry}
+                for skill, details in nested.items():
+                    skills.append(skill.replace("_", " "))
+                    if isinstance(details, dict):
+                        skills.extend(details.get("related_skills", []))
+    except Exception:
+        pass
+
+    try:
+        with (DATA_DIR / "career_roles.json").open("r", encoding="utf-8") as f:
+            roles = json.load(f)
+        for role in roles if isinstance(roles, list) else []:
+            skills.extend(role.get("required_skills", []))
+            skills.extend(role.get("related_skills_to_learn", []))
+    except Exception:
+        pass
+
+    return skills
+
+
+def build_vocabulary() -> SkillVocabulary:
+    """A vocabulary seeded with the aliases, known skills, taxonomy and role catalog."""
+    vocabulary = SkillVocabulary()
+    vocabulary.seed(SKILL_ALIASES.values())
+    vocabulary.seed(SKILL_ALIASES.keys())
+    vocabulary.seed(sorted(KNOWN_SKILLS))
+    vocabulary.seed(_reference_skills())
+    return vocabulary
+
+
+SKILLS = build_vocabulary()
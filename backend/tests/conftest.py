@@ -0,0 +1,76 @@
+"""Shared fixtures: a local Adzuna stand-in, a DataProcessor wired to it with cold caches, and a logged-in app client."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.corpus import make_jobs  # noqa: E402
+from benchmarks.stub_adzuna import StubAdzunaServer  # noqa: E402
+from utils import data_processor, http_client  # noqa: E402
+from utils.circuit_breaker import AdaptiveTimeout, CircuitBreaker  # noqa: E402
+from utils.market_cache import MarketSnapshotCache  # noqa: E402
+from utils.single_flight import SingleFlight  # noqa: E402
+
+
+@pytest.fixture
+def stub():
+    with StubAdzunaServer(make_jobs(500), latency=0.2) as server:
+        yield server
+
+
+@pytest.fixture
+def processor(stub, monkeypatch):
+    """A DataProcessor talking only to ``stub``, with fresh process-wide caches, breaker and session."""
+    monkeypatch.setenv("ADZUNA_APP_ID", "test-id")
+    monkeypatch.setenv("ADZUNA_APP_KEY", "test-key")
+    monkeypatch.setenv("ADZUNA_BASE_URL", stub.base_url)
+    monkeypatch.setenv("ADZUNA_RESULTS_PER_PAGE", "10")
+    monkeypatch.delenv("ADZUNA_PAGES", raising=False)
+    monkeypatch.delenv("JOB_SOURCES", raising=False)
+
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(ttl_seconds=300, stale_seconds=900))
+    monkeypatch.setattr(data_processor, "_adzuna_flight", SingleFlight())
+    monkeypatch.setattr(data_processor, "_adzuna_breaker", CircuitBreaker("adzuna", failure_threshold=2, open_seconds=0.5))
+    monkeypatch.setattr(data_processor, "_adzuna_timeout", AdaptiveTimeout(max_seconds=5.0))
+    monkeypatch.setattr(data_processor, "_market_disk_cache", None)
+    monkeypatch.setattr(data_processor, "_market_disk_cache_ready", True)
+    monkeypatch.setattr(data_processor, "_adzuna_rate_limiter", None)
+    monkeypatch.setattr(data_processor, "_adzuna_rate_limiter_ready", True)
+    monkeypatch.setattr(http_client, "_session", None)
+    return data_processor.DataProcessor()
+
+
+@pytest.fixture(scope="session")
+def flask_app(tmp_path_factory):
+    """The Flask app, imported against a throwaway database, upload folder and log file."""
+    root = tmp_path_factory.mktemp("app")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", f"sqlite:///{root / 'career_system.db'}")
+        mp.setenv("UPLOAD_FOLDER", str(root / "uploads"))
+        mp.setenv("JOB_INGEST_ENABLED", "false")
+        mp.chdir(root)
+        import app as app_module
+    app_module.app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    return app_module.app
+
+
+@pytest.fixture
+def client(flask_app):
+    """A test client whose session belongs to a stored user, so login-only routes answer."""
+    from models import User, db
+
+    email = "tester@example.com"
+    with flask_app.app_context():
+        if User.query.filter_by(email=email).first() is None:
+            db.session.add(User(name="Test User", email=email, password_hash="x", email_verified=True))
+            db.session.commit()
+
+    with flask_app.test_client() as client:
+        with client.session_transaction() as session:
+            session["user_id"] = email
+        yield client
@@ -0,0 +1,26 @@
+"""Pooled Adzuna client against the local stub: concurrent pages and keep-alive reuse."""
+
+from __future__ import annotations
+
+import time
+
+
+def test_pages_are_fetched_concurrently(processor, stub):
+    started = time.monotonic()
+    jobs = processor._fetch_adzuna_jobs({"query": "python", "pages": 4})
+    elapsed = time.monotonic() - started
+
+    assert stub.requests == 4
+    assert stub.max_in_flight > 1
+    # Four sequential 0.2 s pages would take 0.8 s.
+    assert elapsed < 0.6
+    assert len(jobs) == 40
+    assert len({job["external_id"] for job in jobs}) == 40
+
+
+def test_session_reuses_connections(processor, stub):
+    for query in ("python", "java", "react", "docker", "sql"):
+        assert processor._fetch_adzuna_jobs({"query": query})
+
+    assert stub.requests == 5
+    assert stub.connections == 1
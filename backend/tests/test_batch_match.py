@@ -0,0 +1,97 @@
+"""/api/match/batch against the local Adzuna stand-in: NDJSON framing, the size cap and shared markets."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from services import career_matcher
+from utils import data_processor
+
+WEB = ["python", "sql", "docker"]
+BI = ["excel", "tableau", "powerbi"]
+
+
+@pytest.fixture
+def batch_client(client, processor, monkeypatch):
+    """The logged-in client, matching against ``processor`` with cold match caches."""
+    monkeypatch.setattr(data_processor, "_shared_processor", processor)
+    career_matcher._result_cache.clear()
+    career_matcher._compiled_markets.clear()
+    yield client
+    career_matcher._result_cache.clear()
+    career_matcher._compiled_markets.clear()
+
+
+def _lines(response):
+    chunks = [chunk.decode("utf-8") for chunk in response.response]
+    response.close()
+    return chunks
+
+
+def test_each_profile_streams_as_one_ndjson_line(batch_client):
+    profiles = [{"id": "web", "skills": WEB}, "not a profile", {"id": "bi", "skills": BI}, {"skills": []}]
+
+    response = batch_client.post("/api/match/batch", json={"profiles": profiles}, buffered=False)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    chunks = _lines(response)
+    assert all(chunk.endswith("\n") and chunk.count("\n") == 1 for chunk in chunks)
+
+    results = [json.loads(chunk) for chunk in chunks]
+    assert sorted(result["index"] for result in results) == [0, 1, 2, 3]
+    by_index = {result["index"]: result for result in results}
+    assert by_index[0]["id"] == "web" and by_index[2]["id"] == "bi"
+    assert by_index[1] == {"index": 1, "error": "Each profile must be a JSON object"}
+    assert by_index[0]["recommendations"]
+    assert "id" not in by_index[3]
+
+
+def test_a_bare_list_is_accepted(batch_client):
+    response = batch_client.post("/api/match/batch", json=[{"skills": WEB}])
+
+    assert response.status_code == 200
+    assert [json.loads(line)["index"] for line in response.get_data(as_text=True).splitlines()] == [0]
+
+
+@pytest.mark.parametrize("body", [{}, {"profiles": []}, {"profiles": "python"}, []])
+def test_missing_profiles_are_rejected(batch_client, stub, body):
+    assert batch_client.post("/api/match/batch", json=body).status_code == 400
+    assert stub.requests == 0
+
+
+def test_oversized_batches_are_refused_before_matching(batch_client, stub, monkeypatch):
+    monkeypatch.setenv("BATCH_MATCH_MAX_PROFILES", "3")
+
+    response = batch_client.post("/api/match/batch", json={"profiles": [{"skills": WEB}] * 4})
+    assert response.status_code == 413
+    assert "At most 3" in response.get_json()["error"]
+    assert stub.requests == 0
+
+    response = batch_client.post("/api/match/batch", json={"profiles": [{"skills": WEB}] * 3})
+    assert response.status_code == 200
+    assert len(response.get_data(as_text=True).splitlines()) == 3
+
+
+def test_profiles_with_the_same_query_share_one_market_fetch(batch_client, stub):
+    profiles = [
+        {"id": "a", "skills": WEB},
+        {"id": "b", "skills": list(reversed(WEB))},
+        {"id": "c", "skills": ["Docker", "Python", "SQL"]},
+        {"id": "d", "skills": BI},
+        {"id": "e", "skills": BI[1:] + BI[:1]},
+    ]
+
+    response = batch_client.post("/api/match/batch", json={"profiles": profiles})
+    results = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+    assert len(results) == 5
+    assert stub.requests == 2
+    by_id = {result["id"]: result for result in results}
+    assert by_id["a"]["recommendations"] == by_id["b"]["recommendations"] == by_id["c"]["recommendations"]
+
+    # A second batch is served from the shared snapshots without new fetches.
+    batch_client.post("/api/match/batch", json={"profiles": profiles}).get_data()
+    assert stub.requests == 2
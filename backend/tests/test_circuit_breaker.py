@@ -0,0 +1,151 @@
+"""Circuit breaker and adaptive timeout: unit behaviour and the Adzuna client going through them."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from utils import data_processor
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, AdaptiveTimeout, CircuitBreaker
+
+
+def test_opens_after_consecutive_failures():
+    breaker = CircuitBreaker("test", failure_threshold=3, open_seconds=60)
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, open_seconds=60)
+    breaker.record_failure()
+    breaker.record_success(0.01)
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker("test", failure_threshold=1, slow_call_seconds=0.5, open_seconds=60)
+    breaker.record_success(1.0)
+    assert breaker.state == OPEN
+    assert breaker.get_stats()["slow_calls"] == 1
+
+
+def test_half_open_admits_limited_trials():
+    breaker = CircuitBreaker("test", failure_threshold=1, open_seconds=0.05, half_open_calls=1)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.release()
+    assert breaker.allow()
+    breaker.record_success(0.01)
+    assert breaker.state == CLOSED
+
+
+def test_failed_trial_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=1, open_seconds=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+
+def test_client_fails_fast_while_open_and_recovers(processor, stub):
+    breaker = data_processor._adzuna_breaker
+    stub.fail_status = 503
+    for query in ("python", "java"):
+        assert processor._fetch_adzuna_jobs({"query": query}) is None
+    assert breaker.state == OPEN
+    assert stub.requests == 2
+
+    # Open: rejected without reaching the API.
+    started = time.monotonic()
+    assert processor._fetch_adzuna_jobs({"query": "react"}) is None
+    assert time.monotonic() - started < 0.1
+    assert stub.requests == 2
+
+    # After open_seconds one trial goes through; it succeeds and closes the circuit.
+    stub.fail_status = None
+    time.sleep(breaker.open_seconds + 0.05)
+    assert processor._fetch_adzuna_jobs({"query": "react"})
+    assert breaker.state == CLOSED
+    assert stub.requests == 3
+
+
+def test_client_errors_do_not_trip_the_breaker(processor, stub):
+    stub.fail_status = 400
+    for _ in range(4):
+        assert processor._fetch_adzuna_jobs({"query": "python"}) is None
+    assert data_processor._adzuna_breaker.state == CLOSED
+
+
+def test_timeout_stays_at_max_until_enough_samples():
+    timeout = AdaptiveTimeout(max_seconds=10, min_seconds=0.5, min_samples=3)
+    timeout.observe(1.0)
+    timeout.observe(1.0)
+    assert timeout.current() == 10
+    timeout.observe(1.0)
+    assert timeout.current() == pytest.approx(2.0)
+
+
+def test_timeout_is_a_clamped_multiple_of_the_percentile():
+    timeout = AdaptiveTimeout(max_seconds=3, min_seconds=0.5, percentile=50, multiplier=2, min_samples=1)
+    for elapsed in (0.1, 0.2, 0.3):
+        timeout.observe(elapsed)
+    assert timeout.current() == pytest.approx(0.5)
+
+    for elapsed in (4.0, 4.0, 4.0, 4.0):
+        timeout.observe(elapsed)
+    assert timeout.current() == 3
+
+
+def test_timeout_forgets_samples_outside_the_window():
+    timeout = AdaptiveTimeout(max_seconds=10, min_seconds=0.1, percentile=100, multiplier=1, window=3, min_samples=1)
+    timeout.observe(5.0)
+    for _ in range(3):
+        timeout.observe(0.2)
+    assert timeout.current() == pytest.approx(0.2)
+    assert timeout.get_stats()["samples"] == 3
+
+
+def test_client_samples_successful_calls(processor, stub, monkeypatch):
+    timeout = AdaptiveTimeout(max_seconds=5.0, min_samples=1)
+    monkeypatch.setattr(data_processor, "_adzuna_timeout", timeout)
+
+    assert processor._fetch_adzuna_jobs({"query": "python"})
+    stats = timeout.get_stats()
+    assert stats["samples"] == 1
+    assert stats["latency_seconds"]["p50"] >= 0.2
+
+
+def test_client_samples_timed_out_calls_at_the_time_waited(processor, stub, monkeypatch):
+    timeout = AdaptiveTimeout(max_seconds=0.1, min_seconds=0.05)
+    monkeypatch.setattr(data_processor, "_adzuna_timeout", timeout)
+
+    assert processor._fetch_adzuna_jobs({"query": "python"}) is None
+    stats = timeout.get_stats()
+    assert stats["samples"] == 1
+    assert 0.1 <= stats["latency_seconds"]["p50"] < 0.2
+
+
+def test_client_does_not_sample_failed_calls(processor, stub, monkeypatch):
+    timeout = AdaptiveTimeout(max_seconds=5.0)
+    monkeypatch.setattr(data_processor, "_adzuna_timeout", timeout)
+    stub.fail_status = 503
+
+    assert processor._fetch_adzuna_jobs({"query": "python"}) is None
+    assert timeout.get_stats()["samples"] == 0
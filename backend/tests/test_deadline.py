@@ -0,0 +1,70 @@
+"""Request deadlines: the Deadline budget itself and the catalog fallback once it runs out."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from services import career_matcher
+from services.career_matcher import match_roles
+from utils import data_processor
+from utils.deadline import Deadline
+
+PROFILE = {"skills": ["python", "sql", "docker"]}
+
+
+@pytest.fixture
+def matcher(processor, monkeypatch):
+    """``match_roles`` wired to the stub-backed processor, with cold match caches."""
+    monkeypatch.setattr(data_processor, "_shared_processor", processor)
+    career_matcher._result_cache.clear()
+    career_matcher._compiled_markets.clear()
+    yield match_roles
+    career_matcher._result_cache.clear()
+    career_matcher._compiled_markets.clear()
+
+
+def test_unlimited_deadline_never_expires():
+    deadline = Deadline(0)
+    assert deadline.remaining() is None
+    assert not deadline.expired()
+
+
+def test_deadline_expires_and_records_degraded_stages():
+    deadline = Deadline(0.05)
+    assert 0 < deadline.remaining() <= 0.05
+    with deadline.stage("work"):
+        time.sleep(0.06)
+
+    assert deadline.expired() and deadline.remaining() == 0.0
+    deadline.degrade("roadmap")
+    deadline.degrade("roadmap")
+    report = deadline.report()
+    assert report["degraded"] is True
+    assert report["degraded_stages"] == ["roadmap"]
+    assert report["stage_timings"]["work"] >= 50
+
+
+@pytest.mark.parametrize("budget", [1e-9, 0.05])
+def test_exhausted_deadline_falls_back_to_the_catalog_without_waiting(matcher, stub, budget):
+    started = time.perf_counter()
+    response = matcher(PROFILE, budget_seconds=budget)
+    elapsed = time.perf_counter() - started
+
+    # The stub takes 0.2 s to answer; the request must not wait for it.
+    assert elapsed < 0.15
+    assert response["data_source"] == "local_catalog"
+    assert response["recommendations"]
+    assert response["degraded"] is True
+    assert "market_fetch" in response["degraded_stages"]
+    assert "took too long" in response["data_message"]
+
+
+def test_abandoned_fetch_is_reused_by_the_next_request(matcher, stub):
+    assert matcher(PROFILE, budget_seconds=0.05)["data_source"] == "local_catalog"
+
+    response = matcher(PROFILE, budget_seconds=5)
+    assert response["degraded"] is False
+    assert response["data_source"] != "local_catalog"
+    assert stub.requests == 1
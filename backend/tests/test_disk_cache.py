@@ -0,0 +1,128 @@
+"""SQLite disk cache: the cache itself and the market snapshots it carries across workers and restarts."""
+
+from __future__ import annotations
+
+import multiprocessing
+import sqlite3
+import time
+
+import pytest
+
+from utils import data_processor
+from utils.disk_cache import DiskCache
+from utils.market_cache import MarketSnapshotCache
+
+
+@pytest.fixture
+def disk(tmp_path):
+    return DiskCache(str(tmp_path / "cache.db"), retention_seconds=10)
+
+
+@pytest.fixture
+def market_disk(processor, monkeypatch, tmp_path):
+    """Route ``processor`` snapshots through a disk cache with short TTL and stale windows."""
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(
+        ttl_seconds=0.3, stale_seconds=0.6, age_of=data_processor._snapshot_age,
+    ))
+    cache = DiskCache(str(tmp_path / "market.db"), retention_seconds=10)
+    monkeypatch.setattr(data_processor, "_market_disk_cache", cache)
+    return cache
+
+
+def test_values_round_trip_with_their_age(disk):
+    assert disk.get("missing") is None
+    disk.set("key", {"jobs": [1, 2, 3], "label": "python"})
+    time.sleep(0.05)
+
+    value, age = disk.get("key")
+    assert value == {"jobs": [1, 2, 3], "label": "python"}
+    assert 0.05 <= age < 1.0
+    assert disk.get_stats()["hits"] == 1 and disk.get_stats()["misses"] == 1
+
+
+def test_entries_are_shared_with_other_processes(disk):
+    ctx = multiprocessing.get_context("fork")
+    writer = ctx.Process(target=lambda: DiskCache(disk.path).set("key", "from another worker"))
+    writer.start()
+    writer.join(10)
+
+    assert writer.exitcode == 0
+    assert disk.get("key")[0] == "from another worker"
+
+
+def test_expired_rows_are_purged_on_write(tmp_path):
+    cache = DiskCache(str(tmp_path / "cache.db"), retention_seconds=0.05, purge_every=2)
+    cache.set("old", 1)
+    time.sleep(0.1)
+    cache.set("new", 2)
+
+    assert cache.get("old") is None
+    assert cache.get("new")[0] == 2
+
+
+def test_unreadable_rows_count_as_errors(disk):
+    with sqlite3.connect(disk.path) as conn:
+        conn.execute("INSERT INTO cache (key, value, stored_at) VALUES ('bad', x'00', ?)", (time.time(),))
+
+    assert disk.get("bad") is None
+    assert disk.get_stats()["errors"] == 1
+
+
+def test_memory_miss_is_served_from_disk(processor, stub, market_disk):
+    first = processor.get_job_market_data({"query": "python"})
+
+    # Another worker, or this one after a restart: nothing in memory.
+    data_processor._market_cache.clear()
+    second = processor.get_job_market_data({"query": "python"})
+
+    assert stub.requests == 1
+    assert second["snapshot_version"] == first["snapshot_version"]
+    assert market_disk.get_stats()["hits"] == 1
+
+
+def test_stale_disk_entry_is_refetched_while_the_api_answers(processor, stub, market_disk):
+    first = processor.get_job_market_data({"query": "python"})
+    time.sleep(0.35)
+    data_processor._market_cache.clear()
+
+    second = processor.get_job_market_data({"query": "python"})
+    assert stub.requests == 2
+    assert second["cache_status"] == "miss"
+    assert second["live_jobs"] == first["live_jobs"]
+    assert market_disk.get_stats()["writes"] == 2
+
+
+def test_stale_disk_entry_is_served_only_when_the_fetch_fails(processor, stub, market_disk):
+    first = processor.get_job_market_data({"query": "python"})
+    time.sleep(0.35)
+    data_processor._market_cache.clear()
+    stub.fail_status = 503
+
+    second = processor.get_job_market_data({"query": "python"})
+    assert stub.requests == 2
+    assert second["live_jobs"] == first["live_jobs"]
+
+    # Past TTL + stale window the entry is no longer trusted.
+    time.sleep(0.6)
+    data_processor._market_cache.clear()
+    third = processor.get_job_market_data({"query": "python"})
+    assert third["source"] == "unavailable"
+    assert third["live_jobs"] == []
+
+
+def test_disk_snapshot_keeps_its_age_in_memory(processor, stub, monkeypatch, tmp_path):
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(
+        ttl_seconds=0.5, stale_seconds=5, age_of=data_processor._snapshot_age,
+    ))
+    monkeypatch.setattr(data_processor, "_market_disk_cache", DiskCache(str(tmp_path / "market.db"), retention_seconds=10))
+    processor.get_job_market_data({"query": "python"})
+    time.sleep(0.3)
+
+    # A restarted worker: nothing in memory, the snapshot is read back from disk.
+    data_processor._market_cache.clear()
+    processor.get_job_market_data({"query": "python"})
+    assert stub.requests == 1
+
+    # Past the TTL counted from the fetch, though promoted only 0.25 s ago.
+    time.sleep(0.25)
+    assert processor.get_job_market_data({"query": "python"})["cache_status"] == "stale"
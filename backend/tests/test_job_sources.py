@@ -0,0 +1,211 @@
+"""Job sources: the factory, the CSV, JSONL and SQL sources, and concurrent fan-in."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import time
+
+import pytest
+from flask import Flask
+
+from models import db
+from services import job_store
+from services.job_store import content_hash, posting_key, upsert_postings
+from utils import job_sources
+from utils.job_sources import (
+    AdzunaJobSource, CsvJobSource, JobSource, JsonlJobSource, SqlJobSource, build_job_sources, fan_in,
+)
+
+CSV = """job_id,job_title,company,location,salary_min,salary_max,employment_type,description,posted_date,required_skills
+1,Python Developer,Acme,Pune,500000,800000,full_time,Build python services,2026-01-01,"python, sql"
+2,Data Analyst,,,,,,,,
+3,Python Data Engineer,Beta,Remote,,,contract,Pipelines in python and spark,2026-02-01,"python, spark, sql"
+"""
+
+
+class _StaticSource(JobSource):
+    def __init__(self, name, postings=None, delay=0.0, error=None, timeout=None):
+        super().__init__(timeout)
+        self.name = name
+        self.postings = postings
+        self.delay = delay
+        self.error = error
+
+    def fetch(self, filters):
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.postings
+
+
+def _jobs(source, *ids):
+    return [{"external_id": f"{source}-{i}", "source": source} for i in ids]
+
+
+# --- build_job_sources ---------------------------------------------------------
+
+def test_sources_follow_the_spec_order(monkeypatch):
+    monkeypatch.setenv("JOB_SOURCE_TIMEOUT_SECONDS", "3")
+    monkeypatch.setenv("JOB_SOURCE_TIMEOUT_CSV", "0.5")
+    sources = build_job_sources(" CSV, adzuna ,nope,, sql,jsonl", lambda filters: [])
+
+    assert [type(s) for s in sources] == [CsvJobSource, AdzunaJobSource, SqlJobSource, JsonlJobSource]
+    assert [s.timeout for s in sources] == [0.5, None, 3.0, 3.0]
+
+
+def test_duplicate_source_names_are_used_once():
+    sources = build_job_sources("adzuna,csv,adzuna,CSV", lambda filters: [])
+    assert [s.name for s in sources] == ["adzuna", "csv"]
+
+
+# --- CsvJobSource --------------------------------------------------------------
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text(CSV, encoding="utf-8")
+    return str(path)
+
+
+def test_csv_blank_cells_become_empty_strings(csv_path):
+    postings = CsvJobSource(csv_path).fetch({"query": "analyst"})
+
+    assert len(postings) == 1
+    posting = postings[0]
+    for field in ("company", "location", "employment_type", "description", "created"):
+        assert posting[field] == ""
+    assert posting["salary_min"] is None and posting["required_skills"] == []
+    assert not any(isinstance(v, float) and math.isnan(v) for v in posting.values())
+
+
+def test_csv_ranks_postings_by_matching_query_words(csv_path):
+    source = CsvJobSource(csv_path)
+
+    titles = [p["job_title"] for p in source.fetch({"query": "python spark", "location": "Nowhere"})]
+    assert titles == ["Python Data Engineer", "Python Developer"]
+    assert [p["job_title"] for p in source.fetch({"query": "python", "results": 1})] == ["Python Developer"]
+    assert source.fetch({"query": "cobol"}) == []
+    first = source.fetch({"query": "python"})[0]
+    assert first["source"] == "csv" and first["required_skills"] == ["python", "sql"]
+
+
+def test_csv_reloads_when_the_file_changes(csv_path):
+    source = CsvJobSource(csv_path)
+    assert len(source.fetch({"query": "python"})) == 2
+
+    with open(csv_path, "a", encoding="utf-8") as f:
+        f.write('4,Python Tester,Gamma,Pune,,,,pytest suites,,"python"\n')
+    os.utime(csv_path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    assert len(source.fetch({"query": "python"})) == 3
+
+
+# --- JsonlJobSource ------------------------------------------------------------
+
+def test_jsonl_reads_every_feed_and_skips_bad_lines(tmp_path):
+    (tmp_path / "partner.jsonl").write_text(
+        json.dumps({"id": 7, "title": "Python Developer", "required_skills": "python, django"}) + "\n"
+        + "{not json\n\n"
+        + json.dumps({"job_title": "Python Analyst", "description": "python reports"}) + "\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "other.jsonl").write_text(json.dumps({"job_title": "Java Developer"}) + "\n", encoding="utf-8")
+    (tmp_path / "ignored.txt").write_text(json.dumps({"job_title": "Python Ignored"}) + "\n", encoding="utf-8")
+
+    postings = JsonlJobSource(str(tmp_path)).fetch({"query": "python"})
+
+    assert [p["job_title"] for p in postings] == ["Python Developer", "Python Analyst"]
+    developer, analyst = postings
+    assert developer["external_id"] == "7" and developer["source"] == "jsonl:partner.jsonl"
+    assert developer["required_skills"] == ["python", "django"]
+    assert analyst["external_id"] == "partner.jsonl-4" and "required_skills" not in analyst
+
+
+def test_jsonl_without_feeds_is_unavailable(tmp_path):
+    assert JsonlJobSource(str(tmp_path)).fetch({"query": "python"}) is None
+
+
+# --- SqlJobSource --------------------------------------------------------------
+
+@pytest.fixture
+def store_app(tmp_path, monkeypatch):
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'store.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    job_store._snapshot_cache.clear()
+    monkeypatch.setattr(job_sources, "_app", None)
+    yield app
+    job_store._snapshot_cache.clear()
+    with app.app_context():
+        db.engine.dispose()
+
+
+def _stored(n, title, skills):
+    job = {"external_id": f"s{n}", "job_title": title, "company": "Acme", "location": "Pune",
+           "description": f"{title} role", "redirect_url": f"https://example.test/{n}"}
+    return {**job, "external_id": posting_key(job), "content_hash": content_hash(job),
+            "domain": "technology", "required_skills": skills}
+
+
+def test_sql_source_searches_the_job_store(store_app, monkeypatch):
+    with store_app.app_context():
+        upsert_postings([_stored(1, "Python Developer", ["python"]), _stored(2, "Data Analyst", ["excel"])])
+
+    source = SqlJobSource()
+    assert source.fetch({"query": "python"}) is None  # no application bound
+
+    monkeypatch.setattr(job_sources, "_app", store_app)
+    postings = source.fetch({"query": "python"})
+    assert [p["job_title"] for p in postings] == ["Python Developer"]
+    assert postings[0]["source"] == "sql"
+    assert postings[0]["required_skills"] == ["python"]
+
+
+# --- fan_in ----------------------------------------------------------------------
+
+def test_fan_in_queries_sources_concurrently_in_source_order():
+    sources = [_StaticSource("a", _jobs("a", 1, 2), delay=0.2, timeout=2), _StaticSource("b", _jobs("b", 1), timeout=2)]
+
+    started = time.monotonic()
+    jobs, report = fan_in(sources, {"query": "python"})
+
+    assert time.monotonic() - started < 0.35
+    assert [j["external_id"] for j in jobs] == ["a-1", "a-2", "b-1"]
+    assert {name: r["status"] for name, r in report.items()} == {"a": "ok", "b": "ok"}
+    assert report["a"]["postings"] == 2
+
+
+def test_fan_in_abandons_slow_sources_and_reports_failures():
+    sources = [
+        _StaticSource("slow", _jobs("slow", 1), delay=1.0, timeout=0.1),
+        _StaticSource("broken", error=RuntimeError("boom"), timeout=1),
+        _StaticSource("empty", [], timeout=1),
+        _StaticSource("ok", _jobs("ok", 1), timeout=1),
+    ]
+
+    started = time.monotonic()
+    jobs, report = fan_in(sources, {})
+
+    assert time.monotonic() - started < 0.5
+    assert [j["external_id"] for j in jobs] == ["ok-1"]
+    assert {name: r["status"] for name, r in report.items()} == {
+        "slow": "timeout", "broken": "error", "empty": "empty", "ok": "ok",
+    }
+
+
+def test_fan_in_keeps_postings_of_same_named_sources():
+    sources = [_StaticSource("x", _jobs("first", 1), timeout=1), _StaticSource("x", _jobs("second", 1), timeout=1)]
+    jobs, _ = fan_in(sources, {})
+    assert [j["external_id"] for j in jobs] == ["first-1", "second-1"]
+
+
+def test_fan_in_calls_a_single_self_limiting_source_inline():
+    jobs, report = fan_in([AdzunaJobSource(lambda filters: _jobs("adzuna", 1))], {"query": "python"})
+    assert jobs[0]["source"] == "adzuna"
+    assert report["adzuna"]["status"] == "ok"
+
+    jobs, report = fan_in([AdzunaJobSource(lambda filters: None)], {"query": "python"})
+    assert jobs is None and report["adzuna"]["status"] == "empty"
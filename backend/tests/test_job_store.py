@@ -0,0 +1,169 @@
+"""Job store: schema migration of old databases, idempotent bulk upserts and ingestion dedup."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+from flask import Flask
+from sqlalchemy import func, inspect, select
+
+from models import Job, JobSkill, db
+from services import job_ingestion, job_store
+from services.job_store import ensure_job_store_schema, posting_key, upsert_postings
+
+# The jobs table as it was before ingestion columns were added.
+OLD_JOBS_SCHEMA = """
+CREATE TABLE jobs (
+    id INTEGER PRIMARY KEY,
+    job_title VARCHAR(255) NOT NULL,
+    description TEXT,
+    domain VARCHAR(100) NOT NULL,
+    experience_level VARCHAR(50),
+    average_salary VARCHAR(100),
+    job_market_demand FLOAT,
+    created_at DATETIME
+)
+"""
+
+
+def _app(path) -> Flask:
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{path}"
+    db.init_app(app)
+    return app
+
+
+@pytest.fixture
+def store(tmp_path):
+    app = _app(tmp_path / "store.db")
+    with app.app_context():
+        db.create_all()
+        job_store._snapshot_cache.clear()
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def _posting(n: int, **overrides):
+    job = {
+        "external_id": f"job-{n}",
+        "job_title": f"Python Developer {n}",
+        "company": "Acme",
+        "location": "Pune",
+        "description": f"Build services in python and sql, team {n}",
+        "redirect_url": f"https://example.test/{n}",
+        "created": "2026-01-01",
+        **overrides,
+    }
+    return {
+        **job,
+        "external_id": posting_key(job),
+        "content_hash": job_store.content_hash(job),
+        "domain": "technology",
+        "required_skills": ["python", "sql"],
+    }
+
+
+def test_old_schema_is_migrated_in_place(tmp_path):
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute(OLD_JOBS_SCHEMA)
+    conn.execute("INSERT INTO jobs (job_title, domain) VALUES ('Data Analyst', 'data')")
+    conn.commit()
+    conn.close()
+
+    app = _app(path)
+    with app.app_context():
+        db.create_all()
+        ensure_job_store_schema()
+        ensure_job_store_schema()
+
+        columns = {column["name"] for column in inspect(db.engine).get_columns("jobs")}
+        assert set(job_store._INGEST_COLUMNS) <= columns
+        indexes = {index["name"] for index in inspect(db.engine).get_indexes("jobs")}
+        assert "ix_jobs_external_id" in indexes
+        assert db.session.execute(select(Job.job_title)).scalars().all() == ["Data Analyst"]
+
+        assert upsert_postings([_posting(1)])["inserted"] == 1
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_upsert_is_idempotent(store):
+    postings = [_posting(n) for n in range(3)]
+    first = upsert_postings(postings)
+    second = upsert_postings(postings)
+
+    assert first == {"inserted": 3, "updated": 0, "skills_written": 6}
+    assert second == {"inserted": 0, "updated": 3, "skills_written": 6}
+    assert db.session.execute(select(func.count(Job.id))).scalar_one() == 3
+    assert db.session.execute(select(func.count(JobSkill.id))).scalar_one() == 6
+
+
+def test_unchanged_postings_keep_their_skills(store):
+    upsert_postings([_posting(1)])
+    result = upsert_postings([{**_posting(1), "required_skills": None}])
+
+    assert result == {"inserted": 0, "updated": 1, "skills_written": 0}
+    assert sorted(db.session.execute(select(JobSkill.skill_name)).scalars()) == ["python", "sql"]
+
+
+def test_edited_postings_rewrite_their_skills(store):
+    upsert_postings([_posting(1)])
+    upsert_postings([{**_posting(1), "required_skills": ["docker"]}])
+
+    assert db.session.execute(select(JobSkill.skill_name)).scalars().all() == ["docker"]
+
+
+def test_snapshot_reflects_upserts(store):
+    assert job_store.get_job_store_snapshot() is None
+    upsert_postings([_posting(1), _posting(2)])
+
+    snapshot = job_store.get_job_store_snapshot()
+    assert len(snapshot["live_jobs"]) == 2
+    assert all(job["required_skills"] == ["python", "sql"] for job in snapshot["live_jobs"])
+
+
+class _FakeProcessor:
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def _fetch_adzuna_jobs(self, filters):
+        return self.jobs
+
+
+def _fetched(n: int, **overrides):
+    return {
+        "external_id": f"{n}",
+        "job_title": "Senior Python Developer",
+        "company": "Acme",
+        "location": "Pune",
+        "description": "Design and build python services with sql, docker and aws for our payments team.",
+        "redirect_url": f"https://example.test/{n}",
+        **overrides,
+    }
+
+
+def test_ingestion_drops_near_duplicates_of_stored_postings(store, monkeypatch):
+    # The same posting re-listed under another ID, as agencies do.
+    original = _fetched(1)
+    repost = _fetched(2)
+
+    monkeypatch.setattr(job_ingestion, "get_data_processor", lambda: _FakeProcessor([original]))
+    first = job_ingestion.run_ingestion_cycle(["python"])
+    assert (first["inserted"], first["duplicates_dropped"]) == (1, 0)
+
+    # The stored posting is refreshed; its repost under a new ID is dropped.
+    monkeypatch.setattr(job_ingestion, "get_data_processor", lambda: _FakeProcessor([original, repost]))
+    second = job_ingestion.run_ingestion_cycle(["python"])
+    assert (second["inserted"], second["updated"], second["duplicates_dropped"]) == (0, 1, 1)
+    assert db.session.execute(select(func.count(Job.id))).scalar_one() == 1
+
+
+def test_ingestion_keeps_distinct_postings(store, monkeypatch):
+    jobs = [_fetched(1), _fetched(2, job_title="Data Analyst", description="Build tableau dashboards and excel reports for finance.")]
+    monkeypatch.setattr(job_ingestion, "get_data_processor", lambda: _FakeProcessor(jobs))
+
+    result = job_ingestion.run_ingestion_cycle(["python"])
+    assert (result["inserted"], result["duplicates_dropped"]) == (2, 0)
@@ -0,0 +1,108 @@
+"""Stale-while-revalidate behaviour of the live market snapshot cache."""
+
+from __future__ import annotations
+
+import time
+
+from utils import data_processor
+from utils.market_cache import MarketSnapshotCache
+
+
+def _wait_for(condition, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_loader_result_is_cached_until_ttl():
+    cache = MarketSnapshotCache(ttl_seconds=0.1, stale_seconds=0)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cache.lookup("k", loader) == ({"n": 1}, "miss")
+    assert cache.lookup("k", loader) == ({"n": 1}, "hit")
+    time.sleep(0.15)
+    assert cache.lookup("k", loader) == ({"n": 2}, "miss")
+
+
+def test_empty_loader_result_is_not_cached():
+    cache = MarketSnapshotCache(ttl_seconds=60)
+    assert cache.lookup("k", lambda: None) == (None, "miss")
+    assert cache.lookup("k", lambda: {"n": 1}) == ({"n": 1}, "miss")
+
+
+def test_lru_bound_evicts_oldest():
+    cache = MarketSnapshotCache(max_entries=2, ttl_seconds=60)
+    for key in ("a", "b", "c"):
+        cache.lookup(key, lambda key=key: key)
+    assert cache.get("a") is None
+    assert cache.get("c") == "c"
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_fresh_snapshot_is_served_from_cache(processor, stub):
+    first = processor.get_job_market_data({"query": "python"})
+    second = processor.get_job_market_data({"query": "python"})
+
+    assert first["cache_status"] == "miss"
+    assert second["cache_status"] == "hit"
+    assert second["snapshot_version"] == first["snapshot_version"]
+    assert stub.requests == 1
+
+
+def test_expired_snapshot_is_served_stale_while_refreshing(processor, stub, monkeypatch):
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(ttl_seconds=0.1, stale_seconds=5))
+    processor.get_job_market_data({"query": "python"})
+    time.sleep(0.15)
+
+    started = time.monotonic()
+    stale = processor.get_job_market_data({"query": "python"})
+    elapsed = time.monotonic() - started
+
+    assert stale["cache_status"] == "stale"
+    assert stale["live_jobs"]
+    # Answered without waiting for the 0.2 s stub round trip.
+    assert elapsed < 0.1
+
+    _wait_for(lambda: data_processor._market_cache.get_stats()["refreshes"] == 1)
+    assert stub.requests == 2
+    assert processor.get_job_market_data({"query": "python"})["cache_status"] == "hit"
+
+
+def test_one_background_refresh_per_key(processor, stub, monkeypatch):
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(ttl_seconds=0.1, stale_seconds=5))
+    processor.get_job_market_data({"query": "python"})
+    time.sleep(0.15)
+
+    for _ in range(5):
+        assert processor.get_job_market_data({"query": "python"})["cache_status"] == "stale"
+
+    _wait_for(lambda: data_processor._market_cache.get_stats()["refreshing"] == 0)
+    assert stub.requests == 2
+
+
+def test_stale_snapshot_survives_failed_refresh(processor, stub, monkeypatch):
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(ttl_seconds=0.1, stale_seconds=5))
+    first = processor.get_job_market_data({"query": "python"})
+    time.sleep(0.15)
+
+    stub.fail_status = 503
+    assert processor.get_job_market_data({"query": "python"})["cache_status"] == "stale"
+    _wait_for(lambda: data_processor._market_cache.get_stats()["refresh_failures"] == 1)
+
+    again = processor.get_job_market_data({"query": "python"})
+    assert again["cache_status"] == "stale"
+    assert again["snapshot_version"] == first["snapshot_version"]
+
+
+def test_snapshot_past_stale_window_is_refetched(processor, stub, monkeypatch):
+    monkeypatch.setattr(data_processor, "_market_cache", MarketSnapshotCache(ttl_seconds=0.05, stale_seconds=0.05))
+    processor.get_job_market_data({"query": "python"})
+    time.sleep(0.15)
+
+    assert processor.get_job_market_data({"query": "python"})["cache_status"] == "miss"
+    assert stub.requests == 2
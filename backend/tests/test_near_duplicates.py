@@ -0,0 +1,120 @@
+"""SimHash fingerprints, the banded LSH index and posting dedup."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from utils.near_duplicates import (
+    SimHashIndex, _TOKEN_RE, _token_hash, dedupe_jobs, from_signed64, simhash, simhash_many, to_signed64,
+)
+
+DESCRIPTION = (
+    "We are hiring a senior python developer to design, build and operate backend services for our "
+    "payments platform. You will work with sql databases, docker, kubernetes and aws, review code, "
+    "mentor engineers and own reliability of critical systems end to end."
+)
+
+
+def _reference_simhash(text: str) -> int:
+    weights = [0] * 64
+    for token in _TOKEN_RE.findall(text.lower()):
+        value = _token_hash(token)
+        for bit in range(64):
+            weights[bit] += 1 if (value >> bit) & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def _flip(fingerprint: int, bits) -> int:
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+def _job(title="Senior Python Developer", company="Acme", description=DESCRIPTION, **extra):
+    return {"job_title": title, "company": company, "description": description, **extra}
+
+
+def test_vectorized_simhash_matches_reference():
+    texts = [DESCRIPTION, "Data Analyst excel tableau", "", "c++ c# go go go"]
+    assert simhash_many(texts, chunk_size=3) == [_reference_simhash(t) for t in texts]
+
+
+def test_similar_texts_are_close_and_distinct_texts_far():
+    base = simhash(DESCRIPTION)
+    assert simhash(DESCRIPTION.upper()) == base
+    assert (base ^ simhash(DESCRIPTION + " Apply today!")).bit_count() <= 3
+    assert (base ^ simhash("Registered nurse for night shifts in a city hospital ward.")).bit_count() > 16
+
+
+def test_signed_round_trip():
+    for value in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+        signed = to_signed64(value)
+        assert -(1 << 63) <= signed < (1 << 63)
+        assert from_signed64(signed) == value
+
+
+@pytest.mark.parametrize("max_distance", [0, 1, 3, 5])
+def test_index_finds_exactly_up_to_max_distance(max_distance):
+    rng = random.Random(max_distance)
+    for _ in range(200):
+        base = rng.getrandbits(64)
+        index = SimHashIndex(max_distance)
+        index.add("base", base)
+        within = _flip(base, rng.sample(range(64), max_distance))
+        beyond = _flip(base, rng.sample(range(64), max_distance + 1))
+        assert index.find(within) == "base"
+        assert index.find(beyond) is None
+
+
+def test_index_boundary_with_flips_in_every_band():
+    # One flipped bit per band leaves no band intact: that is max_distance + 1 bits, so no match.
+    index = SimHashIndex(3)
+    index.add("base", 0)
+    edges = [0, 16, 32, 48]
+    assert index.find(_flip(0, edges)) is None
+    assert index.find(_flip(0, edges[:3])) == "base"
+    # All flips inside one band still match through the other three.
+    assert index.find(_flip(0, [1, 2, 3])) == "base"
+
+
+def test_dedupe_keeps_first_of_each_group():
+    jobs = [
+        _job(redirect_url="a"),
+        _job(redirect_url="b", description=DESCRIPTION + " Apply today!"),
+        _job(title="Data Analyst", description="Build tableau dashboards and excel reports for the finance team."),
+        _job(redirect_url="c"),
+    ]
+    kept, dropped = dedupe_jobs(jobs, max_distance=3)
+
+    assert dropped == 2
+    assert kept == [jobs[0], jobs[2]]
+
+
+def test_distinct_postings_survive():
+    jobs = [
+        _job(),
+        _job(title="Frontend Engineer", company="Globex", description="React, typescript and css for a design system."),
+        _job(title="Registered Nurse", company="City Hospital", description="Night shifts on the surgical ward."),
+    ]
+    assert dedupe_jobs(jobs, max_distance=3) == (jobs, 0)
+
+
+def test_threshold_decides_near_duplicates():
+    jobs = [_job(), _job(description=DESCRIPTION + " Apply now.")]
+    gap = (simhash("Senior Python Developer Acme " + DESCRIPTION)
+           ^ simhash("Senior Python Developer Acme " + DESCRIPTION + " Apply now.")).bit_count()
+
+    assert dedupe_jobs(jobs, max_distance=gap)[1] == 1
+    assert dedupe_jobs(jobs, max_distance=gap - 1)[1] == 0
+
+
+def test_negative_distance_disables_dedup():
+    jobs = [_job(), _job()]
+    assert dedupe_jobs(jobs, max_distance=-1) == (jobs, 0)
+
+
+def test_stored_fingerprints_are_reused():
+    jobs = [_job(simhash=5), _job(title="Other", description="unrelated", simhash=5)]
+    assert dedupe_jobs(jobs, max_distance=0)[1] == 1
@@ -0,0 +1,81 @@
+"""Canonical Adzuna queries: alias and order independence, IDF ranking and the repeat-key stats."""
+
+from __future__ import annotations
+
+import itertools
+
+import pytest
+
+from services.query_canonicalizer import QueryKeyStats, canonical_query, query_skills
+from services.role_catalog import get_role_catalog
+from services.skill_vocabulary import SKILLS
+
+
+def _df(name):
+    return len(get_role_catalog().postings.get(SKILLS.id_of(name), ()))
+
+
+@pytest.fixture(autouse=True)
+def canonical(monkeypatch):
+    monkeypatch.delenv("MARKET_QUERY_CANONICAL", raising=False)
+
+
+def test_alias_and_order_variants_map_to_one_query():
+    variants = [
+        ["python", "javascript", "powerbi", "postgresql"],
+        ["Py", "JS", "Power BI", "postgres"],
+        ["  POSTGRES ", "power   bi", "JavaScript", "Python"],
+        ["pgsql", "js", "javascript", "py", "Python", "power bi"],
+    ]
+    queries = {canonical_query(list(order), []) for skills in variants for order in itertools.permutations(skills)}
+    assert len(queries) == 1
+
+
+def test_rare_skills_rank_first():
+    assert _df("aws") < _df("docker") < _df("sql") < _df("python")
+    assert canonical_query(["python", "sql", "docker", "aws"], []) == "aws docker sql"
+
+
+def test_chosen_skills_are_never_more_common_than_dropped_ones():
+    skills = ["python", "sql", "react", "javascript", "machine learning", "statistics", "aws", "azure", "docker"]
+    chosen = query_skills(skills)
+    dropped = set(skills) - set(chosen)
+    assert len(chosen) == 3
+    assert max(_df(s) for s in chosen) <= min(_df(s) for s in dropped)
+
+
+def test_skills_outside_the_catalog_rank_last():
+    assert query_skills(["python", "sql", "docker", "underwater basket weaving"]) == ["docker", "python", "sql"]
+
+
+def test_short_skill_lists_are_kept_whole_and_sorted():
+    assert query_skills(["SQL", "python", "py"]) == ["python", "sql"]
+
+
+def test_interests_and_default_queries():
+    assert canonical_query([], ["Machine Learning", "ml", "ai"]) == "ai machine learning"
+    assert canonical_query([], []) == "software"
+
+
+def test_disabled_canonicalization_keeps_the_first_three_skills(monkeypatch):
+    monkeypatch.setenv("MARKET_QUERY_CANONICAL", "false")
+    assert canonical_query(["python", "sql", "docker", "aws"], []) == "python sql docker"
+    assert canonical_query(["docker", "python", "sql"], []) == "docker python sql"
+
+
+def test_stats_compare_raw_and_canonical_repeat_rates():
+    stats = QueryKeyStats(window=8, log_every=1000)
+    for raw in ("python sql docker", "docker python sql", " Python  SQL docker"):
+        stats.record(raw, "docker python sql")
+
+    result = stats.get_stats()
+    assert result["lookups"] == 3
+    assert result["raw_hits"] == 1 and result["canonical_hits"] == 2
+    assert result["raw_distinct"] == 2 and result["canonical_distinct"] == 1
+
+
+def test_stats_forget_keys_outside_the_window():
+    stats = QueryKeyStats(window=2, log_every=1000)
+    for key in ("a", "b", "c", "a"):
+        stats.record(key, key)
+    assert stats.get_stats()["canonical_hits"] == 0
@@ -0,0 +1,140 @@
+"""Shared token buckets: admission, refunds, sharing across threads and processes, and the Adzuna client."""
+
+from __future__ import annotations
+
+import multiprocessing
+import socket
+import threading
+import time
+
+import pytest
+
+from utils import data_processor
+from utils.rate_limiter import SharedTokenBucket
+
+
+def _remaining(bucket, name="minute"):
+    return bucket.get_stats()["buckets"][name]["remaining"]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "rate_limits.db")
+
+
+def test_admits_up_to_capacity_then_refills(path):
+    bucket = SharedTokenBucket(path, {"minute": (3, 20.0)})
+    assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    time.sleep(0.06)
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    stats = bucket.get_stats()
+    assert stats["admitted"] == 4 and stats["throttled"] == 2
+
+
+def test_every_bucket_must_hold_a_token(path):
+    bucket = SharedTokenBucket(path, {"minute": (5, 0.0), "day": (2, 0.0)})
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+    # A refused call takes nothing from the buckets that still had tokens.
+    assert _remaining(bucket) == 3
+
+
+def test_release_refunds_a_token(path):
+    bucket = SharedTokenBucket(path, {"minute": (2, 0.0), "day": (5, 0.0)})
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    bucket.release()
+    assert _remaining(bucket) == 1 and _remaining(bucket, "day") == 4
+    assert bucket.try_acquire()
+    assert bucket.get_stats()["refunded"] == 1
+
+
+def test_release_never_exceeds_capacity(path):
+    bucket = SharedTokenBucket(path, {"minute": (2, 0.0)})
+    bucket.release()
+    bucket.release()
+    assert _remaining(bucket) == 2
+    assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+def test_threads_sharing_a_bucket_cannot_exceed_it(path):
+    bucket = SharedTokenBucket(path, {"minute": (10, 0.0)})
+    admitted = []
+    lock = threading.Lock()
+
+    def worker():
+        mine = sum(bucket.try_acquire() for _ in range(20))
+        with lock:
+            admitted.append(mine)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(admitted) == 10
+
+
+def test_processes_sharing_a_bucket_cannot_exceed_its_rate(path):
+    capacity, rate, seconds = 5, 20.0, 0.5
+    SharedTokenBucket(path, {"minute": (capacity, rate)})
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+
+    def worker():
+        bucket = SharedTokenBucket(path, {"minute": (capacity, rate)})
+        stop = time.time() + seconds
+        admitted = 0
+        while time.time() < stop:
+            admitted += bucket.try_acquire()
+        results.put(admitted)
+
+    started = time.time()
+    workers = [ctx.Process(target=worker) for _ in range(4)]
+    for process in workers:
+        process.start()
+    counts = [results.get(timeout=10) for _ in workers]
+    elapsed = time.time() - started
+    for process in workers:
+        process.join(10)
+
+    assert all(process.exitcode == 0 for process in workers)
+    assert capacity <= sum(counts) <= capacity + rate * elapsed + 1
+
+
+def test_unusable_store_admits_calls(path):
+    bucket = SharedTokenBucket(path, {"minute": (1, 0.0)})
+    bucket._connect().execute("DROP TABLE buckets")
+
+    assert bucket.try_acquire() and bucket.try_acquire()
+    assert bucket.get_stats()["errors"] == 2
+
+
+@pytest.fixture
+def limiter(processor, monkeypatch, path):
+    bucket = SharedTokenBucket(path, {"minute": (2, 0.0)})
+    monkeypatch.setattr(data_processor, "_adzuna_rate_limiter", bucket)
+    return bucket
+
+
+def test_client_stops_at_the_shared_budget(processor, stub, limiter):
+    for query in ("python", "java"):
+        assert processor._fetch_adzuna_jobs({"query": query})
+    assert processor._fetch_adzuna_jobs({"query": "react"}) is None
+
+    assert stub.requests == 2
+    assert limiter.get_stats()["throttled"] == 1
+
+
+def test_client_refunds_calls_that_cannot_connect(processor, limiter, monkeypatch):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setenv("ADZUNA_BASE_URL", f"http://127.0.0.1:{port}")
+
+    assert processor._fetch_adzuna_jobs({"query": "python"}) is None
+    assert limiter.get_stats()["refunded"] == 1
+    assert _remaining(limiter) == 2
@@ -0,0 +1,98 @@
+"""Single-runner lease shared by worker processes, and the ingestion loop behind it."""
+
+from __future__ import annotations
+
+import contextlib
+import multiprocessing
+import time
+import types
+
+import pytest
+
+from services import job_ingestion
+from utils.shared_lease import SharedLease
+
+# Each worker process is a separate lease owner; forking keeps the test module importable.
+_fork = multiprocessing.get_context("fork")
+
+
+def _try_in_other_process(path, ttl, name="job") -> bool:
+    results = _fork.Queue()
+    process = _fork.Process(target=lambda: results.put(SharedLease(path, name, ttl).try_acquire()))
+    process.start()
+    process.join(10)
+    return results.get(timeout=1)
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "lease.db")
+
+
+def test_holder_renews_its_lease(path):
+    lease = SharedLease(path, "job", ttl_seconds=60)
+    assert lease.try_acquire()
+    assert lease.try_acquire()
+    assert lease.get_stats()["held_by_me"]
+
+
+def test_second_holder_is_refused_until_expiry(path):
+    lease = SharedLease(path, "job", ttl_seconds=0.5)
+    assert lease.try_acquire()
+    assert not _try_in_other_process(path, 0.5)
+
+    time.sleep(0.6)
+    assert _try_in_other_process(path, 60)
+    # The other process now holds it, so the original holder stands by.
+    assert not lease.try_acquire()
+    assert lease.get_stats()["standby"] == 1
+
+
+def test_leases_are_independent_by_name(path):
+    assert SharedLease(path, "job", ttl_seconds=60).try_acquire()
+    assert _try_in_other_process(path, 60) is False
+    assert SharedLease(path, "other", ttl_seconds=60).try_acquire()
+
+
+def test_unreachable_store_fails_closed(path, tmp_path):
+    lease = SharedLease(path, "job", ttl_seconds=60)
+    lease.path = str(tmp_path / "missing" / "lease.db")
+    lease._local.conn = None
+    assert not lease.try_acquire()
+    assert lease.get_stats()["errors"] == 1
+
+
+class _StopLoop(Exception):
+    pass
+
+
+class _App:
+    def app_context(self):
+        return contextlib.nullcontext()
+
+
+def _one_cycle(lease, monkeypatch):
+    def stop(_):
+        raise _StopLoop
+
+    clock = types.SimpleNamespace(sleep=stop, perf_counter=time.perf_counter, time=time.time)
+    monkeypatch.setattr(job_ingestion, "time", clock)
+    with pytest.raises(_StopLoop):
+        job_ingestion._ingest_forever(_App(), 60, lease)
+
+
+def test_ingestion_cycles_run_only_in_the_lease_holder(path, monkeypatch):
+    runs = []
+    monkeypatch.setattr(job_ingestion, "run_ingestion_cycle", lambda: runs.append(1) or {})
+    monkeypatch.setattr(job_ingestion, "_stats", {**job_ingestion._stats, "cycles": 0, "standby_cycles": 0})
+    lease = SharedLease(path, "job_ingestion", ttl_seconds=60)
+
+    assert _try_in_other_process(path, 0.3, name="job_ingestion")
+    _one_cycle(lease, monkeypatch)
+    assert runs == []
+    assert job_ingestion._stats["standby_cycles"] == 1
+
+    time.sleep(0.4)
+    _one_cycle(lease, monkeypatch)
+    assert runs == [1]
+    assert job_ingestion._stats["cycles"] == 1
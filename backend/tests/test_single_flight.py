@@ -0,0 +1,96 @@
+"""Single-flight coalescing, alone and in front of the Adzuna client."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from utils import data_processor
+from utils.single_flight import SingleFlight
+
+
+def _run_concurrently(n, target):
+    threads = [threading.Thread(target=target) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    calls, results = [], []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "value"
+
+    _run_concurrently(6, lambda: results.append(flight.do("k", slow)))
+
+    assert calls == [1]
+    assert results == ["value"] * 6
+    assert flight.get_stats() == {"leaders": 1, "shared": 5, "wait_timeouts": 0, "in_flight": 0}
+
+
+def test_followers_receive_the_leaders_error():
+    flight = SingleFlight()
+    errors = []
+
+    def failing():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    def call():
+        try:
+            flight.do("k", failing)
+        except ValueError as e:
+            errors.append(str(e))
+
+    _run_concurrently(4, call)
+    assert errors == ["boom"] * 4
+
+
+def test_follower_wait_is_bounded():
+    flight = SingleFlight()
+    started = threading.Event()
+
+    def slow():
+        started.set()
+        time.sleep(0.3)
+        return "late"
+
+    leader = threading.Thread(target=lambda: flight.do("k", slow))
+    leader.start()
+    started.wait()
+    with pytest.raises(TimeoutError):
+        flight.do("k", slow, timeout=0.05)
+    leader.join()
+    assert flight.get_stats()["wait_timeouts"] == 1
+
+
+def test_finished_calls_are_not_reused():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == 1
+    assert flight.do("k", lambda: 2) == 2
+
+
+def test_concurrent_identical_requests_share_one_adzuna_call(processor, stub):
+    results = []
+    _run_concurrently(8, lambda: results.append(
+        processor.get_job_market_data({"query": "Python  Developer", "location": "India"})
+    ))
+
+    assert stub.requests == 1
+    assert len({result["snapshot_version"] for result in results}) == 1
+    assert all(result["source"] == "adzuna" and result["live_jobs"] for result in results)
+    assert data_processor._adzuna_flight.get_stats()["shared"] >= 1
+
+
+def test_different_queries_are_not_coalesced(processor, stub):
+    processor.get_job_market_data({"query": "python"})
+    processor.get_job_market_data({"query": "java"})
+
+    assert stub.requests == 2
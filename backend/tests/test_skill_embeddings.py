@@ -0,0 +1,104 @@
+"""Co-occurrence skill embeddings: training, partial credit and the published files."""
+
+from __future__ import annotations
+
+import itertools
+
+import numpy as np
+import pytest
+
+from services.skill_embeddings import (
+    CURRENT_LINK, NAMES_FILE, SkillEmbeddings, _load_embeddings, embeddings_path, save_embeddings, train_embeddings,
+)
+from services.skill_vocabulary import SKILLS
+
+CLUSTERS = [
+    ["python", "django", "flask", "fastapi"],
+    ["excel", "tableau", "powerbi", "statistics"],
+    ["docker", "kubernetes", "aws", "terraform"],
+]
+
+
+def _documents():
+    documents = []
+    for cluster in CLUSTERS:
+        for size in (2, 3):
+            documents.extend(list(pair) for pair in itertools.combinations(cluster, size))
+    return documents
+
+
+@pytest.fixture(scope="module")
+def trained():
+    return train_embeddings(_documents(), dim=4)
+
+
+def _similarity(names, vectors, a, b):
+    return float(vectors[names.index(a)] @ vectors[names.index(b)])
+
+
+def test_vectors_are_unit_length(trained):
+    names, vectors = trained
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (12, 4)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-5)
+
+
+def test_co_occurring_skills_are_more_similar_than_unrelated_ones(trained):
+    names, vectors = trained
+    for cluster, other in zip(CLUSTERS, CLUSTERS[1:] + CLUSTERS[:1]):
+        for a, b in itertools.combinations(cluster, 2):
+            assert _similarity(names, vectors, a, b) > _similarity(names, vectors, a, other[0])
+
+
+def test_partial_credit_rewards_related_skills_only(trained):
+    embeddings = SkillEmbeddings(*reversed(trained))
+    django, flask, tableau = (SKILLS.intern(s) for s in ("django", "flask", "tableau"))
+
+    credit = embeddings.partial_credit([django], len(SKILLS), threshold=0.5, weight=0.5)
+
+    assert credit.shape == (len(SKILLS),)
+    assert credit[django] == 0.0
+    assert 0.0 < credit[flask] <= 0.5
+    assert credit[tableau] == 0.0
+    assert credit.max() <= 0.5
+
+
+def test_owned_skills_get_no_credit(trained):
+    embeddings = SkillEmbeddings(*reversed(trained))
+    owned = [SKILLS.intern(s) for s in CLUSTERS[0]]
+
+    credit = embeddings.partial_credit(owned, len(SKILLS), threshold=0.0, weight=1.0)
+
+    assert not credit[owned].any()
+
+
+def test_partial_credit_is_none_without_embedded_user_skills(trained):
+    embeddings = SkillEmbeddings(*reversed(trained))
+    assert embeddings.partial_credit([SKILLS.intern("sql")], len(SKILLS), threshold=0.5, weight=0.5) is None
+
+
+def test_save_then_load_round_trips(tmp_path, trained):
+    names, vectors = trained
+    save_embeddings(names, vectors, tmp_path)
+
+    loaded = _load_embeddings(str(embeddings_path(tmp_path)))
+
+    assert loaded.names == names
+    assert isinstance(loaded.vectors, np.memmap)
+    np.testing.assert_array_equal(loaded.vectors, vectors)
+    assert loaded.rows[SKILLS.intern("flask")] == names.index("flask")
+
+
+def test_publishing_swaps_names_and_vectors_together(tmp_path, trained):
+    names, vectors = trained
+    first = save_embeddings(names, vectors, tmp_path)
+    second = save_embeddings(names[:3], vectors[:3], tmp_path)
+    third = save_embeddings(names[:2], vectors[:2], tmp_path)
+
+    assert (tmp_path / CURRENT_LINK).resolve() == third.resolve()
+    loaded = _load_embeddings(str(embeddings_path(tmp_path)))
+    assert loaded.names == names[:2] and loaded.vectors.shape == (2, 4)
+    # The two newest versions stay for readers that resolved the link before a swap.
+    assert not first.exists()
+    assert (second / NAMES_FILE).exists()
+    assert not list(tmp_path.glob(".*.tmp"))
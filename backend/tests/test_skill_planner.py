@@ -0,0 +1,91 @@
+"""Greedy next-skill planning over the role catalog, and the /api/skills/next endpoint."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from services.career_matcher import normalize_profile, partial_credit
+from services.role_catalog import get_role_catalog
+from services.skill_planner import plan_next_skills
+from services.skill_vocabulary import SKILLS
+
+PROFILES = [
+    {"skills": ["python", "sql"]},
+    {"skills": ["excel"], "interests": ["data"]},
+    {"skills": ["javascript", "html", "css", "react"]},
+    {"skills": ["docker", "linux"]},
+]
+
+
+def _top_k_sum(skills, k):
+    """Top-k role score sum for ``skills``, recomputed from scratch."""
+    engine = get_role_catalog().engine
+    skill_ids = normalize_profile({"skills": skills})["skill_ids"]
+    owned = engine.encode(skill_ids)
+    partial = partial_credit(skill_ids, engine.n_skills)
+    credit = owned if partial is None else owned + partial[: engine.n_skills]
+    scores = (engine.matrix @ credit) * (100.0 / np.maximum(engine.totals, 1))
+    return float(np.sort(scores)[::-1][:k].sum())
+
+
+@pytest.mark.parametrize("profile", PROFILES)
+def test_each_greedy_pick_raises_the_top_k_score(profile):
+    plan = plan_next_skills(profile, picks=5, top_k=10)
+    picks = [entry["skill"] for entry in plan["next_skills"]]
+    assert picks and len(set(picks)) == len(picks)
+
+    skills = list(profile["skills"])
+    previous = _top_k_sum(skills, 10)
+    for entry in plan["next_skills"]:
+        skills.append(entry["skill"])
+        current = _top_k_sum(skills, 10)
+        assert entry["top_k_gain"] > 0
+        assert current > previous
+        assert current - previous == pytest.approx(entry["top_k_gain"], abs=0.01)
+        previous = current
+
+    before = sum(role["score"] for role in plan["top_roles_before"])
+    after = sum(role["score"] for role in plan["top_roles_after"])
+    assert after > before
+
+
+def test_first_pick_is_the_best_single_skill():
+    profile = PROFILES[0]
+    plan = plan_next_skills(profile, picks=1, top_k=10)
+    base = _top_k_sum(profile["skills"], 10)
+
+    owned = set(normalize_profile(profile)["skill_ids"])
+    candidates = {SKILLS.name(i) for row in get_role_catalog().engine.rows for i in row} - {SKILLS.name(i) for i in owned}
+    best_gain = max(_top_k_sum(profile["skills"] + [skill], 10) - base for skill in candidates)
+
+    assert plan["next_skills"][0]["top_k_gain"] == pytest.approx(best_gain, abs=0.01)
+
+
+def test_endpoint_returns_the_plan(client):
+    response = client.post("/api/skills/next", json={**PROFILES[0], "picks": 2, "top_k": 5})
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["data_source"] == "catalog"
+    assert len(body["next_skills"]) == 2
+    assert len(body["top_roles_before"]) == 5
+
+
+@pytest.mark.parametrize(
+    "kwargs, status",
+    [
+        ({"data": "not json", "content_type": "application/json"}, 400),
+        ({"json": {}}, 400),
+        ({"json": ["python"]}, 400),
+        ({"json": {"skills": ["python"], "picks": "many"}}, 400),
+    ],
+)
+def test_endpoint_rejects_bad_requests(client, kwargs, status):
+    assert client.post("/api/skills/next", **kwargs).status_code == status
+
+
+def test_endpoint_requires_login(flask_app):
+    with flask_app.test_client() as anonymous:
+        response = anonymous.post("/api/skills/next", json=PROFILES[0])
+    assert response.status_code == 302
@@ -3,6 +3,7 @@ Utilities Module for Cognitive Career Recommendation System
 Contains data processing and utility functions
 """
 
-from .data_processor import DataProcessor
+from .data_processor import DataProcessor, get_data_processor
+from .dataset_registry import DatasetRegistry, dataset_registry
 
-__all__ = ['DataProcessor']
\ No newline at end of file
+__all__ = ['DataProcessor', 'get_data_processor', 'DatasetRegistry', 'dataset_registry']
\ No newline at end of file
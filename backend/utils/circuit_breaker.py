@@ -0,0 +1,177 @@
+"""
+Circuit Breaker for Cognitive Career Recommendation System
+Fail-fast guard and latency-derived timeouts for outbound API calls
+"""
+
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict
+
+import numpy as np
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Calls that fail, or succeed slower than ``slow_call_seconds``, count
+    toward ``failure_threshold``; reaching it opens the circuit and
+    ``allow()`` returns False for ``open_seconds``. After that, up to
+    ``half_open_calls`` trial calls are let through at a time: one success
+    closes the circuit, one failure reopens it.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, slow_call_seconds: float = 5.0,
+                 open_seconds: float = 30.0, half_open_calls: int = 1, history: int = 20):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.slow_call_seconds = float(slow_call_seconds)
+        self.open_seconds = float(open_seconds)
+        self.half_open_calls = max(1, int(half_open_calls))
+
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._consecutive_failures = 0
+        self._trials_in_flight = 0
+        self._transitions: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._stats = {
+            'allowed': 0, 'rejected': 0, 'released': 0, 'successes': 0, 'failures': 0, 'slow_calls': 0,
+            'opened': 0, 'half_opened': 0, 'closed': 0,
+        }
+
+    def _transition(self, state: str, reason: str):
+        # Caller holds the lock.
+        self._transitions.append({
+            'from': self._state,
+            'to': state,
+            'reason': reason,
+            'at': datetime.now(timezone.utc).isoformat(),
+        })
+        self._state = state
+        self._stats['opened' if state == OPEN else 'half_opened' if state == HALF_OPEN else 'closed'] += 1
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        if state != HALF_OPEN:
+            self._trials_in_flight = 0
+
+    def allow(self) -> bool:
+        """Return True if a call may proceed; every allowed call must be followed by record_* or release()"""
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+                self._transition(HALF_OPEN, 'open interval elapsed')
+            if self._state == OPEN or (self._state == HALF_OPEN and self._trials_in_flight >= self.half_open_calls):
+                self._stats['rejected'] += 1
+                return False
+            if self._state == HALF_OPEN:
+                self._trials_in_flight += 1
+            self._stats['allowed'] += 1
+            return True
+
+    def release(self):
+        """Hand back an allowed call that was never made, freeing its half-open trial slot"""
+        with self._lock:
+            self._stats['released'] += 1
+            if self._state == HALF_OPEN and self._trials_in_flight > 0:
+                self._trials_in_flight -= 1
+
+    def record_success(self, elapsed: float):
+        if elapsed > self.slow_call_seconds:
+            with self._lock:
+                self._stats['slow_calls'] += 1
+            self.record_failure(f'slow call ({elapsed:.2f}s)')
+            return
+        with self._lock:
+            self._stats['successes'] += 1
+            self._consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._transition(CLOSED, 'trial call succeeded')
+
+    def record_failure(self, reason: str = 'call failed'):
+        with self._lock:
+            self._stats['failures'] += 1
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN:
+                self._transition(OPEN, f'trial call failed: {reason}')
+            elif self._state == CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._transition(OPEN, f'{self._consecutive_failures} consecutive failures, last: {reason}')
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({
+                'name': self.name,
+                'state': self._state,
+                'consecutive_failures': self._consecutive_failures,
+                'failure_threshold': self.failure_threshold,
+                'slow_call_seconds': self.slow_call_seconds,
+                'open_seconds': self.open_seconds,
+                'retry_in_seconds': (
+                    round(max(0.0, self.open_seconds - (time.monotonic() - self._opened_at)), 2)
+                    if self._state == OPEN else 0.0
+                ),
+                'transitions': list(self._transitions),
+            })
+            return stats
+
+
+class AdaptiveTimeout:
+    """
+    Request timeout derived from recently observed latencies.
+
+    The timeout is ``multiplier`` x the ``percentile`` latency over the last
+    ``window`` observed calls, clamped to [min_seconds, max_seconds]. Until
+    ``min_samples`` calls have been seen it stays at ``max_seconds``. Callers
+    observe successful calls and timed-out ones (with the time they waited),
+    so the timeout widens when the API slows down; calls that fail with an
+    error are not observed.
+    """
+
+    def __init__(self, max_seconds: float, min_seconds: float = 1.0, percentile: float = 99.0,
+                 multiplier: float = 2.0, window: int = 200, min_samples: int = 20):
+        self.max_seconds = float(max_seconds)
+        self.min_seconds = min(float(min_seconds), self.max_seconds)
+        self.percentile = float(percentile)
+        self.multiplier = float(multiplier)
+        self.min_samples = max(1, int(min_samples))
+        self._samples: Deque[float] = deque(maxlen=max(1, int(window)))
+        self._lock = threading.Lock()
+
+    def observe(self, elapsed: float):
+        with self._lock:
+            self._samples.append(float(elapsed))
+
+    def current(self) -> float:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return self.max_seconds
+            samples = np.fromiter(self._samples, dtype=np.float64, count=len(self._samples))
+        observed = float(np.percentile(samples, self.percentile)) * self.multiplier
+        return min(self.max_seconds, max(self.min_seconds, observed))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            samples = np.fromiter(self._samples, dtype=np.float64, count=len(self._samples))
+        stats: Dict[str, Any] = {
+            'timeout_seconds': round(self.current(), 3),
+            'min_seconds': self.min_seconds,
+            'max_seconds': self.max_seconds,
+            'samples': int(len(samples)),
+        }
+        if len(samples):
+            p50, p95, p99 = np.percentile(samples, [50, 95, 99])
+            stats['latency_seconds'] = {'p50': round(float(p50), 3), 'p95': round(float(p95), 3), 'p99': round(float(p99), 3)}
+        return stats
+
@@ -6,17 +6,162 @@ Handles job market data, skill taxonomies, and data preprocessing
 import pandas as pd
 import numpy as np
 import json
+import hashlib
 import requests
 from typing import Dict, List, Any, Tuple, Optional
 import sqlite3
 from datetime import datetime, timedelta
+from concurrent.futures import wait
 import os
+import threading
+import time
 from dotenv import load_dotenv
 
+from .circuit_breaker import HALF_OPEN, AdaptiveTimeout, CircuitBreaker
+from .dataset_registry import dataset_registry
+from .disk_cache import DiskCache
+from .job_sources import build_job_sources, fan_in, get_job_source_stats, source_label
+from .rate_limiter import SharedTokenBucket
+from .market_cache import MarketSnapshotCache
+from .single_flight import SingleFlight
+from .http_client import get_http_session, get_fetch_executor
+from .near_duplicates import dedupe_jobs, default_max_distance
+
 
 BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 load_dotenv(os.path.join(BACKEND_DIR, '.env'))
 
+
+def _snapshot_age(snapshot: Dict[str, Any]) -> float:
+    """Seconds since the snapshot's postings were fetched; snapshots read from disk keep their original age"""
+    fetched_at = snapshot.get('fetched_at')
+    return max(0.0, time.time() - fetched_at) if fetched_at else 0.0
+
+
+# Live market snapshots are shared by every DataProcessor in the process.
+_market_cache = MarketSnapshotCache(
+    max_entries=int(os.environ.get('MARKET_CACHE_MAX_ENTRIES', '256')),
+    ttl_seconds=float(os.environ.get('MARKET_CACHE_TTL_SECONDS', '300')),
+    stale_seconds=float(os.environ.get('MARKET_CACHE_STALE_SECONDS', '900')),
+    age_of=_snapshot_age,
+)
+
+# Second level under _market_cache: snapshots persisted in SQLite so restarted
+# or recycled workers, and sibling worker processes, skip the Adzuna round trip.
+# Created on first use; an empty MARKET_DISK_CACHE_PATH disables it.
+_market_disk_cache: Optional[DiskCache] = None
+_market_disk_cache_ready = False
+_shared_store_lock = threading.Lock()
+
+# Outbound Adzuna calls from every worker draw on one shared token budget.
+# Created on first use; an empty ADZUNA_RATE_LIMIT_PATH or zero limits disable it.
+_adzuna_rate_limiter: Optional[SharedTokenBucket] = None
+_adzuna_rate_limiter_ready = False
+
+# Concurrent requests for the same normalized filters share one Adzuna call.
+_adzuna_flight = SingleFlight()
+
+# Adzuna calls fail fast while the API is unhealthy, and wait only as long as
+# its recent latency suggests; ADZUNA_DEADLINE_SECONDS is the upper bound.
+_adzuna_breaker = CircuitBreaker(
+    'adzuna',
+    failure_threshold=int(os.environ.get('ADZUNA_BREAKER_FAILURES', '5')),
+    slow_call_seconds=float(os.environ.get('ADZUNA_BREAKER_SLOW_SECONDS', '5')),
+    open_seconds=float(os.environ.get('ADZUNA_BREAKER_OPEN_SECONDS', '30')),
+    half_open_calls=int(os.environ.get('ADZUNA_BREAKER_HALF_OPEN_CALLS', '1')),
+)
+_adzuna_timeout = AdaptiveTimeout(
+    max_seconds=float(os.environ.get('ADZUNA_DEADLINE_SECONDS', '10')),
+    min_seconds=float(os.environ.get('ADZUNA_TIMEOUT_MIN_SECONDS', '1')),
+    percentile=float(os.environ.get('ADZUNA_TIMEOUT_PERCENTILE', '99')),
+    multiplier=float(os.environ.get('ADZUNA_TIMEOUT_MULTIPLIER', '2')),
+)
+
+_dedup_stats = {'snapshots': 0, 'postings': 0, 'dropped': 0}
+_dedup_lock = threading.Lock()
+
+
+def _market_cache_key(filters: Dict[str, Any]) -> Tuple[str, str, Any, Any]:
+    """Normalize the Adzuna-relevant filters into a hashable cache key"""
+    query = filters.get('query') or filters.get('what') or ''
+    location = filters.get('location') or filters.get('where') or ''
+    return (
+        ' '.join(str(query).lower().split()),
+        ' '.join(str(location).lower().split()),
+        filters.get('results'),
+        filters.get('pages'),
+    )
+
+
+def _get_market_disk_cache() -> Optional[DiskCache]:
+    global _market_disk_cache, _market_disk_cache_ready
+    if not _market_disk_cache_ready:
+        with _shared_store_lock:
+            if not _market_disk_cache_ready:
+                path = os.environ.get('MARKET_DISK_CACHE_PATH', os.path.join(BACKEND_DIR, 'instance', 'market_cache.db'))
+                if path:
+                    try:
+                        _market_disk_cache = DiskCache(
+                            path, retention_seconds=_market_cache.ttl_seconds + _market_cache.stale_seconds
+                        )
+                    except Exception as e:
+                        import logging
+                        logging.getLogger(__name__).warning(f"Market disk cache disabled: {e}")
+                _market_disk_cache_ready = True
+    return _market_disk_cache
+
+
+def _get_adzuna_rate_limiter() -> Optional[SharedTokenBucket]:
+    global _adzuna_rate_limiter, _adzuna_rate_limiter_ready
+    if not _adzuna_rate_limiter_ready:
+        with _shared_store_lock:
+            if not _adzuna_rate_limiter_ready:
+                path = os.environ.get('ADZUNA_RATE_LIMIT_PATH', os.path.join(BACKEND_DIR, 'instance', 'rate_limits.db'))
+                per_minute = float(os.environ.get('ADZUNA_RATE_LIMIT_PER_MINUTE', '25'))
+                per_day = float(os.environ.get('ADZUNA_RATE_LIMIT_PER_DAY', '0'))
+                limits = {}
+                if per_minute > 0:
+                    burst = float(os.environ.get('ADZUNA_RATE_LIMIT_BURST', str(per_minute)))
+                    limits['adzuna_minute'] = (max(1.0, burst), per_minute / 60.0)
+                if per_day > 0:
+                    limits['adzuna_day'] = (per_day, per_day / 86400.0)
+                if path and limits:
+                    try:
+                        _adzuna_rate_limiter = SharedTokenBucket(path, limits)
+                    except Exception as e:
+                        import logging
+                        logging.getLogger(__name__).warning(f"Adzuna rate limiter disabled: {e}")
+                _adzuna_rate_limiter_ready = True
+    return _adzuna_rate_limiter
+
+
+def _make_snapshot(live_jobs: Optional[List[Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+    """
+    Collapse near-duplicate postings and wrap the rest with a content hash so
+    consumers can tell snapshots apart
+    """
+    if not live_jobs:
+        return None
+    live_jobs, dropped = dedupe_jobs(live_jobs)
+    with _dedup_lock:
+        _dedup_stats['snapshots'] += 1
+        _dedup_stats['postings'] += len(live_jobs) + dropped
+        _dedup_stats['dropped'] += dropped
+    digest = hashlib.sha1(json.dumps(live_jobs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return {
+        'live_jobs': live_jobs,
+        'version': digest[:16],
+        'duplicates_dropped': dropped,
+        'source': source_label(live_jobs),
+        'fetched_at': time.time(),
+    }
+
+
+def _read_json(path: str) -> Any:
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class DataProcessor:
     """
     Data processing utilities for job market data and skill taxonomies
@@ -27,6 +172,7 @@ class DataProcessor:
         self.job_data = None
         self.skill_taxonomy = None
         self.salary_data = None
+        self._job_sources = None
         
         # Initialize data
         self._initialize_data()
@@ -34,15 +180,18 @@ class DataProcessor:
     def _initialize_data(self):
         """Initialize or load existing data"""
         try:
-            # Try to load existing data
-            self.job_data = pd.read_csv(os.path.join(self.data_path, 'job_dataset.csv'))
-            with open(os.path.join(self.data_path, 'skill_taxonomy.json'), 'r') as f:
-                self.skill_taxonomy = json.load(f)
-            self.salary_data = pd.read_csv(os.path.join(self.data_path, 'salary_data.csv'))
+            # Parsed files are shared process-wide and only re-read when they change on disk.
+            self.job_data = dataset_registry.load(os.path.join(self.data_path, 'job_dataset.csv'), pd.read_csv)
+            self.skill_taxonomy = dataset_registry.load(os.path.join(self.data_path, 'skill_taxonomy.json'), _read_json)
+            self.salary_data = dataset_registry.load(os.path.join(self.data_path, 'salary_data.csv'), pd.read_csv)
         except FileNotFoundError:
             # Create sample data if files don't exist
             self._create_sample_data()
     
+    def refresh(self):
+        """Pick up any data files that changed on disk since the last load"""
+        self._initialize_data()
+    
     def _create_sample_data(self):
         """Create sample datasets for development and testing"""
         
@@ -268,12 +417,23 @@ class DataProcessor:
         filters = filters or {}
 
         # Use live data only for market snapshot to avoid synthetic listings.
-        live_jobs = self._fetch_adzuna_jobs(filters)
-        if live_jobs:
+        # Repeated queries are answered from the snapshot cache; expired entries
+        # are served while a background refresh replaces them.
+        key = _market_cache_key(filters)
+        snapshot, cache_status = _market_cache.lookup(
+            key,
+            lambda: _adzuna_flight.do(key, lambda: self._load_market_snapshot(key, filters)),
+        )
+        if snapshot:
             return {
-                'source': 'adzuna',
-                'total_jobs': len(live_jobs),
-                'live_jobs': live_jobs
+                # Names the sources that contributed postings, e.g. 'adzuna' or 'csv+sql'.
+                'source': snapshot.get('source') or source_label(snapshot['live_jobs']),
+                'total_jobs': len(snapshot['live_jobs']),
+                'live_jobs': snapshot['live_jobs'],
+                'snapshot_version': snapshot['version'],
+                'duplicates_dropped': snapshot.get('duplicates_dropped', 0),
+                'job_sources': snapshot.get('sources', {}),
+                'cache_status': cache_status
             }
 
         return {
@@ -283,6 +443,44 @@ class DataProcessor:
             'error': 'Live job data unavailable. Please refresh or try again later.'
         }
 
+    def _load_market_snapshot(self, key: Tuple[str, str, Any, Any], filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot for ``key`` from the disk cache when fresh, else from the job sources.
+
+        If the sources return nothing, a disk entry still inside the stale
+        window is used instead, so a restart during an outage keeps live data.
+        """
+        spec, sources = self._configured_job_sources()
+        disk = _get_market_disk_cache()
+        disk_key = json.dumps([spec, *key], default=str)
+        cached = disk.get(disk_key) if disk else None
+        if cached is not None:
+            # Entries written before snapshots carried fetched_at take the disk row's age.
+            cached = ({'fetched_at': time.time() - cached[1], **cached[0]}, cached[1])
+        if cached is not None and cached[1] <= _market_cache.ttl_seconds:
+            return cached[0]
+
+        jobs, report = fan_in(sources, filters)
+        snapshot = _make_snapshot(jobs)
+        if snapshot is not None:
+            snapshot['sources'] = report
+            if disk:
+                disk.set(disk_key, snapshot)
+            return snapshot
+        if cached is not None and cached[1] <= _market_cache.ttl_seconds + _market_cache.stale_seconds:
+            return cached[0]
+        return None
+
+    def _configured_job_sources(self):
+        """
+        (spec, sources) for JOB_SOURCES, a comma-separated list of adzuna, csv,
+        sql and jsonl (default: adzuna); rebuilt only when the setting changes
+        """
+        spec = os.environ.get('JOB_SOURCES', 'adzuna')
+        if self._job_sources is None or self._job_sources[0] != spec:
+            self._job_sources = (spec, build_job_sources(spec, self._fetch_adzuna_jobs))
+        return self._job_sources
+
     def _fetch_adzuna_jobs(self, filters: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         import logging
         logger = logging.getLogger(__name__)
@@ -295,6 +493,9 @@ class DataProcessor:
 
         country = os.environ.get('ADZUNA_COUNTRY', 'in')
         results_per_page = int(os.environ.get('ADZUNA_RESULTS_PER_PAGE', '10'))
+        base_url = os.environ.get('ADZUNA_BASE_URL', 'https://api.adzuna.com/v1/api/jobs').rstrip('/')
+        pages = max(1, int(filters.get('pages') or os.environ.get('ADZUNA_PAGES', '1')))
+        deadline = _adzuna_timeout.current()
 
         query = filters.get('query') or filters.get('what') or ''
         location = filters.get('location') or filters.get('where') or ''
@@ -309,41 +510,141 @@ class DataProcessor:
         if location:
             params['where'] = location
 
-        url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
+        urls = [f"{base_url}/{country}/search/{page}" for page in range(1, pages + 1)]
         
-        logger.info(f"Fetching live jobs from Adzuna: query='{query}', location='{location}'")
+        logger.info(f"Fetching live jobs from Adzuna: query='{query}', location='{location}', pages={pages}")
+
+        if pages == 1:
+            payloads = [self._request_adzuna_page(urls[0], params, deadline)]
+        else:
+            # Fetch all pages concurrently; pages still pending at the deadline are dropped.
+            executor = get_fetch_executor()
+            futures = [executor.submit(self._request_adzuna_page, url, params, deadline) for url in urls]
+            done, not_done = wait(futures, timeout=deadline)
+            for future in not_done:
+                future.cancel()
+            if not_done:
+                logger.warning(f"Adzuna deadline reached with {len(not_done)} of {pages} pages pending")
+            payloads = [future.result() for future in futures if future in done]
+
+        payloads = [payload for payload in payloads if payload is not None]
+        if not payloads:
+            return None
+
+        live_jobs = []
+        seen = set()
+        for payload in payloads:
+            for item in payload.get('results', []):
+                # Adjacent pages can overlap when postings shift between requests.
+                key = item.get('id') or item.get('redirect_url') or id(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                live_jobs.append(self._parse_adzuna_job(item))
 
+        return live_jobs
+
+    def _request_adzuna_page(self, url: str, params: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+        import logging
+        logger = logging.getLogger(__name__)
+
+        # The breaker goes first so an outage does not spend the shared quota on calls it then blocks.
+        if not _adzuna_breaker.allow():
+            logger.info("Adzuna circuit open - using local job data")
+            return None
+        limiter = _get_adzuna_rate_limiter()
+        if limiter and not limiter.try_acquire():
+            # Over the shared quota: callers fall back to cached snapshots or the catalog.
+            _adzuna_breaker.release()
+            logger.info("Adzuna rate budget exhausted - using local job data")
+            return None
+        if _adzuna_breaker.state == HALF_OPEN:
+            # Trial calls get the full deadline so a recovering API is not judged by outage-era timeouts.
+            timeout = _adzuna_timeout.max_seconds
+
+        response = None
+        started = time.monotonic()
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = get_http_session().get(url, params=params, timeout=timeout)
             response.raise_for_status()
             payload = response.json()
+            elapsed = time.monotonic() - started
+            _adzuna_timeout.observe(elapsed)
+            _adzuna_breaker.record_success(elapsed)
             logger.info(f"Adzuna API returned {len(payload.get('results', []))} jobs")
+            return payload
         except requests.exceptions.Timeout:
+            # Timed-out calls count as samples too, so the timeout grows when the API slows down.
+            _adzuna_timeout.observe(time.monotonic() - started)
+            _adzuna_breaker.record_failure(f'timeout after {timeout:.1f}s')
             logger.warning("Adzuna API request timeout - using local job data")
             return None
         except requests.exceptions.HTTPError as e:
-            logger.warning(f"Adzuna API error ({response.status_code}): {e} - using local job data")
+            status = response.status_code
+            if status >= 500 or status in (408, 429):
+                _adzuna_breaker.record_failure(f'HTTP {status}')
+            else:
+                # Client errors mean the API is up; they should not trip the breaker.
+                _adzuna_breaker.record_success(time.monotonic() - started)
+            logger.warning(f"Adzuna API error ({status}): {e} - using local job data")
+            return None
+        except requests.exceptions.ConnectionError as e:
+            # The request did not get through to Adzuna, so its token goes back to the shared budget.
+            if limiter:
+                limiter.release()
+            _adzuna_breaker.record_failure(type(e).__name__)
+            logger.error(f"Adzuna API unreachable: {e} - using local job data")
             return None
         except Exception as e:
+            _adzuna_breaker.record_failure(type(e).__name__)
             logger.error(f"Adzuna API failed: {e} - using local job data")
             return None
 
-        results = payload.get('results', [])
-        live_jobs = []
-        for item in results:
-            live_jobs.append({
-                'job_title': item.get('title', ''),
-                'company': (item.get('company') or {}).get('display_name', ''),
-                'location': (item.get('location') or {}).get('display_name', ''),
-                'salary_min': item.get('salary_min'),
-                'salary_max': item.get('salary_max'),
-                'employment_type': item.get('contract_time') or item.get('contract_type'),
-                'description': item.get('description', ''),
-                'created': item.get('created', ''),
-                'redirect_url': item.get('redirect_url', '')
-            })
+    @staticmethod
+    def _parse_adzuna_job(item: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'external_id': str(item.get('id') or ''),
+            'job_title': item.get('title', ''),
+            'company': (item.get('company') or {}).get('display_name', ''),
+            'location': (item.get('location') or {}).get('display_name', ''),
+            'salary_min': item.get('salary_min'),
+            'salary_max': item.get('salary_max'),
+            'employment_type': item.get('contract_time') or item.get('contract_type'),
+            'description': item.get('description', ''),
+            'created': item.get('created', ''),
+            'redirect_url': item.get('redirect_url', '')
+        }
+    
+    def get_market_cache_stats(self) -> Dict[str, Any]:
+        """Hit, miss and staleness counters for the live market snapshot cache"""
+        return _market_cache.get_stats()
+    
+    def get_market_coalescing_stats(self) -> Dict[str, Any]:
+        """How many Adzuna fetches were shared between concurrent callers"""
+        return _adzuna_flight.get_stats()
 
-        return live_jobs
+    def get_job_source_stats(self) -> Dict[str, Any]:
+        """Per-source fan-in outcomes (ok/empty/timeout/error) and postings returned"""
+        return {'configured': self._configured_job_sources()[0], 'sources': get_job_source_stats()}
+
+    def get_market_disk_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss/write counters for the SQLite snapshot cache shared across workers"""
+        disk = _get_market_disk_cache()
+        return disk.get_stats() if disk else {'enabled': False}
+
+    def get_adzuna_health_stats(self) -> Dict[str, Any]:
+        """Circuit breaker state/transitions, adaptive timeout and shared rate budget for Adzuna"""
+        limiter = _get_adzuna_rate_limiter()
+        return {
+            'breaker': _adzuna_breaker.get_stats(),
+            'timeout': _adzuna_timeout.get_stats(),
+            'rate_limit': limiter.get_stats() if limiter else {'enabled': False},
+        }
+
+    def get_market_dedup_stats(self) -> Dict[str, Any]:
+        """Near-duplicate postings collapsed across all fetched snapshots"""
+        with _dedup_lock:
+            return {**_dedup_stats, 'max_distance': default_max_distance()}
     
     def get_skills_taxonomy(self) -> Dict[str, Any]:
         """
@@ -678,4 +979,27 @@ class DataProcessor:
             'this_month': len(self.job_data),
             'last_month': int(len(self.job_data) * 0.85),  # Simulated
             'growth_rate': 15  # Percentage
-        }
\ No newline at end of file
+        }
+
+
+_shared_processor: Optional[DataProcessor] = None
+_shared_processor_lock = threading.Lock()
+
+
+def get_data_processor() -> DataProcessor:
+    """
+    Return the process-wide DataProcessor, creating it on first use.
+
+    Each call re-checks the data files' mtimes (a few stat calls) so edits on
+    disk are picked up without re-parsing unchanged files.
+    """
+    global _shared_processor
+    processor = _shared_processor
+    if processor is None:
+        with _shared_processor_lock:
+            if _shared_processor is None:
+                _shared_processor = DataProcessor()
+            return _shared_processor
+
+    processor.refresh()
+    return processor
@@ -0,0 +1,68 @@
+"""
+Dataset Registry for Cognitive Career Recommendation System
+Process-wide cache of parsed data files, reloaded when a file's mtime changes
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class DatasetRegistry:
+    """
+    Loads each data file once per process and hands out the parsed object.
+
+    Entries are keyed by absolute path and tagged with the file's mtime; a
+    changed mtime triggers a reload on the next access. Safe to share
+    between gunicorn gthread worker threads.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(path)
+            if lock is None:
+                lock = self._locks[path] = threading.Lock()
+            return lock
+
+    def load(self, path: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Return the parsed contents of ``path``, parsing it with ``loader`` only
+        when it has not been loaded yet or has changed on disk.
+
+        Raises FileNotFoundError when the file does not exist.
+        """
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+
+        # One thread parses while the others wait for its result.
+        with self._lock_for(path):
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == mtime:
+                return entry[1]
+            value = loader(path)
+            self._entries[path] = (mtime, value)
+            return value
+
+    def version(self, path: str) -> Optional[int]:
+        """Return the mtime the cached entry was loaded at, if any."""
+        entry = self._entries.get(os.path.abspath(path))
+        return entry[0] if entry is not None else None
+
+    def invalidate(self, path: Optional[str] = None):
+        """Drop one cached file, or every cached file when ``path`` is None."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(os.path.abspath(path), None)
+
+
+dataset_registry = DatasetRegistry()
@@ -0,0 +1,60 @@
+"""
+Deadline for Cognitive Career Recommendation System
+Per-request latency budget with stage timings and degradation tracking
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Deadline:
+    """
+    Wall-clock budget shared by the stages of one request.
+
+    ``budget_seconds`` of None (or <= 0) means unlimited: ``remaining()``
+    returns None and ``expired()`` is always False, but stage timings are
+    still recorded. Stages that are skipped or cut short call ``degrade()``.
+    """
+
+    def __init__(self, budget_seconds: Optional[float] = None):
+        self.started = time.monotonic()
+        self.budget = budget_seconds if budget_seconds and budget_seconds > 0 else None
+        self.timings: Dict[str, float] = {}
+        self.degraded_stages: List[str] = []
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None when unlimited"""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - (time.monotonic() - self.started))
+
+    def expired(self) -> bool:
+        remaining = self.remaining()
+        return remaining is not None and remaining <= 0
+
+    @property
+    def degraded(self) -> bool:
+        return bool(self.degraded_stages)
+
+    def degrade(self, stage: str):
+        if stage not in self.degraded_stages:
+            self.degraded_stages.append(stage)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block under ``name`` (milliseconds, accumulated)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000.0
+            self.timings[name] = round(self.timings.get(name, 0.0) + elapsed, 3)
+
+    def report(self) -> Dict[str, object]:
+        """Fields merged into API responses"""
+        return {
+            'degraded': self.degraded,
+            'degraded_stages': list(self.degraded_stages),
+            'stage_timings': dict(self.timings),
+        }
@@ -0,0 +1,104 @@
+"""
+Disk Cache for Cognitive Career Recommendation System
+SQLite-backed, zlib-compressed L2 cache shared by every worker process
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Key/value cache in a single SQLite file.
+
+    Values are JSON-encoded and zlib-compressed. The database runs in WAL
+    mode, so readers in other workers never wait on a writer. Each thread
+    keeps its own connection; a lookup is one primary-key read plus
+    decompression. Rows older than ``retention_seconds`` are purged every
+    ``purge_every`` writes.
+    """
+
+    def __init__(self, path: str, retention_seconds: float = 3600.0, purge_every: int = 100):
+        self.path = path
+        self.retention_seconds = float(retention_seconds)
+        self.purge_every = max(1, int(purge_every))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'errors': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, stored_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _count(self, stat: str):
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return ``(value, age_seconds)`` for ``key``, or None when absent or unreadable"""
+        try:
+            row = self._connect().execute(
+                "SELECT value, stored_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._count('misses')
+                return None
+            value = json.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"Disk cache read failed: {e}")
+            return None
+        self._count('hits')
+        return value, max(0.0, time.time() - row[1])
+
+    def set(self, key: str, value: Any):
+        try:
+            blob = zlib.compress(json.dumps(value, separators=(',', ':'), default=str).encode('utf-8'), 6)
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, stored_at) VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            with self._lock:
+                self._stats['writes'] += 1
+                self._writes += 1
+                purge = self._writes % self.purge_every == 0
+            if purge:
+                conn.execute("DELETE FROM cache WHERE stored_at < ?", (time.time() - self.retention_seconds,))
+        except Exception as e:
+            self._count('errors')
+            logger.warning(f"Disk cache write failed: {e}")
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache")
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        try:
+            stats['entries'] = self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        except Exception:
+            stats['entries'] = None
+        stats['path'] = self.path
+        return stats
@@ -0,0 +1,48 @@
+"""
+HTTP Client for Cognitive Career Recommendation System
+Shared keep-alive session and fetch thread pool for outbound API calls
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+_session: Optional[requests.Session] = None
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the process-wide requests session.
+
+    Connections are kept alive and pooled per host, so repeated Adzuna calls
+    skip the TCP/TLS handshake. Pool size comes from HTTP_POOL_SIZE.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                pool_size = int(os.environ.get('HTTP_POOL_SIZE', '10'))
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """Return the shared thread pool used for concurrent outbound fetches"""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                workers = int(os.environ.get('HTTP_FETCH_WORKERS', '8'))
+                _executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='http-fetch')
+    return _executor
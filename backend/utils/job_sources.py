@@ -0,0 +1,383 @@
+"""
+Job Sources for Cognitive Career Recommendation System
+Pluggable posting sources (Adzuna, CSV dataset, SQL jobs table, JSONL feeds) with concurrent fan-in
+"""
+
+import glob
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .dataset_registry import dataset_registry
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+DATA_DIR = os.path.join(BACKEND_DIR, 'data')
+
+# Postings in the shape DataProcessor._parse_adzuna_job produces, plus 'source'
+# and, for sources that already know them, a 'required_skills' list.
+Posting = Dict[str, Any]
+
+# Sources whose postings come from the live job market; the SQL store holds
+# ingested Adzuna postings. CSV rows and offline feeds are not live.
+LIVE_SOURCES = frozenset({'adzuna', 'sql'})
+
+
+def posting_source(posting: Posting) -> str:
+    """Source name of a posting without its feed suffix ('jsonl:partner.jsonl' -> 'jsonl'); untagged postings are Adzuna's"""
+    return str(posting.get('source') or 'adzuna').split(':', 1)[0]
+
+
+def source_label(postings: List[Posting]) -> str:
+    """Sources that contributed ``postings`` in first-seen order, joined with '+' (e.g. 'csv+sql')"""
+    return '+'.join(dict.fromkeys(posting_source(p) for p in postings))
+
+
+def _split_skills(raw: Any) -> List[str]:
+    if isinstance(raw, str):
+        return [s.strip() for s in raw.split(',') if s.strip()]
+    if isinstance(raw, list):
+        return [str(s).strip() for s in raw if str(s).strip()]
+    return []
+
+
+def _search_text(posting: Posting) -> frozenset:
+    parts = [posting.get('job_title', ''), posting.get('description', ''), ' '.join(posting.get('required_skills') or [])]
+    return frozenset(' '.join(str(p) for p in parts).lower().split())
+
+
+class JobSource(ABC):
+    """
+    A place postings come from.
+
+    ``fetch(filters)`` returns normalized postings for the Adzuna-style
+    ``filters`` (query, location, results), or None when the source is
+    unavailable. ``timeout`` bounds how long the fan-in waits for it; None
+    leaves the source to enforce its own deadline.
+    """
+
+    name = 'source'
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout
+
+    @abstractmethod
+    def fetch(self, filters: Dict[str, Any]) -> Optional[List[Posting]]:
+        """Postings matching ``filters``, or None when the source is unavailable"""
+
+
+class LocalJobSource(JobSource):
+    """
+    Source backed by a fixed posting list, searched in memory.
+
+    A posting matches when any query word appears in its title, description
+    or skills; the best ``results`` matches (most query words first) are
+    returned, like a keyword search API would.
+
+    The ``location`` filter is ignored: the matcher always asks for the
+    Adzuna country ('India'), which local datasets need not share, so
+    filtering on it would drop every posting they hold.
+    """
+
+    @abstractmethod
+    def _postings(self) -> List[Tuple[Posting, frozenset]]:
+        """Every posting the source holds, paired with its search words"""
+
+    def fetch(self, filters: Dict[str, Any]) -> Optional[List[Posting]]:
+        indexed = self._postings()
+        if not indexed:
+            return None
+        terms = set(str(filters.get('query') or filters.get('what') or '').lower().split())
+        limit = int(filters.get('results') or os.environ.get('JOB_SOURCE_LOCAL_RESULTS', '30'))
+
+        if not terms:
+            return [posting for posting, _ in indexed[:limit]]
+        scored = [(len(terms & words), i) for i, (_, words) in enumerate(indexed)]
+        best = sorted((s for s in scored if s[0] > 0), key=lambda s: (-s[0], s[1]))[:limit]
+        return [indexed[i][0] for _, i in best]
+
+
+def _text(value: Any) -> str:
+    # Empty CSV cells come back as NaN, which is truthy, so ``or ''`` does not catch them.
+    return '' if value is None or pd.isna(value) else str(value)
+
+
+def _csv_postings(frame: pd.DataFrame) -> List[Tuple[Posting, frozenset]]:
+    postings = []
+    for row in frame.to_dict('records'):
+        posting = {
+            'external_id': f"csv-{row.get('job_id')}",
+            'job_title': _text(row.get('job_title')),
+            'company': _text(row.get('company')),
+            'location': _text(row.get('location')),
+            'salary_min': None if pd.isna(row.get('salary_min')) else row.get('salary_min'),
+            'salary_max': None if pd.isna(row.get('salary_max')) else row.get('salary_max'),
+            'employment_type': _text(row.get('employment_type')),
+            'description': _text(row.get('description')),
+            'created': _text(row.get('posted_date')),
+            'redirect_url': '',
+            'required_skills': _split_skills(row.get('required_skills')),
+            'source': 'csv',
+        }
+        postings.append((posting, _search_text(posting)))
+    return postings
+
+
+class CsvJobSource(LocalJobSource):
+    """The bundled job_dataset.csv (or JOB_SOURCE_CSV_PATH), reloaded when the file changes"""
+
+    name = 'csv'
+
+    def __init__(self, path: str, timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self.path = path
+        self._indexed: Tuple[Optional[pd.DataFrame], List[Tuple[Posting, frozenset]]] = (None, [])
+
+    def _postings(self) -> List[Tuple[Posting, frozenset]]:
+        # Shares the registry's DataFrame with DataProcessor; postings are rebuilt when it is reloaded.
+        frame = dataset_registry.load(self.path, pd.read_csv)
+        if self._indexed[0] is not frame:
+            self._indexed = (frame, _csv_postings(frame))
+        return self._indexed[1]
+
+
+def _load_jsonl_postings(path: str) -> List[Tuple[Posting, frozenset]]:
+    feed = os.path.basename(path)
+    postings = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                logger.warning(f"Skipping malformed line {line_no} in job feed {feed}")
+                continue
+            posting = {
+                'external_id': str(item.get('external_id') or item.get('id') or f'{feed}-{line_no}'),
+                'job_title': item.get('job_title') or item.get('title') or '',
+                'company': item.get('company') or '',
+                'location': item.get('location') or '',
+                'salary_min': item.get('salary_min'),
+                'salary_max': item.get('salary_max'),
+                'employment_type': item.get('employment_type') or '',
+                'description': item.get('description') or '',
+                'created': item.get('created') or item.get('posted_at') or '',
+                'redirect_url': item.get('redirect_url') or '',
+                'source': f'jsonl:{feed}',
+            }
+            if item.get('required_skills') is not None:
+                posting['required_skills'] = _split_skills(item['required_skills'])
+            postings.append((posting, _search_text(posting)))
+    return postings
+
+
+class JsonlJobSource(LocalJobSource):
+    """Every ``*.jsonl`` feed file in a directory, one posting object per line"""
+
+    name = 'jsonl'
+
+    def __init__(self, directory: str, timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self.directory = directory
+
+    def _postings(self) -> List[Tuple[Posting, frozenset]]:
+        postings: List[Tuple[Posting, frozenset]] = []
+        for path in sorted(glob.glob(os.path.join(self.directory, '*.jsonl'))):
+            try:
+                postings.extend(dataset_registry.load(path, _load_jsonl_postings))
+            except OSError as e:
+                logger.warning(f"Job feed {path} unreadable: {e}")
+        return postings
+
+
+_app = None
+
+
+def bind_job_source_app(app):
+    """Give SqlJobSource an application to open contexts on; fetches run on pool threads without one"""
+    global _app
+    _app = app
+
+
+class SqlJobSource(LocalJobSource):
+    """Postings in the SQL jobs table (the job store's recent snapshot)"""
+
+    name = 'sql'
+
+    def _postings(self) -> List[Tuple[Posting, frozenset]]:
+        from flask import has_app_context
+        from services.job_store import get_job_store_snapshot
+
+        if has_app_context():
+            snapshot = get_job_store_snapshot()
+        elif _app is not None:
+            with _app.app_context():
+                snapshot = get_job_store_snapshot()
+        else:
+            logger.debug("SQL job source has no application bound - skipped")
+            return []
+        if not snapshot:
+            return []
+        indexed = snapshot.get('search_index')
+        if indexed is None:
+            # The store snapshot is shared and reused until its TTL, so it is indexed once.
+            indexed = snapshot['search_index'] = [
+                ({**job, 'source': 'sql'}, _search_text(job)) for job in snapshot['live_jobs']
+            ]
+        return indexed
+
+
+class AdzunaJobSource(JobSource):
+    """Live Adzuna search; the fetch callable applies its own deadline, rate limit and circuit breaker"""
+
+    name = 'adzuna'
+
+    def __init__(self, fetch: Callable[[Dict[str, Any]], Optional[List[Posting]]], timeout: Optional[float] = None):
+        super().__init__(timeout)
+        self._fetch = fetch
+
+    def fetch(self, filters: Dict[str, Any]) -> Optional[List[Posting]]:
+        jobs = self._fetch(filters)
+        if jobs is None:
+            return None
+        return [{**job, 'source': 'adzuna'} for job in jobs]
+
+
+def build_job_sources(spec: str, adzuna_fetch: Callable[[Dict[str, Any]], Optional[List[Posting]]]) -> List[JobSource]:
+    """
+    Sources named in ``spec`` (comma-separated: adzuna, csv, sql, jsonl), in order.
+    A name listed twice is used once, since fan-in reports sources by name.
+
+    ``JOB_SOURCE_TIMEOUT_<NAME>`` overrides a source's timeout; local sources
+    default to JOB_SOURCE_TIMEOUT_SECONDS and Adzuna to its own deadline.
+    """
+    local_timeout = float(os.environ.get('JOB_SOURCE_TIMEOUT_SECONDS', '2'))
+
+    def timeout_for(name: str, default: Optional[float]) -> Optional[float]:
+        raw = os.environ.get(f'JOB_SOURCE_TIMEOUT_{name.upper()}')
+        return float(raw) if raw else default
+
+    sources: List[JobSource] = []
+    seen = set()
+    for name in (part.strip().lower() for part in spec.split(',')):
+        if name and name in seen:
+            logger.warning(f"Job source '{name}' listed twice in JOB_SOURCES - using it once")
+            continue
+        seen.add(name)
+        if name == 'adzuna':
+            sources.append(AdzunaJobSource(adzuna_fetch, timeout_for(name, None)))
+        elif name == 'csv':
+            path = os.environ.get('JOB_SOURCE_CSV_PATH', os.path.join(DATA_DIR, 'job_dataset.csv'))
+            sources.append(CsvJobSource(path, timeout_for(name, local_timeout)))
+        elif name == 'sql':
+            sources.append(SqlJobSource(timeout_for(name, local_timeout)))
+        elif name == 'jsonl':
+            directory = os.environ.get('JOB_SOURCE_JSONL_DIR', os.path.join(DATA_DIR, 'feeds'))
+            sources.append(JsonlJobSource(directory, timeout_for(name, local_timeout)))
+        elif name:
+            logger.warning(f"Unknown job source '{name}' in JOB_SOURCES - ignored")
+    return sources
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+
+def _source_executor() -> ThreadPoolExecutor:
+    # Separate from the HTTP fetch pool: the Adzuna source waits on page
+    # fetches in that pool, and sharing it could starve them.
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                workers = int(os.environ.get('JOB_SOURCE_WORKERS', '8'))
+                _executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='job-source')
+    return _executor
+
+
+def _record(name: str, status: str, postings: int = 0):
+    with _stats_lock:
+        stats = _stats.setdefault(name, {'calls': 0, 'ok': 0, 'empty': 0, 'timeout': 0, 'error': 0, 'postings': 0})
+        stats['calls'] += 1
+        stats[status] += 1
+        stats['postings'] += postings
+
+
+def get_job_source_stats() -> Dict[str, Dict[str, int]]:
+    with _stats_lock:
+        return {name: dict(stats) for name, stats in _stats.items()}
+
+
+def fan_in(sources: List[JobSource], filters: Dict[str, Any]) -> Tuple[Optional[List[Posting]], Dict[str, Dict[str, Any]]]:
+    """
+    Query ``sources`` concurrently and concatenate their postings in source order.
+
+    Each source is waited on for at most its own timeout, so total latency
+    is bounded by the slowest source still considered acceptable rather than
+    the sum. Returns (postings or None when no source produced any, report
+    of status/postings/elapsed_ms per source).
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+    if len(sources) == 1 and sources[0].timeout is None:
+        # A single self-limiting source needs no thread hop.
+        source = sources[0]
+        started = time.monotonic()
+        try:
+            jobs = source.fetch(filters)
+            status = 'ok' if jobs else 'empty'
+        except Exception as e:
+            logger.warning(f"Job source {source.name} failed: {e}")
+            jobs, status = None, 'error'
+        _record(source.name, status, len(jobs or []))
+        report[source.name] = {'status': status, 'postings': len(jobs or []), 'elapsed_ms': round((time.monotonic() - started) * 1000.0, 1)}
+        return (jobs or None), report
+
+    started = time.monotonic()
+    futures = {_source_executor().submit(source.fetch, filters): source for source in sources}
+    deadlines = {
+        future: started + source.timeout if source.timeout is not None else None
+        for future, source in futures.items()
+    }
+    results: Dict[JobSource, Optional[List[Posting]]] = {}
+    pending = set(futures)
+    while pending:
+        now = time.monotonic()
+        for future in [f for f in pending if deadlines[f] is not None and deadlines[f] <= now]:
+            # Abandoned, not cancelled: the source may still finish and warm its own caches.
+            pending.discard(future)
+            source = futures[future]
+            _record(source.name, 'timeout')
+            report[source.name] = {'status': 'timeout', 'postings': 0, 'elapsed_ms': round(source.timeout * 1000.0, 1)}
+        if not pending:
+            break
+        limits = [deadlines[f] - now for f in pending if deadlines[f] is not None]
+        done, pending = wait(pending, timeout=min(limits) if limits else None, return_when=FIRST_COMPLETED)
+        for future in done:
+            source = futures[future]
+            elapsed = round((time.monotonic() - started) * 1000.0, 1)
+            try:
+                jobs = future.result()
+                status = 'ok' if jobs else 'empty'
+            except Exception as e:
+                logger.warning(f"Job source {source.name} failed: {e}")
+                jobs, status = None, 'error'
+            results[source] = jobs
+            _record(source.name, status, len(jobs or []))
+            report[source.name] = {'status': status, 'postings': len(jobs or []), 'elapsed_ms': elapsed}
+
+    merged: List[Posting] = []
+    for source in sources:
+        merged.extend(results.get(source) or [])
+    return (merged or None), report
@@ -0,0 +1,152 @@
+"""
+Market Cache for Cognitive Career Recommendation System
+Bounded TTL/LRU caches for job market snapshots with stale-while-revalidate
+"""
+
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire ``ttl_seconds`` after being stored.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def _age(self, stored_at: float) -> float:
+        return time.monotonic() - stored_at
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value if present and not expired, else None"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or self._age(entry[0]) > self.ttl_seconds:
+                self._stats['misses'] += 1
+                return None
+            self._data.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, age: float = 0.0):
+        """Store ``value``; ``age`` backdates it for values that were fetched earlier elsewhere"""
+        with self._lock:
+            self._data[key] = (time.monotonic() - max(0.0, age), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._data)
+        stats['max_entries'] = self.max_entries
+        stats['ttl_seconds'] = self.ttl_seconds
+        return stats
+
+
+class MarketSnapshotCache(TTLCache):
+    """
+    TTL cache that keeps serving an expired snapshot for up to ``stale_seconds``
+    while a background thread fetches a replacement.
+
+    ``age_of`` returns how old a loaded value already is (e.g. one read back
+    from a disk cache), so it expires when its data does rather than a full
+    TTL after it was loaded; without it loaded values count as new.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0, stale_seconds: float = 900.0,
+                 age_of: Optional[Callable[[Any], float]] = None):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.stale_seconds = float(stale_seconds)
+        self.age_of = age_of
+        self._refreshing = set()
+        self._stats.update({'stale_hits': 0, 'refreshes': 0, 'refresh_failures': 0})
+
+    def lookup(self, key: Hashable, loader: Callable[[], Optional[Any]]) -> Tuple[Optional[Any], str]:
+        """
+        Return ``(value, status)`` for ``key``.
+
+        status is 'hit' for a fresh entry, 'stale' for an expired entry that is
+        being refreshed in the background, and 'miss' when ``loader`` had to run
+        inline. A None result from ``loader`` is never cached.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            age = self._age(entry[0]) if entry is not None else None
+
+            if entry is not None and age <= self.ttl_seconds:
+                self._data.move_to_end(key)
+                self._stats['hits'] += 1
+                return entry[1], 'hit'
+
+            if entry is not None and age <= self.ttl_seconds + self.stale_seconds:
+                self._data.move_to_end(key)
+                self._stats['stale_hits'] += 1
+                start_refresh = key not in self._refreshing
+                if start_refresh:
+                    self._refreshing.add(key)
+                value = entry[1]
+            else:
+                self._stats['misses'] += 1
+                start_refresh = False
+                value = None
+
+        if value is not None:
+            if start_refresh:
+                threading.Thread(
+                    target=self._refresh, args=(key, loader),
+                    name='market-cache-refresh', daemon=True,
+                ).start()
+            return value, 'stale'
+
+        value = loader()
+        if value is not None:
+            self._store(key, value)
+        return value, 'miss'
+
+    def _store(self, key: Hashable, value: Any):
+        self.set(key, value, age=self.age_of(value) if self.age_of is not None else 0.0)
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Optional[Any]]):
+        try:
+            value = loader()
+        except Exception as e:
+            value = None
+            logger.warning(f"Background market refresh failed: {e}")
+
+        with self._lock:
+            self._refreshing.discard(key)
+            self._stats['refreshes' if value is not None else 'refresh_failures'] += 1
+
+        # Keep serving the stale snapshot when the refresh comes back empty.
+        if value is not None:
+            self._store(key, value)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats['stale_seconds'] = self.stale_seconds
+        with self._lock:
+            stats['refreshing'] = len(self._refreshing)
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['hits'] + stats['stale_hits']) / lookups, 4) if lookups else 0.0
+        return stats
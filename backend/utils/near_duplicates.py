@@ -0,0 +1,152 @@
+"""
+Near-Duplicate Detection for Cognitive Career Recommendation System
+64-bit SimHash fingerprints with banded LSH lookup for reposted job listings
+"""
+
+import hashlib
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+_BIT_SHIFTS = np.arange(64, dtype=np.uint64)
+
+
+@lru_cache(maxsize=200_000)
+def _token_hash(token: str) -> int:
+    # blake2b rather than hash(): fingerprints are persisted and must not depend on PYTHONHASHSEED.
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def simhash_many(texts: Iterable[str], chunk_size: int = 5000) -> List[int]:
+    """
+    Unsigned 64-bit SimHash of each text over its word tokens.
+
+    Texts differing in a few words land a few bits apart, so Hamming distance
+    approximates textual similarity. Each chunk of texts is reduced to one
+    sparse (texts x tokens) count matrix times a (tokens x 64) +/-1 bit
+    matrix, so tokens shared across postings are hashed once.
+    """
+    texts = list(texts)
+    fingerprints: List[int] = []
+    for start in range(0, len(texts), chunk_size):
+        tokens: List[str] = []
+        indptr = [0]
+        for text in texts[start:start + chunk_size]:
+            tokens.extend(_TOKEN_RE.findall(str(text or '').lower()))
+            indptr.append(len(tokens))
+        vocab = {token: i for i, token in enumerate(dict.fromkeys(tokens))}
+        indices = list(map(vocab.__getitem__, tokens))
+
+        if not vocab:
+            fingerprints.extend([0] * (len(indptr) - 1))
+            continue
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.float32), indices, indptr),
+            shape=(len(indptr) - 1, len(vocab)),
+        )
+        hashes = np.fromiter((_token_hash(t) for t in vocab), dtype=np.uint64, count=len(vocab))
+        signs = ((hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)).astype(np.float32) * 2.0 - 1.0
+        bits = np.asarray(counts @ signs) > 0
+        packed = (bits.astype(np.uint64) << _BIT_SHIFTS).sum(axis=1, dtype=np.uint64)
+        fingerprints.extend(int(value) for value in packed)
+    return fingerprints
+
+
+def simhash(text: str) -> int:
+    return simhash_many([text])[0]
+
+
+def _job_text(job: Dict[str, Any]) -> str:
+    return ' '.join([
+        str(job.get('job_title') or ''),
+        str(job.get('company') or ''),
+        str(job.get('description') or ''),
+    ])
+
+
+def job_fingerprints(jobs: List[Dict[str, Any]]) -> List[int]:
+    """SimHash of each job's title, company and description"""
+    return simhash_many(_job_text(job) for job in jobs)
+
+
+def to_signed64(fingerprint: int) -> int:
+    """Map an unsigned fingerprint into a signed 64-bit database column"""
+    return fingerprint - (1 << 64) if fingerprint >= (1 << 63) else fingerprint
+
+
+def from_signed64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class SimHashIndex:
+    """
+    Finds fingerprints within ``max_distance`` bits of each other.
+
+    The 64 bits are split into ``max_distance + 1`` bands; by pigeonhole, two
+    fingerprints that close agree exactly on at least one band, so a lookup
+    only compares against entries sharing a band value. Inserts and lookups
+    are roughly constant time, keeping dedup linear in the number of postings.
+    """
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        edges = [round(i * 64 / bands) for i in range(bands + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._buckets: List[Dict[int, List[Tuple[int, Hashable]]]] = [{} for _ in self._bands]
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def find(self, fingerprint: int) -> Optional[Hashable]:
+        """Key of a stored near-duplicate of ``fingerprint``, or None"""
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            for other, key in buckets.get((fingerprint >> shift) & mask, ()):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return key
+        return None
+
+    def add(self, key: Hashable, fingerprint: int):
+        for (shift, mask), buckets in zip(self._bands, self._buckets):
+            buckets.setdefault((fingerprint >> shift) & mask, []).append((fingerprint, key))
+        self._size += 1
+
+
+def default_max_distance() -> int:
+    return int(os.environ.get('NEAR_DUPLICATE_MAX_DISTANCE', '3'))
+
+
+def dedupe_jobs(jobs: List[Dict[str, Any]], max_distance: Optional[int] = None) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Drop near-duplicate postings, keeping the first of each group.
+
+    Returns (kept jobs, number dropped). Jobs that already carry a ``simhash``
+    (e.g. from the local job store) are not re-fingerprinted.
+    """
+    if max_distance is None:
+        max_distance = default_max_distance()
+    if max_distance < 0 or len(jobs) < 2:
+        return jobs, 0
+
+    missing = [job for job in jobs if job.get('simhash') is None]
+    computed = iter(job_fingerprints(missing))
+
+    index = SimHashIndex(max_distance)
+    kept = []
+    for position, job in enumerate(jobs):
+        fingerprint = job.get('simhash')
+        if fingerprint is None:
+            fingerprint = next(computed)
+        if index.find(fingerprint) is not None:
+            continue
+        index.add(position, fingerprint)
+        kept.append(job)
+    return kept, len(jobs) - len(kept)
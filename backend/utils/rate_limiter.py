@@ -0,0 +1,136 @@
+"""
+Rate Limiter for Cognitive Career Recommendation System
+Token buckets kept in SQLite so every worker process draws from one budget
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SharedTokenBucket:
+    """
+    One or more token buckets shared through a SQLite file.
+
+    ``limits`` maps a bucket name to ``(capacity, refill_per_second)``. A call
+    is admitted only if every bucket holds a token, and then takes one from
+    each, so a per-minute burst limit and a per-day quota can be enforced
+    together. The refill-and-take runs in a ``BEGIN IMMEDIATE`` transaction,
+    which serializes it across processes without any external service.
+    """
+
+    def __init__(self, path: str, limits: Dict[str, Tuple[float, float]]):
+        self.path = path
+        self.limits = {name: (float(capacity), float(rate)) for name, (capacity, rate) in limits.items()}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'admitted': 0, 'throttled': 0, 'refunded': 0, 'errors': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+        )
+        for name, (capacity, _) in self.limits.items():
+            conn.execute(
+                "INSERT OR IGNORE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                (name, capacity, time.time()),
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _refilled(self, conn: sqlite3.Connection, now: float) -> Dict[str, float]:
+        levels = {}
+        for name, tokens, updated_at in conn.execute("SELECT name, tokens, updated_at FROM buckets"):
+            if name in self.limits:
+                capacity, rate = self.limits[name]
+                levels[name] = min(capacity, tokens + max(0.0, now - updated_at) * rate)
+        for name, (capacity, _) in self.limits.items():
+            levels.setdefault(name, capacity)
+        return levels
+
+    def try_acquire(self) -> bool:
+        """Take one token from every bucket if all have one; never blocks on an empty bucket"""
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                levels = self._refilled(conn, now)
+                admitted = all(tokens >= 1.0 for tokens in levels.values())
+                if admitted:
+                    levels = {name: tokens - 1.0 for name, tokens in levels.items()}
+                conn.executemany(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    [(name, tokens, now) for name, tokens in levels.items()],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            # A broken limiter must not take live data down with it.
+            logger.warning(f"Rate limiter unavailable, admitting call: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return True
+
+        with self._lock:
+            self._stats['admitted' if admitted else 'throttled'] += 1
+        return admitted
+
+    def release(self):
+        """Give back the token of an admitted call that never reached the API, up to each bucket's capacity"""
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                levels = self._refilled(conn, now)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO buckets (name, tokens, updated_at) VALUES (?, ?, ?)",
+                    [(name, min(self.limits[name][0], tokens + 1.0), now) for name, tokens in levels.items()],
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, token not refunded: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return
+
+        with self._lock:
+            self._stats['refunded'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        try:
+            levels = self._refilled(self._connect(), time.time())
+            stats['buckets'] = {
+                name: {
+                    'remaining': round(levels[name], 2),
+                    'capacity': capacity,
+                    'refill_per_second': rate,
+                }
+                for name, (capacity, rate) in self.limits.items()
+            }
+        except Exception as e:
+            stats['buckets'] = {'error': str(e)}
+        stats['path'] = self.path
+        return stats
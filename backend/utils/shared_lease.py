@@ -0,0 +1,97 @@
+"""
+Shared Lease for Cognitive Career Recommendation System
+A named, expiring lease kept in SQLite so one worker process runs a singleton job
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SharedLease:
+    """
+    A renewable lease shared through a SQLite file.
+
+    ``try_acquire`` claims the lease when nobody holds it, when the holder's
+    lease has expired, or when this process already holds it, and extends it
+    by ``ttl_seconds``. The holder renews it on every cycle; if its process
+    dies, another one takes over once the lease expires. The check-and-claim
+    runs in a ``BEGIN IMMEDIATE`` transaction, as in SharedTokenBucket.
+    """
+
+    def __init__(self, path: str, name: str, ttl_seconds: float):
+        self.path = path
+        self.name = name
+        self.ttl_seconds = float(ttl_seconds)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = {'acquired': 0, 'standby': 0, 'errors': 0}
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS leases ("
+            "name TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    @property
+    def owner(self) -> str:
+        # Read per call: a lease created before a fork must not be shared by the children.
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def try_acquire(self) -> bool:
+        """Claim or renew the lease; False while another live process holds it or the store is unreachable"""
+        owner = self.owner
+        try:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+                acquired = row is None or row[0] == owner or row[1] <= now
+                if acquired:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO leases (name, owner, expires_at) VALUES (?, ?, ?)",
+                        (self.name, owner, now + self.ttl_seconds),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        except Exception as e:
+            # Unlike the rate limiter this fails closed: running twice is what the lease prevents.
+            logger.warning(f"Lease {self.name} unavailable, standing by: {e}")
+            with self._lock:
+                self._stats['errors'] += 1
+            return False
+
+        with self._lock:
+            self._stats['acquired' if acquired else 'standby'] += 1
+        return acquired
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        try:
+            row = self._connect().execute(
+                "SELECT owner, expires_at FROM leases WHERE name = ?", (self.name,)
+            ).fetchone()
+            stats['holder'] = row[0] if row else None
+            stats['held_by_me'] = bool(row) and row[0] == self.owner and row[1] > time.time()
+        except Exception as e:
+            stats['holder'] = {'error': str(e)}
+        stats['path'] = self.path
+        return stats
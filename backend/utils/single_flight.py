@@ -0,0 +1,72 @@
+"""
+Single-Flight Coalescing for Cognitive Career Recommendation System
+Lets concurrent callers with the same key share one in-flight call
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Duplicate-call suppression keyed by an arbitrary hashable value.
+
+    The first caller for a key runs the function; callers arriving while it is
+    still running block and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {'leaders': 0, 'shared': 0, 'wait_timeouts': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run ``fn`` once for all concurrent callers of ``key`` and return its result.
+
+        Followers raise TimeoutError if the shared call has not finished within
+        ``timeout`` seconds; the leader always runs ``fn`` to completion.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['leaders'] += 1
+            else:
+                self._stats['shared'] += 1
+
+        if not leader:
+            if not call.event.wait(timeout):
+                with self._lock:
+                    self._stats['wait_timeouts'] += 1
+                raise TimeoutError(f"Timed out waiting for in-flight call {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats['in_flight'] = len(self._calls)
+        return stats
@@ -967,7 +967,7 @@ DashboardModule.updateFilterResultCount = function(filteredMatches, totalMatches
     const safeFilteredJobs = Number.isFinite(filteredJobs) ? filteredJobs : 0;
     const safeTotalJobs = Number.isFinite(totalJobs) ? totalJobs : 0;
 
-    if (safeTotalJobs === 0 && String(liveSource || '').toLowerCase() !== 'adzuna') {
+    if (safeTotalJobs === 0 && !this.isLiveJobSource(liveSource)) {
         counterEl.textContent = `Matches: ${safeFilteredMatches}/${safeTotalMatches} | Live jobs: unavailable`;
         return;
     }
@@ -1671,7 +1671,7 @@ DashboardModule.submitProfileForAnalysis = function(profilePayload, userSkills)
             }
 
             if (data.data_message) {
-                if (data.data_source && data.data_source !== 'adzuna') {
+                if (data.data_source && !this.isLiveJobSource(data.data_source)) {
                     this.setProfileStatus('Live market data unavailable');
                     this.showAlert('warning', data.data_message);
                 } else {
@@ -1716,7 +1716,7 @@ DashboardModule.submitProfileForAnalysis = function(profilePayload, userSkills)
                 this.renderLiveJobs(data.live_jobs, data.data_source || 'adzuna');
                 this.applyFilters();
             } else {
-                if (data.data_source && data.data_source !== 'adzuna') {
+                if (data.data_source && !this.isLiveJobSource(data.data_source)) {
                     this.resetLiveJobsPanel({
                         marketTitle: 'Live Market Snapshot',
                         marketSubtitle: 'Live job data unavailable. Please refresh or try again later.',
@@ -1807,6 +1807,20 @@ DashboardModule.resetLiveJobsPanel = function(options = {}) {
     empty.classList.remove('d-none');
 };
 
+// A market source names the feeds that returned postings ('adzuna', 'csv+sql', ...);
+// 'unavailable', 'local_catalog' and 'none' mean there were none.
+DashboardModule.isLiveJobSource = function(source) {
+    const value = String(source || '').toLowerCase();
+    return value !== '' && value !== 'unavailable' && value !== 'local_catalog' && value !== 'none';
+};
+
+DashboardModule.describeJobSource = function(source) {
+    const value = String(source || '').toLowerCase();
+    return value === 'adzuna'
+        ? 'Real-time job opportunities powered by Adzuna API.'
+        : `Job opportunities from ${value.split('+').join(', ')} postings.`;
+};
+
 DashboardModule.renderLiveJobs = function(jobs, source = 'adzuna', options = {}) {
     const list = document.getElementById('liveJobsList');
     const empty = document.getElementById('liveJobsEmpty');
@@ -1824,20 +1838,20 @@ DashboardModule.renderLiveJobs = function(jobs, source = 'adzuna', options = {})
         title.textContent = sourceValue === 'adzuna' ? 'Live Market Snapshot — India' : 'Live Market Snapshot';
     }
     if (subtitle) {
-        subtitle.textContent = sourceValue === 'adzuna'
-            ? 'Real-time job opportunities powered by Adzuna API.'
+        subtitle.textContent = this.isLiveJobSource(sourceValue)
+            ? this.describeJobSource(sourceValue)
             : 'Live job data unavailable. Please refresh or try again later.';
     }
 
     if (!Array.isArray(jobs) || !jobs.length) {
-        const sourceUnavailable = sourceValue !== 'adzuna';
+        const sourceUnavailable = !this.isLiveJobSource(sourceValue);
         const isFilteredView = options.filtered === true && !sourceUnavailable;
 
         this.resetLiveJobsPanel({
             marketTitle: 'Live Market Snapshot',
             marketSubtitle: sourceUnavailable
                 ? 'Live job data unavailable. Please refresh or try again later.'
-                : 'Real-time job opportunities powered by Adzuna API.',
+                : this.describeJobSource(sourceValue),
             title: isFilteredView ? 'No Jobs Match Current Filters' : 'Live Jobs Unavailable',
             subtitle: isFilteredView
                 ? 'Try broader location, experience, or salary filters.'
@@ -1911,8 +1925,8 @@ DashboardModule.loadLiveJobs = function(recommendations, profilePayload, userSki
                     : 'Live Market Snapshot';
             }
             if (subtitle) {
-                subtitle.textContent = source === 'adzuna'
-                    ? 'Real-time job opportunities powered by Adzuna API'
+                subtitle.textContent = this.isLiveJobSource(source)
+                    ? this.describeJobSource(source)
                     : 'Live job data unavailable. Please refresh or try again later.';
             }
 